@@ -0,0 +1,55 @@
+"""Show that NeoCycle's per-tick cost stays flat as runs get longer.
+
+Accuracy used to be recomputed by rescanning the lineage's whole history every
+tick, which made runs quadratic in num_ticks. The "rescan" column times that
+recount on the same history for comparison.
+
+Run with: python -m benchmarks.accuracy_scaling
+"""
+
+from typing import List
+import argparse
+import time
+
+from src.lio import Lio
+from src.neo import Neo
+from src.neoverse import AlternatingNeoVerse
+from src.simulation import NeoCycle
+
+
+def rescan_accuracy(predictions: List[int], actuals: List[int]) -> float:
+    """The former per-tick accuracy computation (a full rescan of the history)."""
+    correct = sum(1 for i, p in enumerate(predictions) if i < len(actuals) and p == actuals[i])
+    return correct / len(predictions) if predictions else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure NeoCycle per-tick cost against run length")
+    parser.add_argument("--ticks", type=int, nargs="+", default=[10_000, 40_000, 160_000, 640_000],
+                        help="Run lengths to measure")
+    parser.add_argument("--rescan-samples", type=int, default=200,
+                        help="Ticks sampled to estimate the rescan cost at each run length")
+    args = parser.parse_args()
+    
+    print(f"{'ticks':>10}{'run s':>10}{'us/tick':>10}{'rescan us/tick':>16}")
+    for num_ticks in args.ticks:
+        # Enough energy to live through the run without any reward
+        neo = Neo(lio=Lio(n=1), energy=4 * num_ticks + 4)
+        cycle = NeoCycle(neo, AlternatingNeoVerse())
+        start = time.perf_counter()
+        result = cycle.run(num_ticks, enable_offspring=False)
+        elapsed = time.perf_counter() - start
+        
+        # Average rescan cost over ticks spread across the run
+        step = max(1, num_ticks // args.rescan_samples)
+        samples = range(step, num_ticks + 1, step)
+        rescan_start = time.perf_counter()
+        for t in samples:
+            rescan_accuracy(result.predictions[:t], result.actuals[:t])
+        rescan = (time.perf_counter() - rescan_start) / len(samples)
+        
+        print(f"{num_ticks:>10}{elapsed:>10.2f}{elapsed / num_ticks * 1e6:>10.2f}{rescan * 1e6:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Compare memory per Neo and per-tick cost of Lio and CompactLio.
+
+Run with: python -m benchmarks.compact_lio
+"""
+
+from typing import Callable, List
+import argparse
+import copy
+import random
+import time
+import tracemalloc
+
+from src.lio import Lio
+from src.compact import CompactLio
+from src.neo import Neo
+from src.types import Node, NodeType, Lex
+
+
+def build_random_lio(num_nodes: int, num_edges: int, seed: int) -> Lio:
+    """Build a Lio shaped like an evolved one: extra memory/computational nodes and random edges."""
+    rng = random.Random(seed)
+    lio = Lio(n=1)
+    while lio.get_size() < num_nodes:
+        node_type = rng.choice([NodeType.MEMORY, NodeType.COMPUTATIONAL])
+        lio.add_node(Node(node_id=lio.get_next_node_id(), node_type=node_type, value=rng.randint(0, 1)))
+    node_ids = list(lio.nodes)
+    while len(lio.edges) < num_edges:
+        source_id, target_id = rng.choice(node_ids), rng.choice(node_ids)
+        if source_id != target_id and target_id not in lio.outgoing_edges[source_id]:
+            lio.add_edge(source_id, target_id)
+    for node_id, node in lio.nodes.items():
+        if node.node_type in (NodeType.MEMORY, NodeType.COMPUTATIONAL):
+            arity = len(lio.incoming_edges[node_id])
+            if arity:
+                lio.set_lex(node_id, Lex(arity=arity, bits=rng.getrandbits(1 << arity)))
+    return lio
+
+
+def measure_memory(make: Callable[[], object], count: int) -> float:
+    """Bytes allocated per object when count objects are kept alive."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [make() for _ in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def measure_tick(lio, inputs: List[int]) -> float:
+    """Microseconds per tick of receive_input, compute, get_output and update_memory."""
+    start = time.perf_counter()
+    for u_t in inputs:
+        lio.receive_input(u_t)
+        lio.compute()
+        lio.get_output()
+        lio.update_memory()
+    return (time.perf_counter() - start) / len(inputs) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare Lio and CompactLio memory and per-tick cost")
+    parser.add_argument("--neos", type=int, default=2000, help="Neos kept alive for the memory measurement")
+    parser.add_argument("--ticks", type=int, default=20000, help="Ticks for the per-tick measurement")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    inputs = [rng.randint(0, 1) for _ in range(args.ticks)]
+    shapes = [("default (4 nodes)", 4, 3), ("evolved (16 nodes)", 16, 32), ("evolved (64 nodes)", 64, 160)]
+    
+    print(f"{'structure':<22}{'Lio B/Neo':>12}{'Compact B/Neo':>15}{'ratio':>8}"
+          f"{'Lio us/tick':>14}{'Compact us/tick':>17}")
+    for name, num_nodes, num_edges in shapes:
+        template = build_random_lio(num_nodes, num_edges, seed=num_nodes)
+        # A deep copy owns all of its structure (Lio.copy would share edges, adjacency and indexes)
+        lio_bytes = measure_memory(lambda: Neo(lio=copy.deepcopy(template)), args.neos)
+        compact_bytes = measure_memory(lambda: Neo(lio=CompactLio.from_lio(template)), args.neos)
+        lio_tick = measure_tick(template.copy(), inputs)
+        compact_tick = measure_tick(CompactLio.from_lio(template), inputs)
+        print(f"{name:<22}{lio_bytes:>12.0f}{compact_bytes:>15.0f}{lio_bytes / compact_bytes:>7.1f}x"
+              f"{lio_tick:>14.2f}{compact_tick:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
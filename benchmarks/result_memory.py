@@ -0,0 +1,80 @@
+"""Compare the memory held by columnar simulation results with list-based histories.
+
+NeoCycle stores lineage histories in typed arrays, shares inherited prefixes
+with the parent lineage and derives accuracy on demand. The "lists" column
+materializes the same histories the way they used to be stored: one list of
+Python ints/floats per history, with every offspring holding a full copy of
+its inherited prefix.
+
+Run with: python -m benchmarks.result_memory
+"""
+
+from typing import Callable, Tuple
+import argparse
+import gc
+import tracemalloc
+
+from src import compiler, fsm
+from src.evo import Evo
+from src.lio import Lio
+from src.neo import Neo
+from src.neoverse import AlternatingNeoVerse
+from src.simulation import NeoCycle, SimulationResult
+
+
+def retained_bytes(make: Callable[[], object]) -> Tuple[object, int]:
+    """Build an object and return it with the bytes still allocated once it is built."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    obj = make()
+    # Drop caches filled while running so only the result is counted
+    compiler.clear_cache()
+    fsm.clear_cache()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, after - before
+
+
+def run(num_ticks: int, mutation_probability: float) -> SimulationResult:
+    """Run one Neo (with an Evo if mutation_probability > 0) on an alternating NeoVerse."""
+    evo = Evo(mutation_probability=mutation_probability) if mutation_probability > 0 else None
+    neo = Neo(lio=Lio(n=1), evo=evo, energy=4 * num_ticks + 4)
+    return NeoCycle(neo, AlternatingNeoVerse()).run(num_ticks, enable_offspring=True)
+
+
+def as_lists(result: SimulationResult) -> list:
+    """The result's histories as plain lists (the former layout)."""
+    return [
+        [list(lineage.energy_history), list(lineage.accuracy_history), list(lineage.predictions),
+         list(lineage.actuals), list(lineage.rewards), list(lineage.size_history)]
+        for lineage in result.lineages
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare columnar and list-based result memory")
+    parser.add_argument("--ticks", type=int, default=200_000, help="Ticks of the single-lineage run")
+    parser.add_argument("--offspring-ticks", type=int, default=20_000, help="Ticks of the run with offspring")
+    parser.add_argument("--mutation-probability", type=float, default=0.005,
+                        help="Evo mutation probability of the run with offspring")
+    args = parser.parse_args()
+    
+    scenarios = [
+        ("single lineage", args.ticks, 0.0),
+        ("with offspring", args.offspring_ticks, args.mutation_probability),
+    ]
+    
+    print(f"{'run':<16}{'ticks':>9}{'lineages':>10}{'Neo-ticks':>11}{'lists MB':>10}{'columnar MB':>13}{'ratio':>8}")
+    for name, num_ticks, mutation_probability in scenarios:
+        result, columnar = retained_bytes(lambda: run(num_ticks, mutation_probability))
+        lists, listed = retained_bytes(lambda: as_lists(result))
+        neo_ticks = sum(len(lineage.size_history) for lineage in result.lineages)
+        print(f"{name:<16}{num_ticks:>9}{len(result.lineages):>10}{neo_ticks:>11}"
+              f"{listed / 1e6:>10.1f}{columnar / 1e6:>13.1f}{listed / columnar:>7.1f}x")
+        del lists
+
+
+if __name__ == "__main__":
+    main()
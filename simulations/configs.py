@@ -12,9 +12,11 @@ from src.config import (
 )
 from src.global_config import GlobalConfig
 from src.lio import Lio
+from src.factories import register_neo_factory
 from src.types import Node, NodeType, Edge, Lex, MutationType
 
 
+@register_neo_factory("minimal_lio")
 def _create_minimal_lio_structure(lio: Lio) -> Lio:
     """Helper to build minimal Lio structure (3 nodes: input, memory with self-loop, output)."""
     lio.nodes = {}
@@ -22,9 +24,7 @@ def _create_minimal_lio_structure(lio: Lio) -> Lio:
     # Input node
     lio.nodes[0] = Node(node_id=0, node_type=NodeType.INPUT, value=0)
     # Memory node with NOT operation (self-toggling)
-    lex = Lex(arity=1)
-    lex.table[(0,)] = 1  # NOT 0 = 1
-    lex.table[(1,)] = 0  # NOT 1 = 0
+    lex = Lex(arity=1, table={(0,): 1, (1,): 0})  # NOT
     lio.nodes[2] = Node(node_id=2, node_type=NodeType.MEMORY, lex=lex, value=0)
     # Output node
     lio.nodes[1] = Node(node_id=1, node_type=NodeType.OUTPUT, value=0)
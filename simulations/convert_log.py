@@ -0,0 +1,34 @@
+"""Convert JSON logs written by older versions of log_results to binary columnar logs."""
+
+from .run import convert_json_log
+
+
+def main():
+    """Parse command line arguments and convert the logs."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Convert JSON result logs to binary columnar logs (.neolog directories)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m simulations.convert_log logs/20240101_120000_n1_E30_results.json
+  python -m simulations.convert_log logs/*.json --no-compress
+  python -m simulations.convert_log old.json --output converted.neolog
+        """
+    )
+    parser.add_argument('logs', type=str, nargs='+', help='JSON log files to convert')
+    parser.add_argument('--output', '-o', type=str, default=None,
+                        help='Output directory (only with a single input; default: input path with .neolog)')
+    parser.add_argument('--no-compress', action='store_true', help='Write uncompressed (memory-mappable) chunks')
+    args = parser.parse_args()
+    
+    if args.output is not None and len(args.logs) > 1:
+        parser.error("--output can only be used with a single input log")
+    for filepath in args.logs:
+        output_path = convert_json_log(filepath, args.output, compress=not args.no_compress)
+        print(f"Converted {filepath} -> {output_path}")
+
+
+if __name__ == "__main__":
+    main()
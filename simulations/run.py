@@ -5,6 +5,8 @@ from collections import Counter
 import json
 import os
 from datetime import datetime
+
+import numpy as np
 try:
     import matplotlib.pyplot as plt
     from matplotlib.ticker import MaxNLocator
@@ -14,10 +16,17 @@ except ImportError:
     MaxNLocator = None
 
 from src.simulation import SimulationResult, NeoLineage, run_simulations_from_configs
-from src.config import SimulationConfig
+from src.history import MutationLog
+from src.resultlog import ResultLog, write_log
+from src.cache import ResultCache, DEFAULT_CACHE_DIR
+from src.config import SimulationConfig, config_to_dict
 from .configs import get_example_simulation_configs
 
 
+# Suffix of binary log directories written by log_results
+LOG_SUFFIX = ".neolog"
+
+
 def lineage_to_dict(lineage: NeoLineage) -> dict:
     """Convert NeoLineage to a dictionary for JSON serialization."""
     return {
@@ -25,66 +34,63 @@ def lineage_to_dict(lineage: NeoLineage) -> dict:
         "parent_id": lineage.parent_id,
         "birth_tick": lineage.birth_tick,
         "death_tick": lineage.death_tick,
-        "energy_history": lineage.energy_history,
-        "accuracy_history": lineage.accuracy_history,
-        "predictions": lineage.predictions,
-        "actuals": lineage.actuals,
-        "rewards": lineage.rewards,
-        "size_history": lineage.size_history,
-        "mutations_applied": lineage.mutations_applied
+        "energy_history": list(lineage.energy_history),
+        "accuracy_history": list(lineage.accuracy_history),
+        "predictions": list(lineage.predictions),
+        "actuals": list(lineage.actuals),
+        "rewards": list(lineage.rewards),
+        "size_history": list(lineage.size_history),
+        "mutations_applied": [str(m) for m in lineage.mutations_applied]
     }
 
 
 def result_to_dict(result: SimulationResult) -> dict:
     """Convert SimulationResult to a dictionary for JSON serialization."""
     return {
-        "energy_history": result.energy_history,
-        "accuracy_history": result.accuracy_history,
-        "predictions": result.predictions,
-        "actuals": result.actuals,
-        "rewards": result.rewards,
-        "size_history": result.size_history,
-        "mutations_applied": result.mutations_applied,
+        "energy_history": list(result.energy_history),
+        "accuracy_history": list(result.accuracy_history),
+        "predictions": list(result.predictions),
+        "actuals": list(result.actuals),
+        "rewards": list(result.rewards),
+        "size_history": list(result.size_history),
+        "mutations_applied": [str(m) for m in result.mutations_applied],
         "lineages": [lineage_to_dict(l) for l in result.lineages]
     }
 
 
-def config_to_dict(config: SimulationConfig) -> dict:
-    """Convert SimulationConfig to a dictionary for JSON serialization."""
-    config_dict = {
-        "name": config.name,
-        "neo": {
-            "n": config.neo.n,
-            "energy": config.neo.energy,
-            "input_node_id": config.neo.input_node_id,
-            "output_node_id": config.neo.output_node_id,
-            "memory": config.neo.memory
-        },
-        "neoverse": {
-            "neoverse_type": config.neoverse.neoverse_type.value,
-            "seed": config.neoverse.seed
-        },
-        "run_cost": config.run_cost,
-        "num_ticks": config.num_ticks
-    }
-    
-    if config.lio:
-        config_dict["lio"] = {
-            "bit_add_cost": config.lio.bit_add_cost,
-            "bit_remove_cost": config.lio.bit_remove_cost,
-            "edge_add_cost": config.lio.edge_add_cost,
-            "edge_remove_cost": config.lio.edge_remove_cost,
-            "lex_flip_cost": config.lio.lex_flip_cost
-        }
-    else:
-        config_dict["lio"] = None
-    
-    if config.evo:
-        config_dict["evo"] = {}  # EvoConfig is empty now
-    else:
-        config_dict["evo"] = None
-    
-    return config_dict
+def result_from_dict(result_data: dict) -> SimulationResult:
+    """Rebuild a SimulationResult (with its lineages) from result_to_dict's output."""
+    lineages = [
+        NeoLineage(
+            lineage_id=lin_data["lineage_id"],
+            parent_id=lin_data["parent_id"],
+            birth_tick=lin_data["birth_tick"],
+            death_tick=lin_data["death_tick"],
+            energy_history=lin_data["energy_history"],
+            accuracy_history=lin_data["accuracy_history"],
+            predictions=lin_data["predictions"],
+            actuals=lin_data["actuals"],
+            rewards=lin_data["rewards"],
+            size_history=lin_data["size_history"],
+            mutations_applied=MutationLog(lin_data["mutations_applied"])
+        )
+        for lin_data in result_data.get("lineages", [])
+    ]
+    return SimulationResult(
+        energy_history=result_data["energy_history"],
+        accuracy_history=result_data["accuracy_history"],
+        predictions=result_data["predictions"],
+        actuals=result_data["actuals"],
+        rewards=result_data["rewards"],
+        size_history=result_data["size_history"],
+        mutations_applied=MutationLog(result_data["mutations_applied"]),
+        lineages=lineages
+    )
+
+
+def as_mutation_log(mutations) -> MutationLog:
+    """A lineage's mutations_applied as a MutationLog (lists of rendered events are parsed)."""
+    return mutations if isinstance(mutations, MutationLog) else MutationLog(mutations)
 
 
 def generate_filename_from_configs(configs: List[SimulationConfig]) -> str:
@@ -130,18 +136,37 @@ def generate_filename_from_configs(configs: List[SimulationConfig]) -> str:
     return "_".join(parts)
 
 
+def summarize_result(result: SimulationResult) -> dict:
+    """Summary statistics of a result's root lineage (stored alongside the logged histories)."""
+    return {
+        "final_energy": result.energy_history[-1] if result.energy_history else 0,
+        "final_accuracy": result.accuracy_history[-1] if result.accuracy_history else 0.0,
+        "num_ticks_run": len(result.accuracy_history),
+        "total_mutations": len(result.mutations_applied),
+        "max_energy": max(result.energy_history) if result.energy_history else 0,
+        "min_energy": min(result.energy_history) if result.energy_history else 0,
+        "max_accuracy": max(result.accuracy_history) if result.accuracy_history else 0.0,
+        "final_size": result.size_history[-1] if result.size_history else 0
+    }
+
+
 def log_results(results: Dict[str, SimulationResult], configs: List[SimulationConfig], 
-                output_dir: str = "logs") -> str:
+                output_dir: str = "logs", compress: bool = True) -> str:
     """
-    Log simulation results to a JSON file with timestamp-based filename.
+    Log simulation results to a binary columnar log with timestamp-based filename.
+    
+    The log is a directory (see src/resultlog.py): log.json holds the configs
+    and summaries, and each simulation's histories are stored as chunked
+    column arrays that load_results_from_log reads back lazily.
     
     Args:
         results: Dictionary mapping simulation name to SimulationResult
         configs: List of configurations used
         output_dir: Directory to save log files (default: "logs")
+        compress: Compress the column chunks (smaller; uncompressed chunks are memory-mapped)
         
     Returns:
-        Path to the saved log file
+        Path to the saved log directory
     """
     os.makedirs(output_dir, exist_ok=True)
     
@@ -151,70 +176,50 @@ def log_results(results: Dict[str, SimulationResult], configs: List[SimulationCo
     # Generate config-based filename component
     config_prefix = generate_filename_from_configs(configs)
     
-    # Create filename: timestamp_configprefix_results.json
-    filename = f"{timestamp}_{config_prefix}_results.json"
+    # Create filename: timestamp_configprefix_results.neolog
+    filename = f"{timestamp}_{config_prefix}_results{LOG_SUFFIX}"
     filepath = os.path.join(output_dir, filename)
     
-    # Prepare data for logging
-    log_data = {
+    # Prepare metadata for logging
+    metadata = {
         "timestamp": timestamp,
         "config_summary": config_prefix,
         "num_configs": len(configs),
         "configs": [config_to_dict(config) for config in configs],
-        "results": {
-            name: {
-                "config_name": name,
-                "result": result_to_dict(result),
-                "summary": {
-                    "final_energy": result.energy_history[-1] if result.energy_history else 0,
-                    "final_accuracy": result.accuracy_history[-1] if result.accuracy_history else 0.0,
-                    "num_ticks_run": len(result.accuracy_history),
-                    "total_mutations": len(result.mutations_applied),
-                    "max_energy": max(result.energy_history) if result.energy_history else 0,
-                    "min_energy": min(result.energy_history) if result.energy_history else 0,
-                    "max_accuracy": max(result.accuracy_history) if result.accuracy_history else 0.0,
-                    "final_size": result.size_history[-1] if result.size_history else 0
-                }
-            }
-            for name, result in results.items()
-        }
     }
+    summaries = {name: summarize_result(result) for name, result in results.items()}
     
-    # Write to file
-    with open(filepath, 'w') as f:
-        json.dump(log_data, f, indent=2)
-    
+    write_log(filepath, results, metadata, summaries=summaries, compress=compress)
     return filepath
 
 
-def load_results_from_log(filepath: str) -> Tuple[Dict[str, SimulationResult], Dict]:
+def load_results_from_log(filepath: str, lineage_ids: Optional[List[int]] = None,
+                          fields: Optional[List[str]] = None) -> Tuple[Dict[str, SimulationResult], Dict]:
     """
-    Load simulation results from a log file.
+    Load simulation results from a log.
     
     Args:
-        filepath: Path to the JSON log file
+        filepath: Path to a binary log directory (or a JSON log from older versions)
+        lineage_ids: Only load these lineages (binary logs only; default: all)
+        fields: Only load these history fields (binary logs only; default: all)
         
     Returns:
         Tuple of (results_dict, metadata_dict) where:
         - results_dict: Dictionary mapping config name to SimulationResult
         - metadata_dict: Dictionary with timestamp, config_summary, etc.
     """
+    if os.path.isdir(filepath):
+        log = ResultLog(filepath)
+        results = {name: log.load(name, lineage_ids, fields) for name in log.names}
+        return results, log.metadata
+    
     with open(filepath, 'r') as f:
         log_data = json.load(f)
     
     # Reconstruct results
     results = {}
     for name, data in log_data["results"].items():
-        result_data = data["result"]
-        results[name] = SimulationResult(
-            energy_history=result_data["energy_history"],
-            accuracy_history=result_data["accuracy_history"],
-            predictions=result_data["predictions"],
-            actuals=result_data["actuals"],
-            rewards=result_data["rewards"],
-            size_history=result_data["size_history"],
-            mutations_applied=result_data["mutations_applied"]
-        )
+        results[name] = result_from_dict(data["result"])
     
     # Extract metadata
     metadata = {
@@ -227,6 +232,29 @@ def load_results_from_log(filepath: str) -> Tuple[Dict[str, SimulationResult], D
     return results, metadata
 
 
+def convert_json_log(filepath: str, output_path: Optional[str] = None, compress: bool = True) -> str:
+    """
+    Convert a JSON log written by older versions of log_results to a binary log.
+    
+    Args:
+        filepath: Path to the JSON log
+        output_path: Log directory to write (default: the JSON path with .neolog instead of .json)
+        compress: Compress the column chunks
+        
+    Returns:
+        Path to the binary log directory
+    """
+    if output_path is None:
+        output_path = os.path.splitext(filepath)[0] + LOG_SUFFIX
+    with open(filepath, 'r') as f:
+        log_data = json.load(f)
+    results = {name: result_from_dict(data["result"]) for name, data in log_data["results"].items()}
+    summaries = {name: data.get("summary") for name, data in log_data["results"].items()}
+    metadata = {key: value for key, value in log_data.items() if key != "results"}
+    write_log(output_path, results, metadata, summaries=summaries, compress=compress)
+    return output_path
+
+
 def format_label(sim_name: str) -> str:
     """Format simulation name into a cleaner label for plots."""
     # Remove "MinimalNeo_" prefix if present
@@ -432,50 +460,34 @@ def plot_results(results: Dict[str, SimulationResult], configs: Optional[List[Si
                 
                 color = lineage_colors.get(lineage.lineage_id, colors[idx % len(colors)])
                 
-                # Collect mutations for this lineage
-                for mut_str in lineage.mutations_applied:
-                    try:
-                        parts = mut_str.split(':')
-                        tick_str = parts[0].split('=')[1].strip()
-                        absolute_tick = int(tick_str)  # Mutation tick is already absolute
-                        mut_type = parts[1].strip() if len(parts) > 1 else "?"
-                        
-                        # Get energy value at this tick
-                        # For offspring: energy_history[0] is at birth_tick, so we need to calculate the index
-                        if lineage.birth_tick > 0:
-                            # Offspring: energy_history[0] corresponds to birth_tick
-                            # So energy_history[i] corresponds to birth_tick + i
-                            # For mutation at absolute_tick, index = absolute_tick - birth_tick
-                            energy_idx = absolute_tick - lineage.birth_tick
-                            if 0 <= energy_idx < len(lineage.energy_history):
-                                energy_val = lineage.energy_history[energy_idx]
-                            else:
-                                continue
-                        else:
-                            # Root: energy_history[0] is initial energy, energy_history[1] is after tick 0
-                            # So energy_history[i] corresponds to tick i - 1
-                            # For mutation at absolute_tick, index = absolute_tick + 1
-                            energy_idx = absolute_tick + 1
-                            if 0 <= energy_idx < len(lineage.energy_history):
-                                energy_val = lineage.energy_history[energy_idx]
-                            else:
-                                continue
-                        
-                        # Plot mutation marker
-                        plt.scatter(absolute_tick, energy_val, marker='*', s=250, color=color, 
-                                  edgecolors='black', linewidths=2, zorder=5, alpha=0.9, label='_nolegend_')
-                        
-                        # Add annotation
-                        offset_y = 15 if absolute_tick % 2 == 0 else -20
-                        plt.annotate(mut_type, xy=(absolute_tick, energy_val), 
-                                   xytext=(8, offset_y), textcoords='offset points',
-                                   fontsize=7, color='black', alpha=0.9,
-                                   bbox=dict(boxstyle='round,pad=0.4', facecolor='yellow', 
-                                           edgecolor=color, linewidth=1.5, alpha=0.85),
-                                   arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.1',
-                                                 color=color, lw=1.2, alpha=0.6))
-                    except (ValueError, IndexError):
-                        continue
+                # Mutation markers: events whose tick falls inside the plotted history
+                mutations = as_mutation_log(lineage.mutations_applied)
+                mutation_ticks = mutations.ticks.astype(np.int64)
+                if lineage.birth_tick > 0:
+                    # Offspring: energy_history[i] corresponds to birth_tick + i
+                    energy_idx = mutation_ticks - lineage.birth_tick
+                else:
+                    # Root: energy_history[i] corresponds to tick i - 1 (index 0 is the initial energy)
+                    energy_idx = mutation_ticks + 1
+                shown = (energy_idx >= 0) & (energy_idx < len(lineage.energy_history))
+                if not shown.any():
+                    continue
+                marker_ticks = mutation_ticks[shown]
+                marker_values = np.asarray(lineage.energy_history)[energy_idx[shown]]
+                plt.scatter(marker_ticks, marker_values, marker='*', s=250, color=color, 
+                            edgecolors='black', linewidths=2, zorder=5, alpha=0.9, label='_nolegend_')
+                
+                # Annotate each marker with its mutation type
+                for absolute_tick, energy_val, mut_type in zip(marker_ticks.tolist(), marker_values.tolist(),
+                                                              mutations.labels()[shown].tolist()):
+                    offset_y = 15 if absolute_tick % 2 == 0 else -20
+                    plt.annotate(mut_type, xy=(absolute_tick, energy_val), 
+                               xytext=(8, offset_y), textcoords='offset points',
+                               fontsize=7, color='black', alpha=0.9,
+                               bbox=dict(boxstyle='round,pad=0.4', facecolor='yellow', 
+                                       edgecolor=color, linewidth=1.5, alpha=0.85),
+                               arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.1',
+                                             color=color, lw=1.2, alpha=0.6))
         else:
             # No offspring: plot root lineage only
             if len(result.energy_history) > 0:
@@ -490,23 +502,12 @@ def plot_results(results: Dict[str, SimulationResult], configs: Optional[List[Si
                         markevery=markevery, alpha=0.9)
                 
                 # Add mutation markers for root curve (no offspring case)
+                # Root: energy_history[i] corresponds to tick i - 1, so a mutation at tick t is at index t + 1
+                mutations = as_mutation_log(result.mutations_applied)
+                shown = mutations.ticks.astype(np.int64) + 1 < len(result.energy_history)
                 mutation_ticks = {}
-                for mut_str in result.mutations_applied:
-                    try:
-                        parts = mut_str.split(':')
-                        tick_str = parts[0].split('=')[1].strip()
-                        absolute_tick = int(tick_str)  # Mutation tick is already absolute
-                        mut_type = parts[1].strip() if len(parts) > 1 else "?"
-                        # Root: energy_history[0] is initial, energy_history[1] is after tick 0
-                        # So energy_history[i] corresponds to tick i - 1
-                        # For mutation at absolute_tick, index = absolute_tick + 1
-                        energy_idx = absolute_tick + 1
-                        if 0 <= energy_idx < len(result.energy_history):
-                            if absolute_tick not in mutation_ticks:
-                                mutation_ticks[absolute_tick] = []
-                            mutation_ticks[absolute_tick].append(mut_type)
-                    except (ValueError, IndexError):
-                        continue
+                for absolute_tick, mut_type in zip(mutations.ticks[shown].tolist(), mutations.labels()[shown].tolist()):
+                    mutation_ticks.setdefault(absolute_tick, []).append(mut_type)
                 
                 # Plot mutation markers
                 for absolute_tick, mut_types in mutation_ticks.items():
@@ -621,50 +622,34 @@ def plot_results(results: Dict[str, SimulationResult], configs: Optional[List[Si
                 
                 color = lineage_colors.get(lineage.lineage_id, colors[idx % len(colors)])
                 
-                # Collect mutations for this lineage
-                for mut_str in lineage.mutations_applied:
-                    try:
-                        parts = mut_str.split(':')
-                        tick_str = parts[0].split('=')[1].strip()
-                        absolute_tick = int(tick_str)  # Mutation tick is already absolute
-                        mut_type = parts[1].strip() if len(parts) > 1 else "?"
-                        
-                        # Get accuracy value at this tick
-                        # For offspring: accuracy_history[0] is at birth_tick, so we need to calculate the index
-                        if lineage.birth_tick > 0:
-                            # Offspring: accuracy_history[0] corresponds to birth_tick
-                            # So accuracy_history[i] corresponds to birth_tick + i
-                            # For mutation at absolute_tick, index = absolute_tick - birth_tick
-                            acc_idx = absolute_tick - lineage.birth_tick
-                            if 0 <= acc_idx < len(lineage.accuracy_history):
-                                accuracy_val = lineage.accuracy_history[acc_idx]
-                            else:
-                                continue
-                        else:
-                            # Root: accuracy_history[0] corresponds to tick 1
-                            # So accuracy_history[i] corresponds to tick i + 1
-                            # For mutation at absolute_tick, index = absolute_tick - 1
-                            acc_idx = absolute_tick - 1
-                            if 0 <= acc_idx < len(lineage.accuracy_history):
-                                accuracy_val = lineage.accuracy_history[acc_idx]
-                            else:
-                                continue
-                        
-                        # Plot mutation marker
-                        plt.scatter(absolute_tick, accuracy_val, marker='*', s=250, color=color, 
-                                  edgecolors='black', linewidths=2, zorder=5, alpha=0.9, label='_nolegend_')
-                        
-                        # Add annotation
-                        offset_y = 15 if absolute_tick % 2 == 0 else -20
-                        plt.annotate(mut_type, xy=(absolute_tick, accuracy_val), 
-                                   xytext=(8, offset_y), textcoords='offset points',
-                                   fontsize=7, color='black', alpha=0.9,
-                                   bbox=dict(boxstyle='round,pad=0.4', facecolor='yellow', 
-                                           edgecolor=color, linewidth=1.5, alpha=0.85),
-                                   arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.1',
-                                                 color=color, lw=1.2, alpha=0.6))
-                    except (ValueError, IndexError):
-                        continue
+                # Mutation markers: events whose tick falls inside the plotted history
+                mutations = as_mutation_log(lineage.mutations_applied)
+                mutation_ticks = mutations.ticks.astype(np.int64)
+                if lineage.birth_tick > 0:
+                    # Offspring: accuracy_history[i] corresponds to birth_tick + i
+                    acc_idx = mutation_ticks - lineage.birth_tick
+                else:
+                    # Root: accuracy_history[i] corresponds to tick i + 1
+                    acc_idx = mutation_ticks - 1
+                shown = (acc_idx >= 0) & (acc_idx < len(lineage.accuracy_history))
+                if not shown.any():
+                    continue
+                marker_ticks = mutation_ticks[shown]
+                marker_values = np.asarray(lineage.accuracy_history)[acc_idx[shown]]
+                plt.scatter(marker_ticks, marker_values, marker='*', s=250, color=color, 
+                            edgecolors='black', linewidths=2, zorder=5, alpha=0.9, label='_nolegend_')
+                
+                # Annotate each marker with its mutation type
+                for absolute_tick, accuracy_val, mut_type in zip(marker_ticks.tolist(), marker_values.tolist(),
+                                                              mutations.labels()[shown].tolist()):
+                    offset_y = 15 if absolute_tick % 2 == 0 else -20
+                    plt.annotate(mut_type, xy=(absolute_tick, accuracy_val), 
+                               xytext=(8, offset_y), textcoords='offset points',
+                               fontsize=7, color='black', alpha=0.9,
+                               bbox=dict(boxstyle='round,pad=0.4', facecolor='yellow', 
+                                       edgecolor=color, linewidth=1.5, alpha=0.85),
+                               arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.1',
+                                             color=color, lw=1.2, alpha=0.6))
         else:
             # No offspring: plot root lineage only
             if len(result.accuracy_history) > 0:
@@ -679,19 +664,11 @@ def plot_results(results: Dict[str, SimulationResult], configs: Optional[List[Si
                         markevery=markevery, alpha=0.9)
                 
                 # Add mutation markers for root curve (no offspring case)
+                mutations = as_mutation_log(result.mutations_applied)
+                shown = (mutations.ticks >= 1) & (mutations.ticks <= len(result.accuracy_history))
                 mutation_ticks = {}
-                for mut_str in result.mutations_applied:
-                    try:
-                        parts = mut_str.split(':')
-                        tick_str = parts[0].split('=')[1].strip()
-                        tick = int(tick_str)
-                        mut_type = parts[1].strip() if len(parts) > 1 else "?"
-                        if 1 <= tick <= len(result.accuracy_history):
-                            if tick not in mutation_ticks:
-                                mutation_ticks[tick] = []
-                            mutation_ticks[tick].append(mut_type)
-                    except (ValueError, IndexError):
-                        continue
+                for tick, mut_type in zip(mutations.ticks[shown].tolist(), mutations.labels()[shown].tolist()):
+                    mutation_ticks.setdefault(tick, []).append(mut_type)
                 
                 # Plot mutation markers
                 for tick, mut_types in mutation_ticks.items():
@@ -747,7 +724,8 @@ def plot_results(results: Dict[str, SimulationResult], configs: Optional[List[Si
     plt.close()
 
 
-def main(enable_offspring: Optional[bool] = None, config_name: Optional[str] = None):
+def main(enable_offspring: Optional[bool] = None, config_name: Optional[str] = None,
+         workers: Optional[int] = None, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
     """
     Run example simulations.
     
@@ -756,6 +734,9 @@ def main(enable_offspring: Optional[bool] = None, config_name: Optional[str] = N
                          If None, use each config's enable_offspring setting.
         config_name: If provided, only run configs matching this name (case-insensitive partial match).
                      If None, run all configs.
+        workers: If provided, run the configs in this many worker processes.
+        cache_dir: Directory of the result cache (unchanged configs are loaded from it
+                   instead of being simulated again). If None, don't use a cache.
     """
     import sys
     import argparse
@@ -772,6 +753,8 @@ Examples:
   python -m simulations.run --no-offspring            # Disable offspring for all
   python -m simulations.run --config edges_only --offspring  # Run edges_only with offspring
   python -m simulations.run --list                    # List all available configs
+  python -m simulations.run --workers 8               # Run configs in 8 worker processes
+  python -m simulations.run --no-cache                # Simulate every config again
         """
     )
     
@@ -801,6 +784,23 @@ Examples:
         action='store_true',
         help='List all available configuration names and exit'
     )
+    parser.add_argument(
+        '--workers', '-j',
+        type=int,
+        default=None,
+        help='Run configs in this many worker processes (results do not depend on the count)'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help=f'Directory of the result cache (default: {DEFAULT_CACHE_DIR})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Simulate every config instead of loading unchanged ones from the result cache'
+    )
     
     args = parser.parse_args()
     
@@ -824,6 +824,12 @@ Examples:
             enable_offspring = False
     if args.config is not None:
         config_name = args.config
+    if args.workers is not None:
+        workers = args.workers
+    if args.cache_dir is not None:
+        cache_dir = args.cache_dir
+    if args.no_cache:
+        cache_dir = None
     
     print("Running simulations...")
     if enable_offspring is not None:
@@ -860,7 +866,11 @@ Examples:
     for config in configs:
         offspring_status = "with offspring" if config.enable_offspring else "without offspring"
         print(f"  Running {config.name} ({offspring_status})...")
-    results = run_simulations_from_configs(configs)
+    cache = ResultCache(cache_dir) if cache_dir is not None else None
+    if cache is not None:
+        cached = sum(config in cache for config in configs)
+        print(f"  {cached} result(s) loaded from the cache in {cache_dir}")
+    results = run_simulations_from_configs(configs, workers=workers, cache=cache)
     print(f"Completed {len(results)}/{len(configs)} simulations successfully")
     
     # Print summary
@@ -0,0 +1,102 @@
+"""Run a parameter sweep over one of the example configs and print its summary table."""
+
+import json
+
+import numpy as np
+
+from src.sweep import Sweep, Range, DESIGNS, run_sweep, aggregate, format_table
+from src.replicates import run_adaptive
+from .configs import get_example_simulation_configs
+
+
+def parse_value(text: str):
+    """A JSON value (number, null, ...) or, failing that, the text itself."""
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        return text
+
+
+def parse_axis(text: str):
+    """Parse "path=v1,v2,..." (values) or "path=low:high[:log]" (a Range)."""
+    path, sep, spec = text.partition("=")
+    if not sep or not spec:
+        raise ValueError(f"Expected path=values, got {text!r}")
+    if ":" in spec and "," not in spec:
+        low, high, *flags = spec.split(":")
+        return path, Range(parse_value(low), parse_value(high), log="log" in flags)
+    return path, [parse_value(value) for value in spec.split(",")]
+
+
+def main():
+    """Parse command line arguments, run the sweep and print (and optionally save) the table."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Sweep an example config over parameter axes",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m simulations.sweep -c all_mutations_balanced -a lio.bit_add_cost=1,2,3 -a neoverse.seed=1,2,3
+  python -m simulations.sweep -c lex_only -a evo.mutation_probability=0.01:0.5:log -a neo.energy=20:200 \\
+      --design lhs --points 64 --workers 8 --output sweep.npy
+  python -m simulations.sweep -c lex_only -a neo.energy=20,50,100 --adaptive \
+      --tolerance final_accuracy=0.02 --tolerance num_ticks_run=10 --budget 400
+        """
+    )
+    parser.add_argument('--config', '-c', type=str, required=True,
+                        help='Base config (case-insensitive partial match of an example config name)')
+    parser.add_argument('--axis', '-a', type=str, action='append', default=[],
+                        help='Swept field: path=v1,v2,... or path=low:high[:log] (repeatable)')
+    parser.add_argument('--design', '-d', type=str, default="grid", choices=DESIGNS, help='Sweep design')
+    parser.add_argument('--points', '-n', type=int, default=None, help='Number of points (random and lhs designs)')
+    parser.add_argument('--seed', type=int, default=0, help='Seed of the design and of unseeded Evos')
+    parser.add_argument('--ticks', type=int, default=None, help='Override the base config\'s num_ticks')
+    parser.add_argument('--workers', '-j', type=int, default=None, help='Worker processes (default: all cores)')
+    parser.add_argument('--aggregate-over', type=str, default=None,
+                        help='Comma-separated axes to average over (e.g. neoverse.seed)')
+    parser.add_argument('--output', '-o', type=str, default=None, help='Save the summary table as a .npy file')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='Run seed replicates of every point until their confidence intervals are tight')
+    parser.add_argument('--tolerance', type=str, action='append', default=[],
+                        help='Adaptive: largest CI half-width of a metric, metric=value (repeatable)')
+    parser.add_argument('--min-replicates', type=int, default=4, help='Adaptive: replicates before a point can stop')
+    parser.add_argument('--max-replicates', type=int, default=64, help='Adaptive: most replicates of a point')
+    parser.add_argument('--batch', type=int, default=4, help='Adaptive: replicates added to a point per round')
+    parser.add_argument('--budget', type=int, default=None, help='Adaptive: total runs allowed')
+    args = parser.parse_args()
+    
+    matches = [c for c in get_example_simulation_configs() if args.config.lower() in c.name.lower()]
+    if len(matches) != 1:
+        parser.error(f"--config must match exactly one example config (matched {len(matches)})")
+    base = matches[0]
+    if args.ticks is not None:
+        base = base.model_copy(update={"num_ticks": args.ticks})
+    try:
+        axes = dict(parse_axis(axis) for axis in args.axis)
+        sweep = Sweep(base, axes, design=args.design, num_points=args.points, seed=args.seed)
+        tolerances = {metric: float(value) for metric, _, value in
+                      (tolerance.partition("=") for tolerance in args.tolerance)} or None
+    except ValueError as e:
+        parser.error(str(e))
+    
+    print(f"Sweeping {base.name}: {len(sweep)} point(s), {args.design} design")
+    if args.adaptive:
+        try:
+            table = run_adaptive(sweep, tolerances, workers=args.workers, seed=args.seed, progress=True,
+                                 min_replicates=args.min_replicates, max_replicates=args.max_replicates,
+                                 batch=args.batch, budget=args.budget)
+        except ValueError as e:
+            parser.error(str(e))
+    else:
+        table = run_sweep(sweep, workers=args.workers, seed=args.seed, progress=True)
+    if args.output is not None:
+        np.save(args.output, table)
+        print(f"Saved the summary table to {args.output}")
+    if args.aggregate_over and not args.adaptive:
+        table = aggregate(table, over=args.aggregate_over.split(","))
+    print(format_table(table))
+
+
+if __name__ == "__main__":
+    main()
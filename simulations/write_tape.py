@@ -0,0 +1,42 @@
+"""Record a NeoVerse's input stream into a tape file for FileNeoVerse."""
+
+from src.config import NeoVerseConfig, NeoVerseType
+from src.neoverse import write_tape
+
+
+def main():
+    """Parse command line arguments and write the tape."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        description="Record a NeoVerse's inputs into a memory-mappable tape file",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python -m simulations.write_tape random.tape --ticks 1000000 --type random --seed 42
+  python -m simulations.write_tape block.tape --ticks 4096 --type block
+  python -m simulations.write_tape copy.tape --ticks 500 --type file --path random.tape
+        """
+    )
+    parser.add_argument('output', type=str, help='Tape file to write')
+    parser.add_argument('--ticks', '-n', type=int, required=True,
+                        help='Length of the runs the tape is for: ticks + 1 inputs are recorded, since '
+                             'tick t is scored against the input of tick t + 1')
+    parser.add_argument(
+        '--type', '-t',
+        type=str,
+        default=NeoVerseType.RANDOM.value,
+        choices=[t.value for t in NeoVerseType],
+        help='NeoVerse type to record'
+    )
+    parser.add_argument('--seed', type=int, default=None, help='Random seed (for random NeoVerse)')
+    parser.add_argument('--path', type=str, default=None, help='Source tape (for file NeoVerse)')
+    args = parser.parse_args()
+    
+    neoverse = NeoVerseConfig(neoverse_type=args.type, seed=args.seed, path=args.path).create_neoverse()
+    write_tape(neoverse, args.output, args.ticks + 1)
+    print(f"Wrote {args.ticks + 1} ticks of {args.type} NeoVerse to {args.output} (enough for {args.ticks}-tick runs)")
+
+
+if __name__ == "__main__":
+    main()
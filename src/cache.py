@@ -0,0 +1,172 @@
+"""Content-addressed on-disk cache of simulation results, keyed by a hash of the config and the code."""
+
+from typing import Callable, Dict, Iterable, Optional, Union
+import functools
+import glob
+import hashlib
+import inspect
+import json
+import os
+import shutil
+
+from .config import SimulationConfig, NeoVerseType, config_to_dict
+from .factories import factory_name, get_neo_factory
+from .history import SimulationResult
+from .resultlog import RunReader, write_result
+
+
+# Bump when the layout of cache entries changes
+CACHE_VERSION = 1
+
+# Default cache directory (relative to the working directory)
+DEFAULT_CACHE_DIR = os.path.join(".cache", "results")
+
+
+@functools.lru_cache(maxsize=None)
+def code_version() -> str:
+    """Digest of the package's source files, so cached results are recomputed when the code changes."""
+    digest = hashlib.sha256()
+    package = os.path.dirname(os.path.abspath(__file__))
+    for path in sorted(glob.glob(os.path.join(package, "*.py"))):
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _file_digest(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def factory_identity(factory: Optional[Union[Callable, str]]) -> Optional[Dict[str, str]]:
+    """
+    The factory's name and a digest of its source (so editing it invalidates cached results).
+    
+    Raises:
+        ValueError: If the factory can't be named (see factories.factory_name)
+    """
+    if factory is None:
+        return None
+    name = factory_name(factory)
+    function = get_neo_factory(factory) if isinstance(factory, str) else factory
+    try:
+        source = inspect.getsource(function)
+    except (OSError, TypeError):
+        source = ""
+    return {"name": name, "source": hashlib.sha256(source.encode()).hexdigest()}
+
+
+def is_deterministic(config: SimulationConfig) -> bool:
+    """Whether the config always gives the same result (its inputs and mutations are seeded)."""
+    if config.neoverse.neoverse_type == NeoVerseType.RANDOM and config.neoverse.seed is None:
+        return False
+    # An Evo without a seed (its own or the NeoVerse's) draws one from the global random module
+    return config.evo is None or config.evo.seed is not None or config.neoverse.seed is not None
+
+
+def config_hash(config: SimulationConfig, salt: Optional[str] = None) -> str:
+    """
+    Canonical hash of everything a config's result depends on.
+    
+    Covers every field of the config except its name (config_to_dict), the
+    neo_factory's identity, the contents of a file NeoVerse's tape, a salt
+    (default: code_version()) and CACHE_VERSION.
+    
+    Raises:
+        ValueError: If the config's neo_factory can't be named
+    """
+    data = config_to_dict(config)
+    del data["name"]
+    data["neo_factory"] = factory_identity(config.neo_factory)
+    if config.neoverse.neoverse_type == NeoVerseType.FILE and config.neoverse.path is not None:
+        data["neoverse"]["tape"] = _file_digest(config.neoverse.path)
+    payload = {
+        "config": data,
+        "salt": salt if salt is not None else code_version(),
+        "version": CACHE_VERSION,
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    On-disk cache of SimulationResults, one write_result directory per config hash.
+    
+    Entries are stored uncompressed, so load() only reads the index up front and
+    memory-maps the histories as they are read. Configs that aren't deterministic
+    (see is_deterministic) or whose neo_factory can't be named are never cached.
+    """
+    
+    def __init__(self, directory: str = DEFAULT_CACHE_DIR, salt: Optional[str] = None):
+        """
+        Initialize the cache.
+        
+        Args:
+            directory: Cache directory (created when the first result is stored)
+            salt: Code-version salt of the keys (default: code_version())
+        """
+        self.directory = directory
+        self.salt = salt
+    
+    def key(self, config: SimulationConfig) -> Optional[str]:
+        """The config's cache key, or None if its result can't be cached."""
+        if not is_deterministic(config):
+            return None
+        try:
+            return config_hash(config, self.salt)
+        except ValueError:
+            return None
+    
+    def path(self, key: str) -> str:
+        """Directory of a cache entry."""
+        return os.path.join(self.directory, key[:2], key)
+    
+    def _entry(self, config: SimulationConfig) -> Optional[str]:
+        """Directory of the config's cache entry, or None if there is none."""
+        key = self.key(config)
+        if key is None or not os.path.exists(os.path.join(self.path(key), "index.json")):
+            return None
+        return self.path(key)
+    
+    def __contains__(self, config: SimulationConfig) -> bool:
+        return self._entry(config) is not None
+    
+    def load(self, config: SimulationConfig, fields: Optional[Iterable[str]] = None) -> Optional[SimulationResult]:
+        """The cached result of a config (loaded lazily), or None on a miss."""
+        entry = self._entry(config)
+        return RunReader(entry).result(fields=fields) if entry is not None else None
+    
+    def store(self, config: SimulationConfig, result: SimulationResult) -> bool:
+        """
+        Cache a config's result.
+        
+        The entry is written to a temporary directory and renamed into place, so
+        concurrent writers and interrupted runs never leave a partial entry.
+        
+        Returns:
+            True if the result was stored (False if the config can't be cached)
+        """
+        key = self.key(config)
+        if key is None:
+            return False
+        path = self.path(key)
+        if os.path.exists(os.path.join(path, "index.json")):
+            return True
+        temporary = f"{path}.tmp-{os.getpid()}"
+        shutil.rmtree(temporary, ignore_errors=True)
+        write_result(result, temporary, compress=False)
+        try:
+            os.replace(temporary, path)
+        except OSError:
+            # Another process stored the same entry first
+            shutil.rmtree(temporary, ignore_errors=True)
+        return True
+    
+    def clear(self):
+        """Remove every cached result."""
+        shutil.rmtree(self.directory, ignore_errors=True)
@@ -0,0 +1,222 @@
+"""CompactLio: Array-backed Lio storage with CSR-encoded incoming edges."""
+
+from typing import Dict, List, Optional, Sequence
+from array import array
+
+import numpy as np
+
+from .types import Node, NodeType, Edge, Lex, MutationType
+from .lio import Lio
+
+
+_NODE_TYPES = list(NodeType)
+_TYPE_CODE = {node_type: code for code, node_type in enumerate(_NODE_TYPES)}
+_MEMORY = _TYPE_CODE[NodeType.MEMORY]
+_COMPUTATIONAL = _TYPE_CODE[NodeType.COMPUTATIONAL]
+_OUTPUT = _TYPE_CODE[NodeType.OUTPUT]
+
+
+class CompactLio:
+    """
+    A Lio stored as flat columns instead of pydantic objects.
+    
+    Nodes are laid out in evaluation (topological) order: position p holds the
+    node's ID, type code, value and the index of its Lex (-1 for none). Lexes are
+    stored as (arity, bits) columns. Incoming edges are CSR-encoded: the sources of
+    the node at position p are in_sources[in_offsets[p]:in_offsets[p + 1]], in
+    incoming-edge order, and edge_rank records each edge's index in the original
+    edge list so it can be restored.
+    
+    CompactLio implements the part of the Lio interface NeoCycle uses to run a Neo
+    (receive_input, compute, get_output, update_memory, compute_sequence,
+    get_size), so Neos without an Evo can be stored compactly. Node and Edge
+    models are built on demand as detached views; use to_lio() to get a mutable
+    Lio back.
+    """
+    
+    __slots__ = (
+        "n", "memory", "input_node_id", "output_node_id", "costs",
+        "node_ids", "node_types", "values", "lex_index", "lex_arity", "lex_bits",
+        "in_offsets", "in_sources", "edge_rank", "dict_order", "memory_positions",
+        "_input", "_output",
+    )
+    
+    def __init__(self, lio: Lio):
+        """
+        Pack a Lio into columns.
+        
+        Args:
+            lio: Lio to pack (not modified; costs are shared, not copied)
+        """
+        plan = lio._get_plan()
+        index = plan.index
+        edge_position = {}
+        for i, edge in enumerate(lio.edges):
+            edge_position.setdefault((edge.source_id, edge.target_id), []).append(i)
+        
+        self.n = lio.n
+        self.memory = bytearray(lio.memory)
+        self.input_node_id = lio.input_node_id
+        self.output_node_id = lio.output_node_id
+        self.costs = lio.costs
+        
+        self.node_ids = array('i', plan.order)
+        self.node_types = array('b', (_TYPE_CODE[node.node_type] for node in plan.nodes))
+        self.values = bytearray(node.value for node in plan.nodes)
+        self.lex_index = array('i')
+        self.lex_arity = array('b')
+        self.lex_bits: List[int] = []
+        self.in_offsets = array('i', [0])
+        self.in_sources = array('i')
+        self.edge_rank = array('i')
+        
+        used = {}
+        for node_id, node in zip(plan.order, plan.nodes):
+            if node.lex is None:
+                self.lex_index.append(-1)
+            else:
+                self.lex_index.append(len(self.lex_bits))
+                self.lex_arity.append(node.lex.arity)
+                self.lex_bits.append(node.lex.bits)
+            for source_id in lio.incoming_edges.get(node_id, []):
+                # Duplicate edges map to their original positions in order
+                key = (source_id, node_id)
+                k = used.get(key, 0)
+                used[key] = k + 1
+                self.in_sources.append(index[source_id])
+                self.edge_rank.append(edge_position[key][k])
+            self.in_offsets.append(len(self.in_sources))
+        
+        self.dict_order = array('i', (index[node_id] for node_id in lio.nodes))
+        self.memory_positions = array('i', (
+            p for p in self.dict_order if self.node_types[p] == _MEMORY
+        ))
+        self._input = index.get(lio.input_node_id, -1)
+        self._output = index.get(lio.output_node_id, -1)
+    
+    @classmethod
+    def from_lio(cls, lio: Lio) -> 'CompactLio':
+        """Pack a Lio into a CompactLio."""
+        return cls(lio)
+    
+    def to_lio(self) -> Lio:
+        """Unpack into a regular (mutable) Lio with the same structure and state."""
+        return Lio(
+            n=self.n,
+            memory=list(self.memory),
+            nodes=self.nodes,
+            edges=self.edges,
+            input_node_id=self.input_node_id,
+            output_node_id=self.output_node_id,
+            costs=dict(self.costs)
+        )
+    
+    # ----- Views -----
+    
+    def node(self, node_id: int) -> Node:
+        """Build a Node view of one node (changes to it are not written back)."""
+        return self._node_at(self.node_ids.index(node_id))
+    
+    def _node_at(self, p: int) -> Node:
+        k = self.lex_index[p]
+        return Node(
+            node_id=self.node_ids[p],
+            node_type=_NODE_TYPES[self.node_types[p]],
+            value=self.values[p],
+            lex=Lex(arity=self.lex_arity[k], bits=self.lex_bits[k]) if k >= 0 else None
+        )
+    
+    @property
+    def nodes(self) -> Dict[int, Node]:
+        """Node views keyed by node ID, in the original node order."""
+        nodes = {}
+        for p in self.dict_order:
+            node = self._node_at(p)
+            nodes[node.node_id] = node
+        return nodes
+    
+    @property
+    def edges(self) -> List[Edge]:
+        """Edge views in the original edge order."""
+        edges: List[Optional[Edge]] = [None] * len(self.in_sources)
+        node_ids = self.node_ids
+        for p in range(len(node_ids)):
+            for i in range(self.in_offsets[p], self.in_offsets[p + 1]):
+                edges[self.edge_rank[i]] = Edge(source_id=node_ids[self.in_sources[i]], target_id=node_ids[p])
+        return edges
+    
+    # ----- Lio interface used by NeoCycle -----
+    
+    def receive_input(self, u_t: int):
+        """Receive perceptual input from NeoVerse."""
+        if self._input >= 0:
+            self.values[self._input] = u_t
+    
+    def compute(self):
+        """Perform one computation step using snapshot semantics (see Lio.compute)."""
+        values = self.values
+        snapshot = bytes(values)
+        types = self.node_types
+        offsets = self.in_offsets
+        sources = self.in_sources
+        lex_index = self.lex_index
+        
+        for p in range(len(values)):
+            node_type = types[p]
+            if node_type == _OUTPUT:
+                # Copy the current (already computed) value of the first source
+                start = offsets[p]
+                if start < offsets[p + 1]:
+                    values[p] = values[sources[start]]
+            elif node_type == _COMPUTATIONAL or node_type == _MEMORY:
+                k = lex_index[p]
+                if k < 0:
+                    continue
+                start, end = offsets[p], offsets[p + 1]
+                if start == end and node_type == _MEMORY:
+                    # A memory node without inputs feeds back its own value
+                    if self.lex_arity[k] == 1:
+                        values[p] = (self.lex_bits[k] >> snapshot[p]) & 1
+                    continue
+                if end - start != self.lex_arity[k]:
+                    continue
+                index = 0
+                for i in range(start, end):
+                    index = (index << 1) | snapshot[sources[i]]
+                values[p] = (self.lex_bits[k] >> index) & 1
+        
+        # Update memory nodes after computation (only if they don't have lex)
+        for p in self.memory_positions:
+            if lex_index[p] < 0 and offsets[p] < offsets[p + 1]:
+                values[p] = values[sources[offsets[p]]]
+    
+    def get_output(self) -> int:
+        """Get the current output prediction."""
+        return self.values[self._output] if self._output >= 0 else 0
+    
+    def update_memory(self):
+        """Update memory bits from memory nodes."""
+        for i, p in enumerate(self.memory_positions[:self.n]):
+            if i < len(self.memory):
+                self.memory[i] = self.values[p]
+    
+    def compute_sequence(self, inputs: Sequence[int]) -> np.ndarray:
+        """Receive and compute each input in turn and return the outputs (see Lio.compute_sequence)."""
+        outputs = np.empty(len(inputs), dtype=np.int8)
+        for t, u_t in enumerate(np.asarray(inputs, dtype=np.int8).tolist()):
+            self.receive_input(u_t)
+            self.compute()
+            outputs[t] = self.get_output()
+            self.update_memory()
+        return outputs
+    
+    def sync_nodes(self):
+        """No-op: a CompactLio's values are always current (Lio interface)."""
+    
+    def get_size(self) -> int:
+        """Get the number of nodes."""
+        return len(self.node_ids)
+    
+    def get_mutation_cost(self, mutation_type: MutationType) -> int:
+        """Get the cost for a mutation type."""
+        return self.costs.get(mutation_type, 0)
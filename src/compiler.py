@@ -0,0 +1,133 @@
+"""Compiler that turns a Lio's evaluation plan into a specialized Python step function."""
+
+from typing import Callable, Dict, List, Optional, Tuple
+from collections import OrderedDict
+
+from .types import Node
+from .lio import EvaluationPlan, _eval_lex
+
+
+# Maximum number of compiled step functions kept in the cache
+MAX_CACHE_SIZE = 4096
+
+# Ticks a new structure is interpreted before it is compiled. Compiling costs about
+# as much as a few dozen interpreted ticks, and most mutated structures are
+# replaced again quickly, so only structures that survive get compiled.
+COMPILE_AFTER_TICKS = 16
+
+_cache: 'OrderedDict[Tuple, Callable[[List[Node]], None]]' = OrderedDict()
+
+
+def structure_key(plan: EvaluationPlan) -> Tuple:
+    """
+    Structural key of a plan: everything the generated code depends on.
+    
+    Two Lios with equal keys (e.g. a parent and an unmutated offspring) can share
+    one compiled step function, since node objects are passed in at call time.
+    """
+    steps = []
+    for handler, target, arg in plan.steps:
+        if handler is _eval_lex:
+            lex, sources = arg
+            steps.append((target, sources, lex.arity, lex.bits))
+        else:
+            steps.append((target, arg))
+    return (len(plan.nodes), tuple(steps), tuple(plan.memory_copies))
+
+
+def generate_source(plan: EvaluationPlan, name: str = "step") -> str:
+    """
+    Generate the source of a step function for the plan.
+    
+    The function takes the plan's node list, reads the snapshot values it needs
+    into locals, evaluates every lex with its truth table inlined as an integer
+    literal and writes back only the nodes the plan updates.
+    """
+    num_nodes = len(plan.nodes)
+    # Expression holding each node's current value during the pass
+    current = [f"v{j}" for j in range(num_nodes)]
+    body: List[str] = []
+    used = set()
+    written = []
+    
+    for handler, target, arg in plan.steps:
+        if handler is _eval_lex:
+            lex, sources = arg
+            arity = lex.arity
+            if lex.bits == 0:
+                expr = "0"
+            elif lex.bits == (1 << lex.size) - 1:
+                expr = "1"
+            else:
+                terms = []
+                for j, source in enumerate(sources):
+                    used.add(source)
+                    shift = arity - 1 - j
+                    terms.append(f"(v{source} << {shift})" if shift else f"v{source}")
+                expr = f"({lex.bits} >> ({' | '.join(terms)})) & 1"
+            body.append(f"    c{target} = {expr}")
+            current[target] = f"c{target}"
+        else:
+            # Output nodes copy the current value of their source
+            if current[arg] == f"v{arg}":
+                used.add(arg)
+            current[target] = current[arg]
+        written.append(target)
+    
+    for target, source in plan.memory_copies:
+        if current[source] == f"v{source}":
+            used.add(source)
+        current[target] = current[source]
+        written.append(target)
+    
+    lines = [f"def {name}(nodes):"]
+    if num_nodes:
+        lines.append(f"    {', '.join(f'n{j}' for j in range(num_nodes))}{',' if num_nodes == 1 else ''} = nodes")
+    for j in sorted(used):
+        lines.append(f"    v{j} = n{j}.value")
+    lines.extend(body)
+    for target in dict.fromkeys(written):
+        lines.append(f"    n{target}.value = {current[target]}")
+    if len(lines) == 1 or (num_nodes and len(lines) == 2):
+        lines.append("    pass")
+    return "\n".join(lines) + "\n"
+
+
+def lookup_step(plan: EvaluationPlan) -> Optional[Callable[[List[Node]], None]]:
+    """Return the cached step function for the plan's structure, or None if it isn't compiled yet."""
+    key = structure_key(plan)
+    step = _cache.get(key)
+    if step is not None:
+        _cache.move_to_end(key)
+    return step
+
+
+def compile_plan(plan: EvaluationPlan) -> Callable[[List[Node]], None]:
+    """
+    Return a compiled step function for the plan, reusing a cached one if the structure matches.
+    
+    Args:
+        plan: Evaluation plan of a Lio
+    
+    Returns:
+        Function that performs one computation step on the plan's node list
+    """
+    key = structure_key(plan)
+    step = _cache.get(key)
+    if step is not None:
+        _cache.move_to_end(key)
+        return step
+    
+    namespace: Dict = {}
+    exec(compile(generate_source(plan), "<lio-step>", "exec"), namespace)
+    step = namespace["step"]
+    
+    _cache[key] = step
+    if len(_cache) > MAX_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return step
+
+
+def clear_cache():
+    """Drop all cached step functions."""
+    _cache.clear()
@@ -1,11 +1,12 @@
 """Configuration classes for Neosis simulations."""
 
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Union
 from pydantic import BaseModel, Field
 from enum import Enum
 
-from .neoverse import NeoVerse, RandomNeoVerse, AlternatingNeoVerse, BlockPatternNeoVerse
+from .neoverse import NeoVerse, RandomNeoVerse, AlternatingNeoVerse, BlockPatternNeoVerse, FileNeoVerse
 from .neo import Neo
+from .factories import factory_name
 
 
 class NeoVerseType(str, Enum):
@@ -13,6 +14,7 @@ class NeoVerseType(str, Enum):
     RANDOM = "random"
     ALTERNATING = "alternating"
     BLOCK = "block"
+    FILE = "file"
 
 
 class NeoConfig(BaseModel):
@@ -50,6 +52,10 @@ class EvoConfig(BaseModel):
         ge=1,
         description="Maximum number of mutations to apply per mutation event"
     )
+    seed: Optional[int] = Field(
+        default=None,
+        description="Seed of the root Evo's generator (None = derived from the NeoVerse seed, if any)"
+    )
     # Can optionally override mutation costs (uses Lio's costs if not provided)
 
 
@@ -57,6 +63,22 @@ class NeoVerseConfig(BaseModel):
     """Configuration for NeoVerse environment."""
     neoverse_type: NeoVerseType = Field(description="Type of NeoVerse")
     seed: Optional[int] = Field(default=None, description="Random seed (for random NeoVerse)")
+    path: Optional[str] = Field(default=None, description="Tape file path (for file NeoVerse)")
+    
+    def create_neoverse(self) -> NeoVerse:
+        """Create a NeoVerse instance from this configuration."""
+        if self.neoverse_type == NeoVerseType.RANDOM:
+            return RandomNeoVerse(seed=self.seed)
+        elif self.neoverse_type == NeoVerseType.ALTERNATING:
+            return AlternatingNeoVerse()
+        elif self.neoverse_type == NeoVerseType.BLOCK:
+            return BlockPatternNeoVerse()
+        elif self.neoverse_type == NeoVerseType.FILE:
+            if self.path is None:
+                raise ValueError("File NeoVerse requires a tape path")
+            return FileNeoVerse(self.path)
+        else:
+            raise ValueError(f"Unknown NeoVerse type: {self.neoverse_type}")
 
 
 class SimulationConfig(BaseModel):
@@ -69,22 +91,56 @@ class SimulationConfig(BaseModel):
     run_cost: int = Field(default=1, description="Cost per node per tick")
     num_ticks: int = Field(default=100, description="Number of ticks to simulate")
     enable_offspring: bool = Field(default=True, description="Enable offspring creation on mutation (if False, mutations apply directly to Neo)")
-    neo_factory: Optional[Callable] = Field(
+    neo_factory: Optional[Union[Callable, str]] = Field(
         default=None, 
-        description="Optional factory function to customize Lio structure after creation (takes Lio, returns Lio)"
+        description="Optional factory function to customize Lio structure after creation (takes Lio, returns Lio), "
+                    "or its name (see factories.get_neo_factory)"
     )
     
     class Config:
         arbitrary_types_allowed = True  # Allow callable types
     
     def create_neoverse(self) -> NeoVerse:
-        """Create a NeoVerse instance from configuration."""
-        if self.neoverse.neoverse_type == NeoVerseType.RANDOM:
-            return RandomNeoVerse(seed=self.neoverse.seed)
-        elif self.neoverse.neoverse_type == NeoVerseType.ALTERNATING:
-            return AlternatingNeoVerse()
-        elif self.neoverse.neoverse_type == NeoVerseType.BLOCK:
-            return BlockPatternNeoVerse()
-        else:
-            raise ValueError(f"Unknown NeoVerse type: {self.neoverse.neoverse_type}")
+        """
+        Create a NeoVerse instance from configuration.
+        
+        Raises:
+            ValueError: If a file NeoVerse's tape is too short for num_ticks (a run
+                        reads num_ticks + 1 inputs: tick t is scored against u_{t+1})
+        """
+        neoverse = self.neoverse.create_neoverse()
+        if isinstance(neoverse, FileNeoVerse) and len(neoverse) < self.num_ticks + 1:
+            raise ValueError(f"Tape {neoverse.path} has {len(neoverse)} ticks, but a {self.num_ticks}-tick run "
+                             f"needs {self.num_ticks + 1} (record it with --ticks {self.num_ticks})")
+        return neoverse
+
+
 
+def neo_factory_label(factory: Optional[Union[Callable, str]]) -> Optional[str]:
+    """The factory's factory_name, or its repr if it can't be named (e.g. a lambda)."""
+    if factory is None:
+        return None
+    try:
+        return factory_name(factory)
+    except ValueError:
+        return repr(factory)
+
+
+def config_to_dict(config: SimulationConfig) -> dict:
+    """
+    Convert SimulationConfig to a dictionary for JSON serialization.
+    
+    Every field is included (nested configs through model_dump, so new fields
+    are picked up automatically); neo_factory is given by name (neo_factory_label).
+    """
+    return {
+        "name": config.name,
+        "neo": config.neo.model_dump(mode="json"),
+        "neoverse": config.neoverse.model_dump(mode="json"),
+        "lio": config.lio.model_dump(mode="json") if config.lio else None,
+        "evo": config.evo.model_dump(mode="json") if config.evo else None,
+        "run_cost": config.run_cost,
+        "num_ticks": config.num_ticks,
+        "enable_offspring": config.enable_offspring,
+        "neo_factory": neo_factory_label(config.neo_factory),
+    }
@@ -1,16 +1,35 @@
 """Evo: Applies mutations to Lio based on available energy."""
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Union
+import math
 import random
 
+import numpy as np
+
 from .lio import Lio
 from .types import Mutation, MutationType, Edge, Node, NodeType, Lex
 
 
 class Evo:
-    """Evo applies mutations to Lio. Can apply multiple mutations per cycle based on available energy."""
+    """
+    Evo applies mutations to Lio. Can apply multiple mutations per cycle based on available energy.
+    
+    Every Evo draws from its own generator (rng), seeded from a node of a
+    SeedSequence tree: an offspring's Evo gets a child of its parent's sequence
+    (see spawn). A lineage's mutations therefore depend only on the root seed and
+    its place in the lineage tree, not on how many other Neos are alive or the
+    order they are stepped in.
+    
+    Instead of a coin flip per tick, the Evo samples the number of ticks until
+    its next mutation attempt from a geometric distribution (ticks_to_attempt).
+    The attempts fall on the same ticks in distribution as with a
+    mutation_probability coin flip every tick, but the ticks in between cost a
+    counter decrement (attempt_due) and can be skipped in bulk (skip).
+    """
     
-    def __init__(self, mutation_probability: float = 0.1, max_mutations_per_event: int = 3, costs: Optional[Dict[MutationType, int]] = None):
+    def __init__(self, mutation_probability: float = 0.1, max_mutations_per_event: int = 3,
+                 costs: Optional[Dict[MutationType, int]] = None,
+                 seed: Union[None, int, np.random.SeedSequence] = None):
         """
         Initialize Evo.
         
@@ -18,15 +37,86 @@ class Evo:
             mutation_probability: Probability of attempting mutations in a given tick (0.0 = never, 1.0 = every tick)
             max_mutations_per_event: Maximum number of mutations to apply per mutation event
             costs: Dictionary of mutation costs (uses Lio's costs if None)
+            seed: Seed or SeedSequence of the Evo's generator (None draws one from the
+                  global random module, so random.seed still makes runs reproducible)
         """
         self.mutation_probability = mutation_probability
         self.max_mutations_per_event = max_mutations_per_event
         self.costs = costs  # If None, will use Lio's costs
+        if seed is None:
+            seed = random.getrandbits(128)
+        self.seed_sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+        self.rng = random.Random(int.from_bytes(self.seed_sequence.generate_state(4).tobytes(), "little"))
+        # Ticks left before the next mutation attempt (math.inf if mutation_probability is 0)
+        self.ticks_to_attempt = self.sample_gap()
+    
+    def spawn(self) -> 'Evo':
+        """An Evo with the same settings whose generator is seeded from the next child of this Evo's SeedSequence."""
+        return Evo(
+            mutation_probability=self.mutation_probability,
+            max_mutations_per_event=self.max_mutations_per_event,
+            costs=dict(self.costs) if self.costs else None,
+            seed=self.seed_sequence.spawn(1)[0]
+        )
+    
+    def sample_gap(self) -> Union[int, float]:
+        """
+        Number of ticks without a mutation attempt before the next attempt.
+        
+        Geometric with success probability mutation_probability (the ticks a
+        per-tick coin flip would fail before it succeeds), sampled by inversion
+        from a single draw; math.inf if mutation_probability is 0.
+        """
+        p = self.mutation_probability
+        if p >= 1.0:
+            return 0
+        if p <= 0.0:
+            return math.inf
+        return int(math.log(1.0 - self.rng.random()) / math.log1p(-p))
+    
+    def attempt_due(self) -> bool:
+        """
+        Advance the Evo by one tick and tell whether it attempts mutations on it.
+        
+        When the attempt is due, the gap to the following attempt is sampled.
+        """
+        if self.ticks_to_attempt > 0:
+            self.ticks_to_attempt -= 1
+            return False
+        self.ticks_to_attempt = self.sample_gap()
+        return True
+    
+    def skip(self, ticks: int):
+        """
+        Advance the Evo by ticks ticks without an attempt.
+        
+        Raises:
+            ValueError: If an attempt is due within those ticks
+        """
+        if ticks > self.ticks_to_attempt:
+            raise ValueError(f"Can't skip {ticks} ticks: a mutation attempt is due in {self.ticks_to_attempt}")
+        self.ticks_to_attempt -= ticks
     
     def apply_mutations(self, lio: Lio, available_energy: int) -> List[Mutation]:
         """
-        Apply mutations to Lio based on available energy.
-        Only attempts mutations with probability mutation_probability.
+        Advance the Evo by one tick and, if a mutation attempt is due, apply mutations.
+        
+        Equivalent to attempt_due() followed by attempt_mutations().
+        
+        Args:
+            lio: Lio to mutate
+            available_energy: Available energy in Nex
+            
+        Returns:
+            List of mutations that were applied
+        """
+        if not self.attempt_due():
+            return []
+        return self.attempt_mutations(lio, available_energy)
+    
+    def attempt_mutations(self, lio: Lio, available_energy: int) -> List[Mutation]:
+        """
+        Apply mutations to Lio based on available energy (a mutation attempt, whether due or not).
         Uniform random selection of mutation types.
         Continues until energy runs out or no more mutations can be applied.
         
@@ -38,11 +128,6 @@ class Evo:
             List of mutations that were applied
         """
         applied = []
-        
-        # Check if we should attempt mutations this tick
-        if random.random() > self.mutation_probability:
-            return applied  # Skip mutations this tick
-        
         remaining_energy = available_energy
         
         # Use Lio's costs if Evo doesn't have its own
@@ -66,7 +151,7 @@ class Evo:
             attempts += 1
             
             # Uniform random selection from affordable mutation types only
-            mutation_type = random.choice(affordable_types)
+            mutation_type = self.rng.choice(affordable_types)
             cost = costs.get(mutation_type, 0)
             
             # Generate mutation
@@ -95,27 +180,32 @@ class Evo:
         if mutation_type == MutationType.BIT_ADD:
             return Mutation(
                 mutation_type=MutationType.BIT_ADD,
+                target_id=lio.get_next_node_id(),  # ID the new memory node will get
                 additional_params={"new_bit_value": 0}
             )
         elif mutation_type == MutationType.BIT_REMOVE:
             if lio.n <= 0:
                 return None
+            bit_index = self.rng.randint(0, lio.n - 1)
+            # Memory node the removal will take out (the same one _apply_mutation picks)
+            memory_nodes = lio.memory_node_ids
+            target_id = memory_nodes[min(bit_index, len(memory_nodes) - 1)] if memory_nodes else None
             return Mutation(
                 mutation_type=MutationType.BIT_REMOVE,
-                additional_params={"bit_index": random.randint(0, lio.n - 1)}
+                target_id=target_id,
+                additional_params={"bit_index": bit_index}
             )
         elif mutation_type == MutationType.EDGE_ADD:
-            node_ids = list(lio.nodes.keys())
+            node_ids = lio.node_ids
             if len(node_ids) < 2:
                 return None
-            source_id = random.choice(node_ids)
-            target_id = random.choice(node_ids)
+            source_id = self.rng.choice(node_ids)
+            target_id = self.rng.choice(node_ids)
             if source_id == target_id:
                 return None
             # Check if edge already exists
-            for edge in lio.edges:
-                if edge.source_id == source_id and edge.target_id == target_id:
-                    return None
+            if lio.has_edge(source_id, target_id):
+                return None
             return Mutation(
                 mutation_type=MutationType.EDGE_ADD,
                 additional_params={"source_id": source_id, "target_id": target_id}
@@ -123,28 +213,23 @@ class Evo:
         elif mutation_type == MutationType.EDGE_REMOVE:
             if not lio.edges:
                 return None
-            edge = random.choice(lio.edges)
+            edge = self.rng.choice(lio.edges)
             return Mutation(
                 mutation_type=MutationType.EDGE_REMOVE,
                 additional_params={"source_id": edge.source_id, "target_id": edge.target_id}
             )
         elif mutation_type == MutationType.LEX_FLIP:
-            computational_nodes = [
-                node_id for node_id, node in lio.nodes.items()
-                if (node.node_type == NodeType.COMPUTATIONAL or 
-                    (node.node_type == NodeType.MEMORY and node.lex)) and node.lex
-            ]
+            computational_nodes = lio.lex_node_ids
             if not computational_nodes:
                 return None
-            node_id = random.choice(computational_nodes)
+            node_id = self.rng.choice(computational_nodes)
             node = lio.nodes[node_id]
-            if not node.lex or not node.lex.table:
+            if not node.lex:
                 return None
-            inputs = random.choice(list(node.lex.table.keys()))
             return Mutation(
                 mutation_type=MutationType.LEX_FLIP,
                 target_id=node_id,
-                additional_params={"inputs": inputs}
+                additional_params={"index": self.rng.randrange(node.lex.size)}
             )
         return None
     
@@ -155,23 +240,21 @@ class Evo:
             lio.n += 1
             lio.memory.append(new_bit_value)
             new_node_id = lio.get_next_node_id()
-            lio.nodes[new_node_id] = Node(
+            lio.add_node(Node(
                 node_id=new_node_id,
                 node_type=NodeType.MEMORY,
                 value=new_bit_value
-            )
+            ))
             
             # Automatically connect new node with an incoming edge from a random existing node
             # This makes the node immediately useful (cost is still 1, not 2)
-            existing_node_ids = [nid for nid in lio.nodes.keys() if nid != new_node_id]
-            if existing_node_ids:
-                source_id = random.choice(existing_node_ids)
+            # The new node is last in node order, so the others are all but the last ID
+            node_ids = lio.node_ids
+            if len(node_ids) > 1:
+                source_id = node_ids[self.rng.randrange(len(node_ids) - 1)]
                 # Don't create self-loops for the new node (it has no lex yet)
                 # Create edge from existing node to new node
-                new_edge = Edge(source_id=source_id, target_id=new_node_id)
-                lio.edges.append(new_edge)
-            
-            lio._build_adjacency()
+                lio.add_edge(source_id, new_node_id)
             
             # Update new node's lex arity if needed (it will need a lex for computation)
             if new_node_id in lio.nodes:
@@ -181,7 +264,7 @@ class Evo:
                     incoming_count = len(lio.incoming_edges.get(new_node_id, []))
                     if incoming_count > 0:
                         # Create a default lex (all zeros) - mutations can change it later
-                        node.lex = Lex(arity=incoming_count)
+                        lio.set_lex(new_node_id, Lex(arity=incoming_count))
             
             return True
         
@@ -192,18 +275,10 @@ class Evo:
             if bit_index < len(lio.memory):
                 lio.memory.pop(bit_index)
                 lio.n -= 1
-                memory_nodes = [
-                    node_id for node_id, node in lio.nodes.items()
-                    if node.node_type == NodeType.MEMORY
-                ]
+                memory_nodes = lio.memory_node_ids
                 if memory_nodes:
                     node_to_remove = memory_nodes[min(bit_index, len(memory_nodes) - 1)]
-                    lio.edges = [
-                        e for e in lio.edges
-                        if e.source_id != node_to_remove and e.target_id != node_to_remove
-                    ]
-                    del lio.nodes[node_to_remove]
-                    lio._build_adjacency()
+                    lio.remove_node(node_to_remove)
                 return True
             return False
         
@@ -215,12 +290,9 @@ class Evo:
             if source_id not in lio.nodes or target_id not in lio.nodes:
                 return False
             # Check if edge already exists
-            for edge in lio.edges:
-                if edge.source_id == source_id and edge.target_id == target_id:
-                    return False
-            new_edge = Edge(source_id=source_id, target_id=target_id)
-            lio.edges.append(new_edge)
-            lio._build_adjacency()
+            if lio.has_edge(source_id, target_id):
+                return False
+            lio.add_edge(source_id, target_id)
             # Update target node's lex arity if needed
             if target_id in lio.nodes:
                 node = lio.nodes[target_id]
@@ -230,31 +302,7 @@ class Evo:
                     if new_arity != old_arity:
                         # When arity increases, combine old function with new input using AND
                         # This makes the new input actually matter
-                        old_table = dict(node.lex.table)
-                        new_table = {}
-                        
-                        # Generate all possible input combinations for new arity
-                        for i in range(2 ** new_arity):
-                            new_inputs = tuple((i >> j) & 1 for j in range(new_arity - 1, -1, -1))
-                            
-                            if old_arity > 0:
-                                # Use first old_arity inputs to compute old function
-                                old_inputs = new_inputs[:old_arity]
-                                old_output = old_table.get(old_inputs, 0)
-                                
-                                # Combine with new input(s) using AND
-                                # For each new input beyond old_arity, AND it with the old output
-                                combined_output = old_output
-                                for j in range(old_arity, new_arity):
-                                    combined_output = combined_output & new_inputs[j]
-                                
-                                new_table[new_inputs] = combined_output
-                            else:
-                                # No old function, default to 0
-                                new_table[new_inputs] = 0
-                        
-                        # Create new lex with combined table
-                        node.lex = Lex(arity=new_arity, table=new_table)
+                        lio.set_lex(target_id, node.lex.extend_and(new_arity))
             return True
         
         elif mutation.mutation_type == MutationType.EDGE_REMOVE:
@@ -262,11 +310,7 @@ class Evo:
             target_id = mutation.additional_params.get("target_id")
             if source_id is None or target_id is None:
                 return False
-            lio.edges = [
-                e for e in lio.edges
-                if not (e.source_id == source_id and e.target_id == target_id)
-            ]
-            lio._build_adjacency()
+            lio.remove_edge(source_id, target_id)
             # Update target node's lex arity if needed
             if target_id in lio.nodes:
                 node = lio.nodes[target_id]
@@ -275,28 +319,8 @@ class Evo:
                     old_arity = node.lex.arity
                     if new_arity != old_arity:
                         # Preserve old behavior: project the old truth table
-                        # Use the first k inputs (where k = new_arity) from the old function
-                        old_table = dict(node.lex.table)
-                        new_table = {}
-                        
-                        # Generate all possible input combinations for new arity
-                        for i in range(2 ** new_arity):
-                            new_inputs = tuple((i >> j) & 1 for j in range(new_arity - 1, -1, -1))
-                            # Extend to old arity by padding with zeros (or use first k inputs)
-                            # We'll use the first k inputs and pad with zeros if needed
-                            if new_arity <= old_arity:
-                                # Project: use first new_arity inputs, pad with zeros
-                                old_inputs = new_inputs + tuple([0] * (old_arity - new_arity))
-                            else:
-                                # This shouldn't happen (removing edge reduces arity)
-                                old_inputs = new_inputs[:old_arity]
-                            
-                            # Get output from old table (default to 0 if not found)
-                            output = old_table.get(old_inputs, 0)
-                            new_table[new_inputs] = output
-                        
-                        # Create new lex with projected table
-                        node.lex = Lex(arity=new_arity, table=new_table)
+                        # onto the first k inputs (where k = new_arity)
+                        lio.set_lex(target_id, node.lex.project(new_arity))
             return True
         
         elif mutation.mutation_type == MutationType.LEX_FLIP:
@@ -306,12 +330,18 @@ class Evo:
             node = lio.nodes[node_id]
             if node.lex is None:
                 return False
-            inputs = mutation.additional_params.get("inputs")
-            if inputs is None:
-                return False
-            if not isinstance(inputs, tuple):
-                inputs = tuple(inputs)
-            node.lex.flip(inputs)
+            index = mutation.additional_params.get("index")
+            if index is None:
+                inputs = mutation.additional_params.get("inputs")
+                if inputs is None:
+                    return False
+                if not isinstance(inputs, tuple):
+                    inputs = tuple(inputs)
+                try:
+                    index = node.lex.index_of(inputs)
+                except KeyError:
+                    index = -1  # Invalid inputs leave the lex unchanged
+            lio.flip_lex(node_id, index)
             return True
         
         return False
@@ -0,0 +1,77 @@
+"""Registry of neo_factory callables, so configs can name them (and be sent to other processes)."""
+
+from typing import Callable, Dict, Optional, Union
+import importlib
+
+from .lio import Lio
+
+
+# Registered factories by name
+NEO_FACTORIES: Dict[str, Callable[[Lio], Lio]] = {}
+
+
+def register_neo_factory(name: Optional[str] = None):
+    """
+    Decorator registering a neo_factory under a name (default: its __name__).
+    
+    Configs can then set neo_factory to the name instead of the callable. The
+    registration runs when the defining module is imported, so a worker process
+    finds the factory once it imports that module (see factory_name).
+    
+    Raises:
+        ValueError: If another factory is already registered under the name
+    """
+    def register(factory: Callable[[Lio], Lio]) -> Callable[[Lio], Lio]:
+        key = name or factory.__name__
+        if NEO_FACTORIES.get(key, factory) is not factory:
+            raise ValueError(f"A different neo_factory is already registered as {key!r}")
+        NEO_FACTORIES[key] = factory
+        return factory
+    return register
+
+
+def factory_name(factory: Union[Callable[[Lio], Lio], str]) -> str:
+    """
+    A name get_neo_factory resolves back to the factory, in any process.
+    
+    Registered factories are named "<module>:<registered name>", other
+    module-level functions "<module>:<qualified name>". Names are returned as is.
+    
+    Raises:
+        ValueError: If the factory is neither registered nor importable (e.g. a lambda)
+    """
+    if isinstance(factory, str):
+        return factory
+    module = getattr(factory, "__module__", None)
+    for key, registered in NEO_FACTORIES.items():
+        if registered is factory:
+            return f"{module}:{key}"
+    qualname = getattr(factory, "__qualname__", "")
+    if module and module != "__main__" and qualname and "<" not in qualname:
+        return f"{module}:{qualname}"
+    raise ValueError(f"neo_factory {factory!r} can't be named; define it at module level or register it "
+                     "with register_neo_factory")
+
+
+def get_neo_factory(name: str) -> Callable[[Lio], Lio]:
+    """
+    Look up a factory by registered name or by a factory_name "<module>:<name>".
+    
+    Raises:
+        KeyError: If no such factory exists
+    """
+    if name in NEO_FACTORIES:
+        return NEO_FACTORIES[name]
+    module_name, _, attribute = name.partition(":")
+    if not attribute:
+        raise KeyError(f"Unknown neo_factory {name!r}")
+    # Importing the module runs its registrations
+    module = importlib.import_module(module_name)
+    if attribute in NEO_FACTORIES and NEO_FACTORIES[attribute].__module__ == module_name:
+        return NEO_FACTORIES[attribute]
+    factory = module
+    for part in attribute.split("."):
+        factory = getattr(factory, part, None)
+    if not callable(factory):
+        raise KeyError(f"Unknown neo_factory {name!r}")
+    return factory
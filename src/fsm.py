@@ -0,0 +1,129 @@
+"""Finite-state-machine compiler: turns a small Lio into a dense transition table."""
+
+from typing import Callable, List, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .types import Node
+from .lio import EvaluationPlan
+from .compiler import structure_key
+
+
+# Lios whose state has more bits than this are evaluated as graphs
+MAX_STATE_BITS = 12
+
+# Maximum number of transition tables kept in the cache
+MAX_CACHE_SIZE = 1024
+
+_cache: 'OrderedDict[Tuple, FSMTable]' = OrderedDict()
+
+
+@dataclass
+class FSMTable:
+    """
+    Transition table of a Lio structure viewed as a finite-state machine.
+    
+    The state packs the values of every node a step reads or writes (except the
+    input node) into an int, bit j holding the node at plan position positions[j].
+    Entry (state << 1) | input of transitions is the state after one compute step,
+    -1 until that transition has been evaluated.
+    """
+    positions: List[int]  # Plan positions of the state bits
+    input_position: Optional[int]  # Plan position of the input node
+    output_bit: Optional[int]  # State bit holding the output node (None if it never changes)
+    transitions: List[int]  # (state << 1) | input -> next state, -1 = not evaluated yet
+    
+    def encode(self, nodes: List[Node]) -> int:
+        """Pack the node values into a state."""
+        state = 0
+        for j, position in enumerate(self.positions):
+            state |= nodes[position].value << j
+        return state
+    
+    def decode(self, state: int, nodes: List[Node]):
+        """Write a state back into the node values."""
+        for j, position in enumerate(self.positions):
+            nodes[position].value = (state >> j) & 1
+    
+    def evaluate(self, state: int, u_t: int, nodes: List[Node], step: Callable[[List[Node]], None]) -> int:
+        """
+        Evaluate one transition through the graph and record it in the table.
+        
+        Leaves the nodes holding the next state.
+        
+        Args:
+            state: Current state
+            u_t: Input bit
+            nodes: The Lio's plan nodes (overwritten)
+            step: Function performing one compute step on the nodes
+        
+        Returns:
+            The next state
+        """
+        self.decode(state, nodes)
+        if self.input_position is not None:
+            nodes[self.input_position].value = u_t
+        step(nodes)
+        next_state = self.encode(nodes)
+        self.transitions[(state << 1) | u_t] = next_state
+        return next_state
+
+
+def state_positions(plan: EvaluationPlan) -> List[int]:
+    """Plan positions of the nodes a compute step reads or writes (the FSM state)."""
+    positions = set()
+    for handler, target, arg in plan.steps:
+        positions.add(target)
+        if isinstance(arg, tuple):
+            positions.update(arg[1])
+        else:
+            positions.add(arg)
+    for target, source in plan.memory_copies:
+        positions.add(target)
+        positions.add(source)
+    return sorted(positions)
+
+
+def build_fsm(plan: EvaluationPlan, input_position: Optional[int],
+              output_position: Optional[int]) -> Optional[FSMTable]:
+    """
+    Return the transition table for the plan's structure, or None if its state is too large.
+    
+    Tables are cached by structure and shared between Lios. Transitions are
+    evaluated through the graph the first time they are taken, so each
+    (state, input) pair costs one graph evaluation for the lifetime of the cache.
+    
+    Args:
+        plan: Evaluation plan of a Lio
+        input_position: Plan position of the input node (None if the Lio has none)
+        output_position: Plan position of the output node (None if the Lio has none)
+    
+    Returns:
+        FSMTable, or None if the state has more than MAX_STATE_BITS bits
+    """
+    key = (structure_key(plan), input_position, output_position)
+    fsm = _cache.get(key)
+    if fsm is not None:
+        _cache.move_to_end(key)
+        return fsm
+    
+    positions = [p for p in state_positions(plan) if p != input_position]
+    if len(positions) > MAX_STATE_BITS:
+        return None
+    output_bit = positions.index(output_position) if output_position in positions else None
+    fsm = FSMTable(
+        positions=positions,
+        input_position=input_position,
+        output_bit=output_bit,
+        transitions=[-1] * (2 << len(positions)),
+    )
+    
+    _cache[key] = fsm
+    if len(_cache) > MAX_CACHE_SIZE:
+        _cache.popitem(last=False)
+    return fsm
+
+
+def clear_cache():
+    """Drop all cached transition tables."""
+    _cache.clear()
@@ -0,0 +1,505 @@
+"""Columnar lineage histories (typed arrays sharing their prefix with the parent lineage) and result types."""
+
+from typing import Any, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass
+
+import numpy as np
+
+from .types import Mutation, MutationType
+
+
+# Capacity of a new Column (doubled whenever it fills up)
+INITIAL_CAPACITY = 16
+
+# Mutation types by their code in mutation records
+MUTATION_TYPES = tuple(MutationType)
+MUTATION_CODES = {mutation_type: code for code, mutation_type in enumerate(MUTATION_TYPES)}
+MUTATION_LABELS = np.array([mutation_type.value for mutation_type in MUTATION_TYPES])
+
+# One mutation record: tick, type code, and the nodes involved (-1 if none)
+MUTATION_DTYPE = np.dtype([
+    ("tick", np.int32),
+    ("type", np.int8),
+    ("target", np.int32),  # Node flipped, added or removed, or the edge's target
+    ("source", np.int32),  # Edge's source node
+])
+
+
+class Column(Sequence):
+    """
+    Growable typed array with a list-like interface.
+    
+    Values live in a NumPy array whose capacity doubles when it fills up, so
+    append is amortized O(1) and an entry costs its dtype's size (1 byte for
+    int8 bits, 4 for int32 energy) instead of a Python object per entry.
+    Reading returns Python ints/floats, so a Column can stand in for a list;
+    use `array` (or np.asarray) for a zero-copy NumPy view.
+    """
+    
+    __slots__ = ("_data", "_length")
+    
+    def __init__(self, dtype: Any, values: Sequence = ()):
+        """
+        Initialize a column.
+        
+        Args:
+            dtype: NumPy dtype of the entries
+            values: Initial entries
+        """
+        values = np.asarray(values, dtype=dtype)
+        self._data = np.empty(max(INITIAL_CAPACITY, len(values)), dtype=dtype)
+        self._data[:len(values)] = values
+        self._length = len(values)
+    
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> 'Column':
+        """
+        Wrap an existing array without copying it (e.g. a memory-mapped one).
+        
+        The array is only read; the first append copies it into a grown buffer.
+        """
+        column = cls.__new__(cls)
+        column._data = array
+        column._length = len(array)
+        return column
+    
+    @property
+    def dtype(self) -> np.dtype:
+        return self._data.dtype
+    
+    @property
+    def array(self) -> np.ndarray:
+        """NumPy view of the entries (invalidated by the next append that grows the column)."""
+        return self._data[:self._length]
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the entries (including spare capacity)."""
+        return self._data.nbytes
+    
+    def append(self, value: Any):
+        """Append one entry, doubling the capacity if the column is full."""
+        if self._length == len(self._data):
+            grown = np.empty(2 * len(self._data), dtype=self._data.dtype)
+            grown[:self._length] = self._data
+            self._data = grown
+        self._data[self._length] = value
+        self._length += 1
+    
+    def extend(self, values: Sequence):
+        """Append many entries at once, growing the capacity (by doubling) to fit them."""
+        values = np.asarray(values, dtype=self._data.dtype)
+        if not len(values):
+            return
+        end = self._length + len(values)
+        if end > len(self._data):
+            capacity = len(self._data)
+            while capacity < end:
+                capacity *= 2
+            grown = np.empty(capacity, dtype=self._data.dtype)
+            grown[:self._length] = self._data[:self._length]
+            self._data = grown
+        self._data[self._length:end] = values
+        self._length = end
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.array.tolist())
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return self.array[index].tolist()
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("column index out of range")
+        return self._data[index].item()
+    
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        return self.array if dtype is None else self.array.astype(dtype)
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Sequence, np.ndarray)) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"Column({self.tolist()!r}, dtype={self.dtype})"
+    
+    def tolist(self) -> List[Any]:
+        """Copy the entries into a list."""
+        return self.array.tolist()
+
+
+class LineageHistory(Sequence):
+    """
+    Per-tick history of one lineage, sharing the inherited prefix with its parent.
+    
+    A lineage only stores the entries it recorded itself (own); the entries it
+    inherited are the first `branch` entries of the parent's history, which are
+    read through the parent pointer instead of being copied. The full history
+    is therefore a lazily concatenated view: parent[:branch] + own.
+    
+    Memory scales with the number of entries actually recorded, no matter how
+    deep the lineage tree is. Indexing walks up the parent chain (O(depth));
+    iteration and slicing collect the segments once and then read them in order.
+    Own entries are kept in a Column when a dtype is given (children forked from
+    it use the same dtype), or in a list otherwise.
+    """
+    
+    __slots__ = ("own", "parent", "branch")
+    
+    def __init__(self, own: Optional[Sequence] = None, parent: Optional['LineageHistory'] = None,
+                 branch: int = 0, dtype: Any = None):
+        """
+        Initialize a history.
+        
+        Args:
+            own: Entries recorded by this lineage (appended to in place)
+            parent: History of the parent lineage (None for a root)
+            branch: Number of the parent's entries this history starts with
+            dtype: If given (and own is None), store own entries in a Column of this dtype
+        """
+        if own is None:
+            own = Column(dtype) if dtype is not None else []
+        self.own = own
+        self.parent = parent
+        self.branch = branch if parent is not None else 0
+    
+    def fork(self, branch: int) -> 'LineageHistory':
+        """Start a child history that inherits this history's first `branch` entries."""
+        dtype = self.own.dtype if isinstance(self.own, Column) else None
+        return LineageHistory(parent=self, branch=min(branch, len(self)), dtype=dtype)
+    
+    def append(self, value: Any):
+        """Record one entry."""
+        self.own.append(value)
+    
+    def extend(self, values: Sequence):
+        """Record many entries."""
+        self.own.extend(values)
+    
+    def segments(self) -> List[Tuple[Sequence, int]]:
+        """
+        The (entries, count) pieces the history is made of, oldest first.
+        
+        Each piece is the first `count` entries of one ancestor's own list.
+        """
+        pieces = [(self.own, len(self.own))]
+        limit = self.branch
+        history = self.parent
+        while history is not None and limit > 0:
+            count = limit - history.branch
+            if count > 0:
+                pieces.append((history.own, count))
+            limit = min(limit, history.branch)
+            history = history.parent
+        pieces.reverse()
+        return pieces
+    
+    def __len__(self) -> int:
+        return self.branch + len(self.own)
+    
+    def __iter__(self) -> Iterator[Any]:
+        for entries, count in self.segments():
+            yield from entries[:count]
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return self.tolist()[index]
+            # Only read the pieces overlapping [start, stop)
+            values: List[Any] = []
+            offset = 0
+            for entries, count in self.segments():
+                if offset + count > start and offset < stop:
+                    values.extend(entries[max(0, start - offset):min(count, stop - offset)])
+                offset += count
+            return values
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("history index out of range")
+        history = self
+        while index < history.branch:
+            history = history.parent
+        return history.own[index - history.branch]
+    
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        pieces = [
+            entries.array[:count] if isinstance(entries, Column) else np.asarray(entries[:count])
+            for entries, count in self.segments()
+        ]
+        array = np.concatenate(pieces)
+        return array if dtype is None else array.astype(dtype)
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Sequence, np.ndarray)) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"LineageHistory({self.tolist()!r})"
+    
+    def tolist(self) -> List[Any]:
+        """Materialize the full history as a list."""
+        values: List[Any] = []
+        for entries, count in self.segments():
+            values.extend(entries[:count])
+        return values
+
+
+class AccuracyHistory(Sequence):
+    """
+    Running accuracy of a lineage, derived on demand instead of stored.
+    
+    Entry k is the accuracy after the lineage's k-th own tick:
+    (correct + hits in own[:k + 1]) / (total + k + 1), where correct and total
+    count the inherited entries. An offspring's history starts with the
+    parent's accuracy at the branch tick (head). Nothing but these counts is
+    kept; the hits are read from the lineage's own prediction and actual columns.
+    """
+    
+    __slots__ = ("predictions", "actuals", "correct", "total", "head")
+    
+    def __init__(self, predictions: Sequence[int], actuals: Sequence[int], correct: int = 0,
+                 total: int = 0, head: Optional[float] = None):
+        """
+        Initialize an accuracy history.
+        
+        Args:
+            predictions: The lineage's own predictions (a Column or list, read live)
+            actuals: The lineage's own actuals (a Column or list, read live)
+            correct: Correct predictions among the inherited entries
+            total: Number of inherited entries
+            head: Accuracy the history starts with (the parent's, for an offspring)
+        """
+        self.predictions = predictions
+        self.actuals = actuals
+        self.correct = correct
+        self.total = total
+        self.head = head
+    
+    def __len__(self) -> int:
+        return len(self.predictions) + (self.head is not None)
+    
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        count = len(self.predictions)
+        hits = np.asarray(self.predictions)[:count] == np.asarray(self.actuals)[:count]
+        accuracy = (self.correct + np.cumsum(hits)) / (self.total + np.arange(1, count + 1))
+        if self.head is not None:
+            accuracy = np.concatenate([[self.head], accuracy])
+        return accuracy if dtype is None else accuracy.astype(dtype)
+    
+    def __iter__(self) -> Iterator[float]:
+        return iter(np.asarray(self).tolist())
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return np.asarray(self)[index].tolist()
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("accuracy index out of range")
+        if self.head is not None:
+            if index == 0:
+                return self.head
+            index -= 1
+        hits = np.asarray(self.predictions)[:index + 1] == np.asarray(self.actuals)[:index + 1]
+        return (self.correct + int(np.count_nonzero(hits))) / (self.total + index + 1)
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (Sequence, np.ndarray)) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"AccuracyHistory({self.tolist()!r})"
+    
+    def tolist(self) -> List[float]:
+        """Compute the accuracies into a list."""
+        return np.asarray(self).tolist()
+
+
+class MutationEvent(NamedTuple):
+    """
+    One applied mutation.
+    
+    target is the node a lexflip flipped, the memory node a bit+ added or a bit-
+    removed, or the target of an edge; source is the source of an edge. Nodes
+    that don't apply (or aren't known, e.g. for events parsed from strings) are -1.
+    str() renders the event as "t=<tick>: <type>".
+    """
+    tick: int
+    mutation_type: MutationType
+    target: int = -1
+    source: int = -1
+    
+    @classmethod
+    def from_mutation(cls, tick: int, mutation: Mutation) -> 'MutationEvent':
+        """The event of a mutation an Evo applied at a tick."""
+        params = mutation.additional_params
+        if mutation.mutation_type in (MutationType.EDGE_ADD, MutationType.EDGE_REMOVE):
+            target, source = params.get("target_id"), params.get("source_id")
+        else:
+            target, source = mutation.target_id, None
+        return cls(tick, mutation.mutation_type,
+                   -1 if target is None else target, -1 if source is None else source)
+    
+    @classmethod
+    def parse(cls, text: str) -> 'MutationEvent':
+        """
+        Parse an event rendered by str() (the nodes are lost and read as -1).
+        
+        Raises:
+            ValueError: If text isn't of the form "t=<tick>: <type>"
+        """
+        tick, _, name = text.partition(":")
+        if not tick.strip().startswith("t="):
+            raise ValueError(f"Not a mutation event: {text!r}")
+        return cls(int(tick.strip()[2:]), MutationType(name.strip()))
+    
+    def __str__(self) -> str:
+        return f"t={self.tick}: {self.mutation_type.value}"
+
+
+class MutationLog(Sequence):
+    """
+    A lineage's mutation events, stored as MUTATION_DTYPE records.
+    
+    An event costs 13 bytes instead of a formatted string. Indexing and
+    iteration give MutationEvents; the record array (`array`) and its `ticks`
+    and `codes` fields allow vectorized filtering, e.g. log.ticks[log.codes ==
+    MUTATION_CODES[MutationType.LEX_FLIP]] or log.of_type(MutationType.LEX_FLIP).
+    """
+    
+    __slots__ = ("_records",)
+    
+    def __init__(self, events: Iterable[Union[MutationEvent, str]] = ()):
+        """
+        Initialize a log.
+        
+        Args:
+            events: Initial events (MutationEvents, or strings as rendered by str())
+        """
+        self._records = Column(MUTATION_DTYPE, [])
+        self.extend(events)
+    
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> 'MutationLog':
+        """Wrap an array of MUTATION_DTYPE records without copying it."""
+        log = cls.__new__(cls)
+        log._records = Column.from_array(array)
+        return log
+    
+    @property
+    def array(self) -> np.ndarray:
+        """Record array of the events (invalidated by the next append that grows the log)."""
+        return self._records.array
+    
+    @property
+    def ticks(self) -> np.ndarray:
+        """Tick of each event."""
+        return self.array["tick"]
+    
+    @property
+    def codes(self) -> np.ndarray:
+        """Type code of each event (an index into MUTATION_TYPES)."""
+        return self.array["type"]
+    
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for the records (including spare capacity)."""
+        return self._records.nbytes
+    
+    def append(self, event: Union[MutationEvent, str]):
+        """Record one event."""
+        if isinstance(event, str):
+            event = MutationEvent.parse(event)
+        self._records.append((event.tick, MUTATION_CODES[event.mutation_type], event.target, event.source))
+    
+    def extend(self, events: Iterable[Union[MutationEvent, str]]):
+        """Record several events."""
+        for event in events:
+            self.append(event)
+    
+    def of_type(self, mutation_type: MutationType) -> 'MutationLog':
+        """The events of one type."""
+        return MutationLog.from_array(self.array[self.codes == MUTATION_CODES[mutation_type]])
+    
+    def labels(self) -> np.ndarray:
+        """Type name of each event (e.g. "lexflip")."""
+        return MUTATION_LABELS[self.codes]
+    
+    @staticmethod
+    def _event(record: tuple) -> MutationEvent:
+        tick, code, target, source = record
+        return MutationEvent(tick, MUTATION_TYPES[code], target, source)
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def __iter__(self) -> Iterator[MutationEvent]:
+        return map(self._event, self.array.tolist())
+    
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._event(record) for record in self.array[index].tolist()]
+        return self._event(self._records[index])
+    
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return f"MutationLog({[str(event) for event in self]!r})"
+    
+    def tolist(self) -> List[MutationEvent]:
+        """Copy the events into a list."""
+        return list(self)
+
+
+@dataclass
+class NeoLineage:
+    """
+    Results for a single Neo lineage (parent and its descendants).
+    
+    predictions, actuals and rewards cover the whole history including the ticks
+    inherited from the parent. NeoCycle returns them as LineageHistory views that
+    share the inherited prefix with the parent lineage instead of copying it.
+    
+    Histories are columnar: NeoCycle stores them in typed arrays (int8 bits,
+    int32 energy, rewards and sizes) and derives the accuracy history on demand.
+    All of them read like lists; np.asarray gives NumPy arrays. Mutations are a
+    MutationLog of structured events (str() of an event gives "t=12: lexflip").
+    """
+    lineage_id: int
+    parent_id: Optional[int]  # None for root
+    energy_history: Sequence[int]
+    accuracy_history: Sequence[float]
+    predictions: Sequence[int]
+    actuals: Sequence[int]
+    rewards: Sequence[int]
+    size_history: Sequence[int]
+    mutations_applied: Sequence[MutationEvent]
+    birth_tick: int  # When this lineage was created
+    death_tick: Optional[int]  # When this lineage died (None if still alive)
+
+
+@dataclass
+class SimulationResult:
+    """Results from a simulation run (histories are the root lineage's columns)."""
+    energy_history: Sequence[int]
+    accuracy_history: Sequence[float]
+    predictions: Sequence[int]
+    actuals: Sequence[int]
+    rewards: Sequence[int]
+    size_history: Sequence[int]
+    mutations_applied: Sequence[MutationEvent]
+    lineages: List[NeoLineage]  # All Neo lineages (offsprings)
@@ -0,0 +1,131 @@
+"""Bit-parallel evaluation of one Lio across many independent input streams."""
+
+from typing import Any, Callable, List, Sequence, Tuple
+from dataclasses import dataclass
+
+import numpy as np
+
+from .lio import Lio
+from .neoverse import NeoVerse
+
+
+@dataclass
+class LaneResult:
+    """Results of running one fixed Lio in many lanes (one row per lane)."""
+    predictions: np.ndarray  # (lanes, ticks) prediction y_t
+    actuals: np.ndarray  # (lanes, ticks) actual next input u_{t+1}
+    rewards: np.ndarray  # (lanes, ticks) reward, 0 after death
+    energy_history: np.ndarray  # (lanes, ticks + 1) energy, constant after death
+    death_tick: np.ndarray  # (lanes,) tick at which the lane died, -1 if still alive
+    accuracy: np.ndarray  # (lanes,) final accuracy over the ticks the lane lived
+
+
+def pack_lanes(bits: np.ndarray) -> List[Any]:
+    """
+    Pack a (lanes, ticks) bit matrix into one lane word per tick.
+    
+    Words are Python ints for up to 64 lanes and numpy uint64 arrays otherwise,
+    matching Lio.init_lanes.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    num_lanes, num_ticks = bits.shape
+    num_words = (num_lanes + 63) // 64
+    packed = np.packbits(bits.T, axis=1, bitorder='little')
+    padded = np.zeros((num_ticks, num_words * 8), dtype=np.uint8)
+    padded[:, :packed.shape[1]] = packed
+    words = padded.view('<u8')
+    if num_lanes <= 64:
+        return [int(w[0]) for w in words]
+    return [w.astype(np.uint64) for w in words]
+
+
+def unpack_lanes(words: Sequence[Any], num_lanes: int) -> np.ndarray:
+    """Unpack one lane word per tick back into a (lanes, ticks) bit matrix."""
+    num_words = (num_lanes + 63) // 64
+    matrix = np.zeros((len(words), num_words), dtype='<u8')
+    for t, word in enumerate(words):
+        if isinstance(word, np.ndarray):
+            matrix[t] = word
+        else:
+            matrix[t, 0] = word
+    bits = np.unpackbits(matrix.view(np.uint8), axis=1, bitorder='little')[:, :num_lanes]
+    return bits.T.astype(np.int8)
+
+
+def sample_inputs(make_neoverse: Callable[[int], NeoVerse], seeds: Sequence[int],
+                  num_ticks: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read the inputs and actuals NeoCycle would see from one NeoVerse per seed.
+    
+    Lane i reads the input tape of make_neoverse(seeds[i]): u_t as input and
+    u_{t+1} as actual for each tick t.
+    
+    Returns:
+        Tuple of (inputs, actuals), each a (lanes, num_ticks) array of bits
+    """
+    inputs = np.zeros((len(seeds), num_ticks), dtype=np.int8)
+    actuals = np.zeros((len(seeds), num_ticks), dtype=np.int8)
+    for lane, seed in enumerate(seeds):
+        tape = make_neoverse(seed).get_inputs(0, num_ticks + 1)
+        inputs[lane] = tape[:num_ticks]
+        actuals[lane] = tape[1:]
+    return inputs, actuals
+
+
+def run_lanes(lio: Lio, inputs: np.ndarray, actuals: np.ndarray, energy: int, run_cost: int = 1) -> LaneResult:
+    """
+    Run a fixed Lio (no mutations) against many input streams in one bit-parallel pass.
+    
+    Follows NeoCycle's per-tick order in every lane: receive u_t, compute, pay the
+    run cost and receive a reward of num_nodes if the prediction matches u_{t+1}.
+    A lane dies on the first tick it can't pay the run cost.
+    
+    Args:
+        lio: Lio to evaluate (its node values are the initial state of every lane)
+        inputs: (lanes, num_ticks) input bits u_t, one row per stream
+        actuals: (lanes, num_ticks) actual next inputs u_{t+1} the predictions are scored against
+        energy: Initial energy of every lane
+        run_cost: Cost per node per tick
+    
+    Returns:
+        LaneResult with per-lane histories
+    """
+    inputs = np.asarray(inputs, dtype=np.int8)
+    actuals = np.asarray(actuals, dtype=np.int8)
+    num_lanes, num_ticks = inputs.shape
+    words = pack_lanes(inputs)
+    
+    state = lio.init_lanes(num_lanes)
+    outputs = [lio.compute_lanes(state, word) for word in words]
+    predictions = unpack_lanes(outputs, num_lanes)
+    
+    # Structure is fixed, so cost and reward per tick don't depend on energy
+    size = lio.get_size()
+    cost = run_cost * size
+    correct = predictions == actuals
+    delta = np.where(correct, size, 0) - cost
+    energy_before = energy + np.concatenate(
+        [np.zeros((num_lanes, 1), dtype=np.int64), np.cumsum(delta, axis=1, dtype=np.int64)], axis=1
+    )
+    
+    # A lane dies at the first tick it starts with less than the run cost
+    starved = energy_before[:, :num_ticks] < cost
+    died = starved.any(axis=1)
+    death_tick = np.where(died, starved.argmax(axis=1), -1)
+    lived = np.where(died, death_tick, num_ticks)
+    alive = np.arange(num_ticks)[None, :] < lived[:, None]
+    
+    energy_history = energy_before.copy()
+    for lane in np.nonzero(died)[0]:
+        energy_history[lane, death_tick[lane] + 1:] = energy_history[lane, death_tick[lane]]
+    rewards = np.where(alive & correct, size, 0)
+    accuracy = np.where(lived > 0, (correct & alive).sum(axis=1) / np.maximum(lived, 1), 0.0)
+    
+    return LaneResult(
+        predictions=predictions,
+        actuals=actuals,
+        rewards=rewards,
+        energy_history=energy_history,
+        death_tick=death_tick,
+        accuracy=accuracy,
+    )
@@ -1,14 +1,65 @@
 """Lio: The learner containing nodes, edges, memory, and lex (computational structure)."""
 
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from collections import defaultdict
+from dataclasses import dataclass
 import copy
 import random
 
+import numpy as np
+
 from .types import Node, NodeType, Edge, Lex, Mutation, MutationType
 from .global_config import GlobalConfig
 
 
+def _eval_lex(nodes: List[Node], snapshot: List[int], target: int, arg: Tuple[Lex, Tuple[int, ...]]):
+    """Handler for nodes with a lex: look up the snapshot values of its sources."""
+    lex, sources = arg
+    index = 0
+    for i in sources:
+        index = (index << 1) | snapshot[i]
+    nodes[target].value = (lex.bits >> index) & 1
+
+
+def _eval_output(nodes: List[Node], snapshot: List[int], target: int, source: int):
+    """Handler for output nodes: copy the current (already computed) value of the source."""
+    nodes[target].value = nodes[source].value
+
+
+@dataclass
+class EvaluationPlan:
+    """Compiled evaluation order for a fixed Lio structure."""
+    order: List[int]  # Node IDs in topological order
+    index: Dict[int, int]  # Node ID -> position in order
+    nodes: List[Node]  # Nodes in the same order
+    steps: List[Tuple[Callable, int, Any]]  # (handler, target index, handler argument)
+    memory_copies: List[Tuple[int, int]]  # (target index, source index) for memory nodes without lex
+
+
+@dataclass
+class LaneState:
+    """Node values of a Lio evaluated over many independent input streams (bit lanes)."""
+    plan: EvaluationPlan  # Plan the lane values are laid out for
+    values: List[Any]  # One lane word per plan node (int or numpy uint64 array)
+    ones: Any  # Lane word with every lane set
+    zero: Any  # Lane word with no lane set
+    num_lanes: int
+
+
+def _eval_lex_lanes(bits: int, arity: int, inputs: List[Any], ones: Any, zero: Any) -> Any:
+    """Evaluate a truth table as a boolean expression over lane words (Shannon expansion)."""
+    if bits == 0:
+        return zero
+    if bits == (1 << (1 << arity)) - 1:
+        return ones
+    # The first input is the most significant: entries with it set are the upper half
+    half = 1 << (arity - 1)
+    low = _eval_lex_lanes(bits & ((1 << half) - 1), arity - 1, inputs[1:], ones, zero)
+    high = _eval_lex_lanes(bits >> half, arity - 1, inputs[1:], ones, zero)
+    x = inputs[0]
+    return (x & high) | ((x ^ ones) & low)
+
+
 class Lio:
     """Lio is the learner - contains the computational structure (nodes, edges, memory, lex)."""
     
@@ -39,6 +90,11 @@ class Lio:
         self.input_node_id = input_node_id
         self.output_node_id = output_node_id
         
+        # FSM mode: while _fsm_state is set it holds the node values (see sync_nodes)
+        self._fsm_state: Optional[int] = None
+        self._fsm_input = 0
+        self._fsm_memory_dirty = False
+        
         # Initialize nodes if not provided
         if nodes is None:
             self.nodes = self._create_default_nodes()
@@ -79,9 +135,7 @@ class Lio:
         
         # Computational node
         comp_node_id = 3
-        lex = Lex(arity=1)
-        lex.table[(0,)] = 1
-        lex.table[(1,)] = 0
+        lex = Lex(arity=1, table={(0,): 1, (1,): 0})
         nodes[comp_node_id] = Node(
             node_id=comp_node_id,
             node_type=NodeType.COMPUTATIONAL,
@@ -117,107 +171,540 @@ class Lio:
         return edges
     
     def _build_adjacency(self):
-        """Build adjacency lists for efficient graph traversal."""
+        """Build adjacency lists and the topological order from scratch (after editing nodes or edges directly)."""
         self.incoming_edges: Dict[int, List[int]] = defaultdict(list)
         self.outgoing_edges: Dict[int, List[int]] = defaultdict(list)
         
         for edge in self.edges:
             self.incoming_edges[edge.target_id].append(edge.source_id)
             self.outgoing_edges[edge.source_id].append(edge.target_id)
+        
+        # Topological rank of each node, maintained incrementally by the edit methods
+        # below. Only valid while the graph (ignoring self-loops) is acyclic.
+        self._rank: Dict[int, int] = {}
+        self._rank_valid = False
+        self._next_rank = 0
+        self._update_ranks()
+        
+        # Indexes for mutation candidate selection, in node order
+        self._node_ids = list(self.nodes)
+        self._memory_node_ids = [
+            node_id for node_id, node in self.nodes.items()
+            if node.node_type == NodeType.MEMORY
+        ]
+        self._lex_node_ids = self._find_lex_nodes()
+        self._edge_set = {(edge.source_id, edge.target_id) for edge in self.edges}
+        self._max_node_id = max(self.nodes, default=-1)
+        
+        # Set by copy(): edges, adjacency, ranks and indexes are shared with another Lio
+        self._structure_shared = False
+        
+        # Structure changed: the evaluation plan must be rebuilt
+        self.invalidate_plan()
+    
+    def _find_lex_nodes(self) -> List[int]:
+        """IDs of the nodes whose Lex can be flipped (computational or memory nodes with a Lex)."""
+        return [
+            node_id for node_id in self._node_ids
+            if self.nodes[node_id].lex is not None
+            and self.nodes[node_id].node_type in (NodeType.COMPUTATIONAL, NodeType.MEMORY)
+        ]
+    
+    @property
+    def node_ids(self) -> List[int]:
+        """Node IDs in node order (maintained index; do not modify)."""
+        return self._node_ids
+    
+    @property
+    def memory_node_ids(self) -> List[int]:
+        """IDs of the memory nodes in node order (maintained index; do not modify)."""
+        return self._memory_node_ids
+    
+    @property
+    def lex_node_ids(self) -> List[int]:
+        """IDs of the computational and memory nodes with a Lex, in node order (maintained index; do not modify)."""
+        return self._lex_node_ids
+    
+    def has_edge(self, source_id: int, target_id: int) -> bool:
+        """Check whether an edge from source_id to target_id exists."""
+        return (source_id, target_id) in self._edge_set
+    
+    def _own_structure(self):
+        """
+        Copy the edge list, adjacency dicts, ranks and indexes if they are shared with another Lio.
+        
+        The adjacency lists themselves are never changed in place (edits replace
+        them), so they stay shared.
+        """
+        if not self._structure_shared:
+            return
+        self.edges = list(self.edges)
+        self.incoming_edges = defaultdict(list, self.incoming_edges)
+        self.outgoing_edges = defaultdict(list, self.outgoing_edges)
+        self._rank = dict(self._rank)
+        self._node_ids = list(self._node_ids)
+        self._memory_node_ids = list(self._memory_node_ids)
+        self._lex_node_ids = list(self._lex_node_ids)
+        self._edge_set = set(self._edge_set)
+        self._structure_shared = False
+    
+    def add_node(self, node: Node):
+        """Add a node without edges (placed last in the topological order)."""
+        self._own_structure()
+        self.nodes[node.node_id] = node
+        self._rank[node.node_id] = self._next_rank
+        self._next_rank += 1
+        self._node_ids.append(node.node_id)
+        if node.node_type == NodeType.MEMORY:
+            self._memory_node_ids.append(node.node_id)
+        if node.lex is not None and node.node_type in (NodeType.COMPUTATIONAL, NodeType.MEMORY):
+            self._lex_node_ids.append(node.node_id)
+        self._max_node_id = max(self._max_node_id, node.node_id)
+        self.invalidate_plan()
+    
+    def remove_node(self, node_id: int):
+        """Remove a node and every edge touching it."""
+        self._own_structure()
+        self.edges = [e for e in self.edges if e.source_id != node_id and e.target_id != node_id]
+        for target_id in self.outgoing_edges.pop(node_id, []):
+            self._edge_set.discard((node_id, target_id))
+            if target_id != node_id:
+                self.incoming_edges[target_id] = [s for s in self.incoming_edges[target_id] if s != node_id]
+        for source_id in self.incoming_edges.pop(node_id, []):
+            self._edge_set.discard((source_id, node_id))
+            if source_id != node_id:
+                self.outgoing_edges[source_id] = [t for t in self.outgoing_edges[source_id] if t != node_id]
+        node = self.nodes.pop(node_id)
+        # Removing a node keeps the remaining order topological
+        self._rank.pop(node_id, None)
+        self._node_ids.remove(node_id)
+        if node.node_type == NodeType.MEMORY:
+            self._memory_node_ids.remove(node_id)
+        if node_id in self._lex_node_ids:
+            self._lex_node_ids.remove(node_id)
+        if node_id == self._max_node_id:
+            self._max_node_id = max(self.nodes, default=-1)
+        self.invalidate_plan()
+    
+    def add_edge(self, source_id: int, target_id: int):
+        """Add an edge, repairing the topological order around it."""
+        self._own_structure()
+        self.edges.append(Edge(source_id=source_id, target_id=target_id))
+        self._edge_set.add((source_id, target_id))
+        self.incoming_edges[target_id] = self.incoming_edges[target_id] + [source_id]
+        self.outgoing_edges[source_id] = self.outgoing_edges[source_id] + [target_id]
+        if self._rank_valid and source_id != target_id:
+            self._reorder_for_edge(source_id, target_id)
+        self.invalidate_plan()
+    
+    def remove_edge(self, source_id: int, target_id: int):
+        """Remove every edge from source_id to target_id (the topological order stays valid)."""
+        if target_id not in self.outgoing_edges.get(source_id, []):
+            return
+        self._own_structure()
+        self.edges = [
+            e for e in self.edges
+            if not (e.source_id == source_id and e.target_id == target_id)
+        ]
+        self.incoming_edges[target_id] = [s for s in self.incoming_edges[target_id] if s != source_id]
+        self.outgoing_edges[source_id] = [t for t in self.outgoing_edges[source_id] if t != target_id]
+        self._edge_set.discard((source_id, target_id))
+        self.invalidate_plan()
+    
+    def set_lex(self, node_id: int, lex: Optional[Lex]):
+        """Replace a node's Lex (use this rather than assigning node.lex, which bypasses the indexes)."""
+        node = self.nodes[node_id]
+        had_lex = node.lex is not None
+        node.lex = lex
+        if (lex is not None) != had_lex and node.node_type in (NodeType.COMPUTATIONAL, NodeType.MEMORY):
+            self._own_structure()
+            if lex is not None and node_id == self._node_ids[-1]:
+                self._lex_node_ids.append(node_id)
+            else:
+                self._lex_node_ids = self._find_lex_nodes()
+        self.invalidate_plan()
+    
+    def flip_lex(self, node_id: int, index: int) -> bool:
+        """
+        Flip one entry of a node's Lex. Returns True if the index was valid.
+        
+        The Lex is replaced by a flipped copy rather than changed in place, since
+        copies of this Lio may share it.
+        """
+        node = self.nodes[node_id]
+        lex = node.lex.model_copy()
+        flipped = lex.flip_index(index)
+        node.lex = lex
+        self.invalidate_plan()
+        return flipped
+    
+    def _reorder_for_edge(self, source_id: int, target_id: int):
+        """
+        Restore the topological order after adding source_id -> target_id (Pearce-Kelly).
+        
+        Only nodes ranked between target and source are visited: those reachable from
+        the target and those reaching the source are moved, keeping their relative
+        order, into the ranks they already occupy. If the target reaches the source the
+        edge closed a cycle and the order is left for _update_ranks to rebuild.
+        """
+        rank = self._rank
+        lower, upper = rank[target_id], rank[source_id]
+        if upper < lower:
+            return
+        
+        forward = []
+        seen = {target_id}
+        stack = [target_id]
+        while stack:
+            node_id = stack.pop()
+            forward.append(node_id)
+            for next_id in self.outgoing_edges.get(node_id, []):
+                if next_id == source_id:
+                    self._rank_valid = False
+                    return
+                if next_id not in seen and rank[next_id] < upper:
+                    seen.add(next_id)
+                    stack.append(next_id)
+        
+        backward = []
+        seen = {source_id}
+        stack = [source_id]
+        while stack:
+            node_id = stack.pop()
+            backward.append(node_id)
+            for prev_id in self.incoming_edges.get(node_id, []):
+                if prev_id not in seen and rank[prev_id] > lower:
+                    seen.add(prev_id)
+                    stack.append(prev_id)
+        
+        moved = sorted(backward, key=rank.__getitem__) + sorted(forward, key=rank.__getitem__)
+        for node_id, r in zip(moved, sorted(rank[node_id] for node_id in moved)):
+            rank[node_id] = r
+    
+    def _update_ranks(self) -> List[int]:
+        """Recompute the evaluation order from scratch, re-ranking the nodes if the graph is acyclic."""
+        order, cyclic = self._topological_sort()
+        if not cyclic:
+            self._rank = {node_id: i for i, node_id in enumerate(order)}
+            self._next_rank = len(order)
+        self._rank_valid = not cyclic
+        return order
     
     def get_next_node_id(self) -> int:
         """Get the next available node ID."""
-        return max(self.nodes.keys(), default=-1) + 1
+        return self._max_node_id + 1
     
     def receive_input(self, u_t: int):
         """Receive perceptual input from NeoVerse."""
-        if self.input_node_id in self.nodes:
+        if self._fsm_state is not None:
+            self._fsm_input = u_t
+        elif self.input_node_id in self.nodes:
             self.nodes[self.input_node_id].value = u_t
     
     def compute(self):
         """Perform one computation step using snapshot semantics."""
-        # Create snapshot of current values
-        snapshot = {node_id: node.value for node_id, node in self.nodes.items()}
+        if self._fsm_state is not None:
+            self._advance_fsm()
+            return
+        if self._step is None:
+            self._select_step()
+        self._step(self._plan.nodes)
+    
+    def compute_sequence(self, inputs: Sequence[int]) -> np.ndarray:
+        """
+        Receive and compute each input in turn, for a structure that doesn't change in between.
+        
+        Equivalent to receive_input, compute, get_output and update_memory once
+        per input, but once the Lio is in FSM mode the remaining ticks are a
+        tight loop of table lookups.
+        
+        Args:
+            inputs: Input bits u_t, one per tick
+        
+        Returns:
+            int8 array of the output predictions, one per tick
+        """
+        inputs = np.asarray(inputs, dtype=np.int8).tolist()
+        outputs = []
+        i = 0
+        # Until the structure is compiled to an FSM (or if its output isn't part of the state)
+        while i < len(inputs) and (self._fsm_state is None or self._fsm.output_bit is None):
+            self.receive_input(inputs[i])
+            self.compute()
+            outputs.append(self.get_output())
+            i += 1
+        if i < len(inputs):
+            fsm = self._fsm
+            transitions = fsm.transitions
+            output_bit = fsm.output_bit
+            state = self._fsm_state
+            for u_t in inputs[i:]:
+                next_state = transitions[(state << 1) | u_t]
+                if next_state < 0:
+                    next_state = fsm.evaluate(state, u_t, self._plan.nodes, self._interpret)
+                state = next_state
+                outputs.append((state >> output_bit) & 1)
+            self._fsm_state = state
+            self._fsm_input = inputs[-1]
+        if inputs:
+            self.update_memory()
+        return np.array(outputs, dtype=np.int8)
+    
+    def _select_step(self):
+        """Pick the step function for the current structure: compiled if cached, else interpreted."""
+        from .compiler import lookup_step
+        plan = self._get_plan()
+        self._interpreted_ticks = 0
+        self._fsm = None
+        self._step = lookup_step(plan) or self._interpret_then_compile
+    
+    def _interpret_then_compile(self, nodes: List[Node]):
+        """
+        Interpret the plan until the structure has lasted COMPILE_AFTER_TICKS ticks, then compile it.
         
-        # Topological sort for computation order
-        computation_order = self._topological_sort()
+        Small Lios are compiled to an FSM transition table, larger ones to a step function.
+        """
+        from .compiler import compile_plan, COMPILE_AFTER_TICKS
+        from .fsm import build_fsm
+        self._interpreted_ticks += 1
+        if self._interpreted_ticks < COMPILE_AFTER_TICKS:
+            self._interpret(nodes)
+            return
+        plan = self._plan
+        self._fsm = build_fsm(plan, plan.index.get(self.input_node_id), plan.index.get(self.output_node_id))
+        if self._fsm is not None:
+            self._step = self._enter_fsm
+        else:
+            self._step = compile_plan(plan)
+        self._step(nodes)
+    
+    def _enter_fsm(self, nodes: List[Node]):
+        """Switch to FSM mode: pack the node values into a state and take the first transition."""
+        fsm = self._fsm
+        self._fsm_input = nodes[fsm.input_position].value if fsm.input_position is not None else 0
+        self._fsm_state = fsm.encode(nodes)
+        self._fsm_memory_dirty = False
+        self._advance_fsm()
+    
+    def _advance_fsm(self):
+        """Perform one computation step by table lookup (evaluating the graph on a missing entry)."""
+        state = self._fsm.transitions[(self._fsm_state << 1) | self._fsm_input]
+        if state < 0:
+            state = self._fsm.evaluate(self._fsm_state, self._fsm_input, self._plan.nodes, self._interpret)
+        self._fsm_state = state
+    
+    def sync_nodes(self):
+        """
+        Leave FSM mode, writing the state back into the node values and memory.
+        
+        While a Lio is in FSM mode its node values and memory are stale. Methods that
+        read or change the structure call this first; call it before reading node
+        values or memory directly. The next compute() re-enters FSM mode.
+        """
+        if self._fsm_state is None:
+            return
+        fsm = self._fsm
+        nodes = self._plan.nodes
+        state = self._fsm_state
+        self._fsm_state = None
+        fsm.decode(state, nodes)
+        if fsm.input_position is not None:
+            nodes[fsm.input_position].value = self._fsm_input
+        if self._fsm_memory_dirty:
+            self.update_memory()
+    
+    def _interpret(self, nodes: List[Node]):
+        """Run the cached plan's handlers (generic interpretation of the plan)."""
+        plan = self._plan
+        
+        # Create snapshot of current values (indexed by position in the plan)
+        snapshot = [node.value for node in nodes]
+        
+        # Run each node's handler in topological order
+        for handler, target, arg in plan.steps:
+            handler(nodes, snapshot, target, arg)
+        
+        # Update memory nodes after computation (only if they don't have lex)
+        for target, source in plan.memory_copies:
+            nodes[target].value = nodes[source].value
+    
+    def init_lanes(self, num_lanes: int) -> LaneState:
+        """
+        Start a bit-parallel evaluation over num_lanes independent input streams.
         
-        # Compute each node in topological order
-        for node_id in computation_order:
-            node = self.nodes[node_id]
+        Every lane starts from the current node values. Up to 64 lanes are packed
+        into a Python int; more lanes use a numpy uint64 array (64 lanes per word).
+        Lane i is bit i (bit i % 64 of word i // 64).
+        
+        Args:
+            num_lanes: Number of input streams evaluated together
             
-            if node.node_type == NodeType.INPUT:
-                continue
+        Returns:
+            LaneState to pass to compute_lanes
+        """
+        if num_lanes <= 0:
+            raise ValueError(f"num_lanes must be positive, got {num_lanes}")
+        plan = self._get_plan()
+        if num_lanes <= 64:
+            ones = (1 << num_lanes) - 1
+            zero = 0
+        else:
+            num_words = (num_lanes + 63) // 64
+            ones = np.full(num_words, np.iinfo(np.uint64).max, dtype=np.uint64)
+            if num_lanes % 64:
+                ones[-1] = np.uint64((1 << (num_lanes % 64)) - 1)
+            zero = np.zeros(num_words, dtype=np.uint64)
+        values = [ones if node.value else zero for node in plan.nodes]
+        return LaneState(plan=plan, values=values, ones=ones, zero=zero, num_lanes=num_lanes)
+    
+    def compute_lanes(self, state: LaneState, inputs: Any) -> Any:
+        """
+        Receive one input per lane and perform one computation step in every lane.
+        
+        Each node's lex is evaluated as a bitwise boolean expression over the lane
+        words, with the same snapshot semantics as compute(). The Lio's own node
+        values are not touched.
+        
+        Args:
+            state: LaneState from init_lanes (updated in place)
+            inputs: Lane word holding every lane's input bit
+            
+        Returns:
+            Lane word holding every lane's output prediction
+        """
+        plan = state.plan
+        if plan is not self._plan:
+            raise ValueError("Lio structure changed since init_lanes was called")
+        values = state.values
+        ones, zero = state.ones, state.zero
+        
+        input_index = plan.index.get(self.input_node_id)
+        if input_index is not None:
+            values[input_index] = inputs
+        snapshot = list(values)
+        
+        for handler, target, arg in plan.steps:
+            if handler is _eval_lex:
+                lex, sources = arg
+                values[target] = _eval_lex_lanes(lex.bits, lex.arity, [snapshot[i] for i in sources], ones, zero)
+            else:
+                values[target] = values[arg]
+        
+        for target, source in plan.memory_copies:
+            values[target] = values[source]
+        
+        output_index = plan.index.get(self.output_node_id)
+        return values[output_index] if output_index is not None else zero
+    
+    def invalidate_plan(self):
+        """Drop the cached evaluation plan and step function. Call after changing a node's Lex."""
+        self.sync_nodes()
+        self._plan = None
+        self._step = None
+        self._fsm = None
+    
+    def _get_plan(self) -> 'EvaluationPlan':
+        """Return the cached evaluation plan, building it if needed."""
+        self.sync_nodes()
+        if self._plan is None:
+            self._plan = self._build_plan()
+        return self._plan
+    
+    def _build_plan(self) -> 'EvaluationPlan':
+        """Compile the current structure into an evaluation plan."""
+        if self._rank_valid:
+            order = sorted(self.nodes, key=self._rank.__getitem__)
+        else:
+            order = self._update_ranks()
+        index = {node_id: i for i, node_id in enumerate(order)}
+        nodes = [self.nodes[node_id] for node_id in order]
+        steps = []
+        
+        for i, node in enumerate(nodes):
+            sources = self.incoming_edges.get(order[i], [])
             
             if node.node_type == NodeType.MEMORY:
                 if node.lex:
-                    input_values = []
-                    for source_id in self.incoming_edges[node_id]:
-                        input_values.append(snapshot[source_id])
-                    if not input_values:
-                        input_values = [snapshot[node_id]]
-                    if len(input_values) == node.lex.arity:
-                        inputs_tuple = tuple(input_values)
-                        node.value = node.lex.compute(inputs_tuple)
+                    # A memory node without inputs feeds back its own value
+                    source_indices = tuple(index[s] for s in sources) or (i,)
+                    if len(source_indices) == node.lex.arity:
+                        steps.append((_eval_lex, i, (node.lex, source_indices)))
                 continue
             
             if node.node_type == NodeType.COMPUTATIONAL:
-                input_values = []
-                for source_id in self.incoming_edges[node_id]:
-                    input_values.append(snapshot[source_id])
-                if node.lex and len(input_values) == node.lex.arity:
-                    inputs_tuple = tuple(input_values)
-                    node.value = node.lex.compute(inputs_tuple)
+                source_indices = tuple(index[s] for s in sources)
+                if node.lex and len(source_indices) == node.lex.arity:
+                    steps.append((_eval_lex, i, (node.lex, source_indices)))
                 continue
             
             if node.node_type == NodeType.OUTPUT:
-                if self.incoming_edges[node_id]:
-                    source_id = self.incoming_edges[node_id][0]
-                    # Use the current computed value, not the snapshot
-                    # (since we compute in topological order, source is already computed)
-                    node.value = self.nodes[source_id].value
+                if sources:
+                    steps.append((_eval_output, i, index[sources[0]]))
                 continue
         
-        # Update memory nodes after computation (only if they don't have lex)
+        memory_copies = []
         for node_id, node in self.nodes.items():
             if node.node_type == NodeType.MEMORY and not node.lex:
-                for source_id in self.incoming_edges[node_id]:
+                for source_id in self.incoming_edges.get(node_id, []):
                     if source_id in self.nodes:
-                        node.value = self.nodes[source_id].value
+                        memory_copies.append((index[node_id], index[source_id]))
                         break
+        
+        return EvaluationPlan(order=order, index=index, nodes=nodes, steps=steps, memory_copies=memory_copies)
     
-    def _topological_sort(self) -> List[int]:
-        """Topological sort of nodes for computation order."""
+    def _topological_sort(self) -> Tuple[List[int], bool]:
+        """
+        Topological sort of nodes for computation order (iterative DFS post-order over incoming edges).
+        
+        In a cycle the order decides which output nodes see their source's new value,
+        so cyclic graphs are always evaluated in this order. Self-loops are ignored.
+        
+        Returns:
+            Tuple of (node IDs in evaluation order, whether the graph has a cycle)
+        """
         visited = set()
+        on_path = set()
         result = []
+        cyclic = False
         
-        def visit(node_id: int):
-            if node_id in visited:
-                return
-            visited.add(node_id)
-            for source_id in self.incoming_edges[node_id]:
-                visit(source_id)
-            result.append(node_id)
-        
-        for node_id in self.nodes.keys():
-            if node_id not in visited:
-                visit(node_id)
+        for root_id in self.nodes.keys():
+            if root_id in visited:
+                continue
+            visited.add(root_id)
+            on_path.add(root_id)
+            stack = [(root_id, iter(self.incoming_edges.get(root_id, [])))]
+            while stack:
+                node_id, sources = stack[-1]
+                for source_id in sources:
+                    if source_id not in visited:
+                        visited.add(source_id)
+                        on_path.add(source_id)
+                        stack.append((source_id, iter(self.incoming_edges.get(source_id, []))))
+                        break
+                    if source_id in on_path and source_id != node_id:
+                        cyclic = True
+                else:
+                    stack.pop()
+                    on_path.discard(node_id)
+                    result.append(node_id)
         
-        return result
+        return result, cyclic
     
     def get_output(self) -> int:
         """Get the current output prediction."""
+        if self._fsm_state is not None and self._fsm.output_bit is not None:
+            return (self._fsm_state >> self._fsm.output_bit) & 1
         if self.output_node_id in self.nodes:
             return self.nodes[self.output_node_id].value
         return 0
     
     def update_memory(self):
         """Update memory bits from memory nodes."""
-        memory_node_ids = [
-            node_id for node_id, node in self.nodes.items()
-            if node.node_type == NodeType.MEMORY
-        ]
-        for i, node_id in enumerate(memory_node_ids[:self.n]):
+        if self._fsm_state is not None:
+            # Deferred until the state is written back (sync_nodes)
+            self._fsm_memory_dirty = True
+            return
+        for i, node_id in enumerate(self._memory_node_ids[:self.n]):
             if i < len(self.memory):
                 self.memory[i] = self.nodes[node_id].value
     
@@ -230,37 +717,51 @@ class Lio:
         return self.costs.get(mutation_type, 0)
     
     def copy(self) -> 'Lio':
-        """Create a deep copy of this Lio."""
-        # Deep copy nodes
-        new_nodes = {}
-        for node_id, node in self.nodes.items():
-            # Copy node with all its attributes
-            new_lex = None
-            if node.lex:
-                new_lex = Lex(arity=node.lex.arity, table=dict(node.lex.table))
-            new_nodes[node_id] = Node(
-                node_id=node.node_id,
-                node_type=node.node_type,
-                value=node.value,
-                lex=new_lex
-            )
+        """
+        Create a copy of this Lio that shares its unchanged structure (copy-on-write).
         
-        # Deep copy edges
-        new_edges = [Edge(source_id=e.source_id, target_id=e.target_id) for e in self.edges]
-        
-        # Create new Lio with copied structure
-        new_lio = Lio(
-            n=self.n,
-            memory=list(self.memory),  # Copy memory list
-            nodes=new_nodes,
-            edges=new_edges,
-            input_node_id=self.input_node_id,
-            output_node_id=self.output_node_id,
-            costs=dict(self.costs)  # Copy costs
-        )
+        Nodes are copied since their values are per-Lio state, but Lexes, edges,
+        adjacency, topological ranks and indexes are shared until either Lio changes them
+        through the edit methods (add_node, remove_node, add_edge, remove_edge,
+        set_lex, flip_lex). Code that edits nodes, edges or Lexes in place must copy them first.
+        A built evaluation plan is re-bound to the new nodes instead of rebuilt.
+        """
+        self.sync_nodes()
+        new_lio = Lio.__new__(Lio)
+        new_lio.n = self.n
+        new_lio.memory = list(self.memory)
+        new_lio.input_node_id = self.input_node_id
+        new_lio.output_node_id = self.output_node_id
+        new_lio.costs = dict(self.costs)
+        new_lio._fsm_state = None
+        new_lio._fsm_input = 0
+        new_lio._fsm_memory_dirty = False
+        
+        # Shallow node copies share their Lex
+        new_lio.nodes = {node_id: node.model_copy() for node_id, node in self.nodes.items()}
         
-        # Rebuild adjacency lists
-        new_lio._build_adjacency()
+        new_lio.edges = self.edges
+        new_lio.incoming_edges = self.incoming_edges
+        new_lio.outgoing_edges = self.outgoing_edges
+        new_lio._rank = self._rank
+        new_lio._rank_valid = self._rank_valid
+        new_lio._next_rank = self._next_rank
+        new_lio._node_ids = self._node_ids
+        new_lio._memory_node_ids = self._memory_node_ids
+        new_lio._lex_node_ids = self._lex_node_ids
+        new_lio._edge_set = self._edge_set
+        new_lio._max_node_id = self._max_node_id
+        new_lio._structure_shared = self._structure_shared = True
+        
+        new_lio.invalidate_plan()
+        plan = self._plan
+        if plan is not None:
+            new_lio._plan = EvaluationPlan(
+                order=plan.order,
+                index=plan.index,
+                nodes=[new_lio.nodes[node_id] for node_id in plan.order],
+                steps=plan.steps,
+                memory_copies=plan.memory_copies,
+            )
         
         return new_lio
-
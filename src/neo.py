@@ -51,20 +51,13 @@ class Neo:
         The offspring can mutate, while the parent should stop mutating.
         
         Returns:
-            A new Neo instance with copied Lio and Evo
+            A new Neo instance with copied Lio and a spawned Evo
         """
         # Copy Lio structure
         new_lio = self.lio.copy()
         
-        # Copy Evo if it exists (with same mutation probability and settings)
-        new_evo = None
-        if self.evo:
-            from .evo import Evo
-            new_evo = Evo(
-                mutation_probability=self.evo.mutation_probability,
-                max_mutations_per_event=self.evo.max_mutations_per_event,
-                costs=dict(self.evo.costs) if self.evo.costs else None
-            )
+        # Copy Evo if it exists (same settings, generator seeded from a child of the parent's seed)
+        new_evo = self.evo.spawn() if self.evo else None
         
         # Create offspring with same energy
         offspring = Neo(
@@ -1,8 +1,16 @@
 """NeoVerse: The environment in which Neos operate."""
 
-from typing import Optional
+from typing import Optional, Union
 from abc import ABC, abstractmethod
-import random
+import struct
+
+import numpy as np
+
+
+# Tape files: 8-byte magic, little-endian uint64 tick count, then the input bits
+# packed 8 ticks per byte (tick t is bit t % 8 of byte t // 8)
+TAPE_MAGIC = b"NEOTAPE1"
+TAPE_HEADER_SIZE = 16
 
 
 class NeoVerse(ABC):
@@ -21,6 +29,19 @@ class NeoVerse(ABC):
         """
         pass
     
+    def get_inputs(self, start: int, stop: int) -> np.ndarray:
+        """
+        Get the inputs for ticks start to stop - 1 in bulk.
+        
+        Args:
+            start: First tick
+            stop: Tick after the last one
+            
+        Returns:
+            int8 array of input bits
+        """
+        return np.array([self.get_input(t) for t in range(start, stop)], dtype=np.int8)
+    
     @abstractmethod
     def compute_reward(self, prediction: int, actual: int, num_nodes: int = 1) -> int:
         """
@@ -35,19 +56,70 @@ class NeoVerse(ABC):
             Reward in Nex (num_nodes if correct, 0 if incorrect)
         """
         pass
+    
+    def compute_rewards(self, predictions: np.ndarray, actuals: np.ndarray,
+                        num_nodes: Union[int, np.ndarray] = 1) -> np.ndarray:
+        """
+        Compute rewards for many predictions at once (vectorized compute_reward).
+        
+        Reward is num_nodes where prediction matches actual, 0 otherwise, the rule
+        every NeoVerse here uses. A NeoVerse whose compute_reward follows a
+        different rule must override this too.
+        
+        Args:
+            predictions: Array of predictions
+            actuals: Array of actual next inputs
+            num_nodes: Number of nodes per Neo (scalar or array)
+            
+        Returns:
+            Array of rewards in Nex
+        """
+        return np.where(np.asarray(predictions) == np.asarray(actuals), num_nodes, 0).astype(np.int64)
 
 
 class RandomNeoVerse(NeoVerse):
-    """Random NeoVerse: inputs are sampled independently from Bernoulli(0.5)."""
+    """
+    Random NeoVerse: inputs are sampled independently from Bernoulli(0.5).
+    
+    The inputs form a tape: tick t always has the same input, no matter how often
+    or by how many Neos it is read. The tape is drawn from a seeded NumPy
+    Generator in chunks of TAPE_CHUNK ticks as it is read, so its contents depend
+    only on the seed.
+    """
     
-    def __init__(self, seed: Optional[int] = None):
-        """Initialize random NeoVerse with optional seed."""
-        if seed is not None:
-            random.seed(seed)
+    # Ticks drawn at a time when the tape is extended
+    TAPE_CHUNK = 4096
+    
+    def __init__(self, seed: Union[None, int, np.random.SeedSequence] = None):
+        """Initialize random NeoVerse with optional seed (an int or a SeedSequence)."""
+        self._rng = np.random.default_rng(seed)
+        self._tape = np.zeros(0, dtype=np.int8)
+        self._length = 0
+    
+    def _extend_tape(self, stop: int):
+        """Draw chunks until the tape covers ticks 0 to stop - 1."""
+        while self._length < stop:
+            if self._length + self.TAPE_CHUNK > len(self._tape):
+                grown = np.zeros(max(2 * len(self._tape), self._length + self.TAPE_CHUNK), dtype=np.int8)
+                grown[:self._length] = self._tape[:self._length]
+                self._tape = grown
+            chunk = self._rng.integers(0, 2, size=self.TAPE_CHUNK, dtype=np.int8)
+            self._tape[self._length:self._length + self.TAPE_CHUNK] = chunk
+            self._length += self.TAPE_CHUNK
     
     def get_input(self, t: int) -> int:
-        """Get random input."""
-        return random.randint(0, 1)
+        """Get the input at tick t from the tape."""
+        if t >= self._length:
+            self._extend_tape(t + 1)
+        return int(self._tape[t])
+    
+    def get_inputs(self, start: int, stop: int) -> np.ndarray:
+        """Get the inputs for ticks start to stop - 1 (a read-only view of the tape)."""
+        if stop > self._length:
+            self._extend_tape(stop)
+        window = self._tape[start:stop]
+        window.flags.writeable = False
+        return window
     
     def compute_reward(self, prediction: int, actual: int, num_nodes: int = 1) -> int:
         """Reward is num_nodes if prediction matches actual, 0 otherwise."""
@@ -61,6 +133,10 @@ class AlternatingNeoVerse(NeoVerse):
         """Get alternating input."""
         return t % 2
     
+    def get_inputs(self, start: int, stop: int) -> np.ndarray:
+        """Get alternating inputs for ticks start to stop - 1."""
+        return (np.arange(start, stop) % 2).astype(np.int8)
+    
     def compute_reward(self, prediction: int, actual: int, num_nodes: int = 1) -> int:
         """Reward is num_nodes if prediction matches actual, 0 otherwise."""
         return num_nodes if prediction == actual else 0
@@ -73,7 +149,99 @@ class BlockPatternNeoVerse(NeoVerse):
         """Get block pattern input."""
         return (t // 2) % 2
     
+    def get_inputs(self, start: int, stop: int) -> np.ndarray:
+        """Get block pattern inputs for ticks start to stop - 1."""
+        return ((np.arange(start, stop) // 2) % 2).astype(np.int8)
+    
     def compute_reward(self, prediction: int, actual: int, num_nodes: int = 1) -> int:
         """Reward is num_nodes if prediction matches actual, 0 otherwise."""
         return num_nodes if prediction == actual else 0
 
+
+class FileNeoVerse(NeoVerse):
+    """
+    File NeoVerse: replays a recorded input tape from a memory-mapped file.
+    
+    Only the pages that are read are loaded, so tapes can be far larger than RAM,
+    and processes that map the same file share it through the page cache.
+    Write tape files with write_tape.
+    """
+    
+    def __init__(self, path: str):
+        """
+        Open a tape file.
+        
+        Args:
+            path: Path to a file written by write_tape
+        """
+        with open(path, "rb") as f:
+            header = f.read(TAPE_HEADER_SIZE)
+        if len(header) < TAPE_HEADER_SIZE or header[:8] != TAPE_MAGIC:
+            raise ValueError(f"Not a NeoVerse tape file: {path}")
+        self.path = path
+        self.num_ticks = struct.unpack("<Q", header[8:])[0]
+        if self.num_ticks:
+            self._bits = np.memmap(path, dtype=np.uint8, mode="r", offset=TAPE_HEADER_SIZE,
+                                   shape=((self.num_ticks + 7) // 8,))
+        else:
+            self._bits = np.zeros(0, dtype=np.uint8)
+    
+    def __len__(self) -> int:
+        return self.num_ticks
+    
+    def _check_range(self, start: int, stop: int):
+        if start < 0 or stop > self.num_ticks:
+            raise IndexError(f"Ticks {start}..{stop - 1} outside tape of {self.num_ticks} ticks ({self.path})")
+    
+    def get_input(self, t: int) -> int:
+        """Get the recorded input at tick t."""
+        self._check_range(t, t + 1)
+        return int((self._bits[t >> 3] >> (t & 7)) & 1)
+    
+    def get_inputs(self, start: int, stop: int) -> np.ndarray:
+        """Get the recorded inputs for ticks start to stop - 1 (unpacked into a new array)."""
+        self._check_range(start, stop)
+        packed = self._bits[start >> 3:(stop + 7) >> 3]
+        bits = np.unpackbits(packed, bitorder="little")
+        offset = start & 7
+        return bits[offset:offset + stop - start].astype(np.int8)
+    
+    def get_packed(self, start: int, stop: int) -> np.ndarray:
+        """
+        Get the packed bytes holding ticks start to stop - 1 without copying.
+        
+        The result is a read-only view of the mapped file. Its first byte holds tick
+        start - start % 8, so tick t is bit (t - start + start % 8) % 8 of byte
+        (t - start + start % 8) // 8.
+        """
+        self._check_range(start, stop)
+        return self._bits[start >> 3:(stop + 7) >> 3]
+    
+    def compute_reward(self, prediction: int, actual: int, num_nodes: int = 1) -> int:
+        """Reward is num_nodes if prediction matches actual, 0 otherwise."""
+        return num_nodes if prediction == actual else 0
+
+
+def write_tape(neoverse: NeoVerse, path: str, num_ticks: int, chunk_ticks: int = 1 << 20):
+    """
+    Record the first num_ticks inputs of a NeoVerse into a tape file for FileNeoVerse.
+    
+    Inputs are read with get_inputs in chunks and streamed to disk, so the tape
+    never has to fit in memory.
+    
+    A run of N ticks reads N + 1 inputs (tick t is scored against u_{t+1}), so
+    record num_ticks = N + 1 for it.
+    
+    Args:
+        neoverse: NeoVerse to record
+        path: Output file path
+        num_ticks: Number of ticks to record
+        chunk_ticks: Ticks read per chunk (rounded down to a multiple of 8)
+    """
+    chunk_ticks = max(8, chunk_ticks - chunk_ticks % 8)
+    with open(path, "wb") as f:
+        f.write(TAPE_MAGIC + struct.pack("<Q", num_ticks))
+        for start in range(0, num_ticks, chunk_ticks):
+            stop = min(start + chunk_ticks, num_ticks)
+            bits = np.asarray(neoverse.get_inputs(start, stop), dtype=np.uint8)
+            f.write(np.packbits(bits, bitorder="little").tobytes())
@@ -0,0 +1,155 @@
+"""Run many simulation configs in a pool of worker processes."""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+import os
+import random
+import traceback
+
+import numpy as np
+
+from .config import SimulationConfig
+from .factories import factory_name
+from .history import SimulationResult
+from .sinks import SummarySink
+
+
+# Configs queued per worker ahead of the running ones
+PENDING_PER_WORKER = 2
+
+
+@dataclass
+class SimulationOutcome:
+    """The outcome of one config of a parallel run."""
+    index: int  # Position of the config in the list that was run
+    name: str
+    result: Optional[Union[SimulationResult, Dict[str, Any]]]  # Result or summary; None if the simulation failed
+    error: Optional[str] = None  # Formatted traceback of the failure
+
+
+def task_seed(seed: int, index: int) -> int:
+    """
+    Seed of the global random module for the config at an index.
+    
+    Evos without a seed of their own (no EvoConfig or NeoVerse seed) draw their
+    seed from it. Derived from a SeedSequence spawned from seed, so it depends
+    only on the seed and the config's position, not on the worker that runs it.
+    """
+    return int(np.random.SeedSequence(seed, spawn_key=(index,)).generate_state(1)[0])
+
+
+def prepare_config(config: SimulationConfig) -> SimulationConfig:
+    """A copy of the config that can be pickled (its neo_factory replaced by the factory's name)."""
+    if config.neo_factory is None or isinstance(config.neo_factory, str):
+        return config
+    return config.model_copy(update={"neo_factory": factory_name(config.neo_factory)})
+
+
+def run_task(index: int, config: SimulationConfig, seed: int, summarize: bool = False) -> SimulationOutcome:
+    """Run one config (in a worker, or in this process); failures are returned, not raised."""
+    # Imported here: simulation imports this module to run configs in parallel
+    from .simulation import run_simulation
+    random.seed(task_seed(seed, index))
+    try:
+        if summarize:
+            sink = SummarySink()
+            run_simulation(config, sink=sink)
+            return SimulationOutcome(index, config.name, sink.summary())
+        return SimulationOutcome(index, config.name, run_simulation(config))
+    except Exception:
+        return SimulationOutcome(index, config.name, None, traceback.format_exc())
+
+
+def _prepare_tasks(configs: Iterable[SimulationConfig]) -> Iterator[Tuple[int, SimulationConfig, Optional[str]]]:
+    """(index, picklable config, error) of each config; error is set if the config can't be sent to a worker."""
+    for index, config in enumerate(configs):
+        try:
+            yield index, prepare_config(config), None
+        except ValueError:
+            yield index, config, traceback.format_exc()
+
+
+def iter_simulations(configs: Iterable[SimulationConfig], workers: Optional[int] = None,
+                     seed: int = 0, summarize: bool = False) -> Iterator[SimulationOutcome]:
+    """
+    Run configs in worker processes and yield their outcomes as they complete.
+    
+    Each config runs with the global random module seeded by task_seed(seed,
+    index), so a config's result doesn't depend on the worker count or on which
+    configs ran before it in the same worker. With one worker the configs run
+    in this process, in order. Failures (including a config whose neo_factory
+    can't be sent to a worker) are yielded as outcomes with an error.
+    
+    Configs are taken from the iterable only as workers free up (at most
+    PENDING_PER_WORKER per worker are queued), so a lazily generated sweep is
+    never expanded all at once.
+    
+    Args:
+        configs: Configs to run (any iterable)
+        workers: Number of worker processes (default: os.cpu_count())
+        seed: Seed the per-config seeds are derived from
+        summarize: Run each config into a SummarySink and return its summary()
+                   as the outcome's result instead of the SimulationResult
+    
+    Yields:
+        SimulationOutcome of each config, in order of completion
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be positive")
+    if isinstance(configs, Sequence):
+        workers = min(workers, max(1, len(configs)))
+    # Name the factories before sending, so configs that can't be sent fail with any worker count
+    tasks = _prepare_tasks(configs)
+    if workers == 1:
+        for index, config, error in tasks:
+            if error is not None:
+                yield SimulationOutcome(index, config.name, None, error)
+            else:
+                yield run_task(index, config, seed, summarize)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < PENDING_PER_WORKER * workers:
+                task = next(tasks, None)
+                if task is None:
+                    exhausted = True
+                    break
+                index, config, error = task
+                if error is not None:
+                    yield SimulationOutcome(index, config.name, None, error)
+                    continue
+                pending[executor.submit(run_task, index, config, seed, summarize)] = (index, config.name)
+            if not pending:
+                break
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, name = pending.pop(future)
+                try:
+                    yield future.result()
+                except Exception:
+                    # The worker died or the result couldn't be sent back
+                    yield SimulationOutcome(index, name, None, traceback.format_exc())
+
+
+def run_simulations_parallel(configs: List[SimulationConfig], workers: Optional[int] = None,
+                             seed: int = 0) -> Dict[str, SimulationResult]:
+    """
+    Run configs in worker processes (see iter_simulations).
+    
+    Failed simulations are reported and skipped, like run_simulations_from_configs.
+    
+    Returns:
+        Dictionary mapping simulation name to SimulationResult, in config order
+    """
+    outcomes: List[Tuple[int, str, SimulationResult]] = []
+    for outcome in iter_simulations(configs, workers=workers, seed=seed):
+        if outcome.error is not None:
+            print(f"Error running simulation {outcome.name}:\n{outcome.error}")
+        else:
+            outcomes.append((outcome.index, outcome.name, outcome.result))
+    return {name: result for _, name, result in sorted(outcomes, key=lambda outcome: outcome[0])}
@@ -0,0 +1,300 @@
+"""PopulationEngine: Advances many Neos in lockstep using NumPy arrays."""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .neo import Neo
+from .lio import Lio, _eval_lex
+
+
+# Step kinds in the packed arrays (0 = padding)
+_LEX = 1
+_OUTPUT = 2
+
+
+class PopulationEngine:
+    """
+    Packs the evaluation plans of many Lios into padded NumPy arrays.
+    
+    Row i holds the i-th Neo. Node values are stored by plan position, so column j
+    of row i is the j-th node in that Lio's topological order. Each tick runs the
+    plan steps position by position for all rows at once: lex steps gather their
+    source values from the snapshot and look the result up in the row's unpacked
+    truth tables, output steps copy the current value of their source.
+    
+    While a Neo is packed, the engine's arrays are authoritative for its node values
+    and energy; call sync() before touching the Neo from Python and load() after
+    changing it.
+    """
+    
+    def __init__(self, neos: Sequence[Neo], run_cost: int = 1):
+        """
+        Initialize the engine.
+        
+        Args:
+            neos: Neos to pack, in row order
+            run_cost: Cost per node per tick
+        """
+        self.run_cost = run_cost
+        self.neos: List[Neo] = []
+        self.energy = np.zeros(0, dtype=np.int64)
+        self.size = np.zeros(0, dtype=np.int64)
+        self.values = np.zeros((0, 0), dtype=np.int8)
+        self.input_index = np.zeros(0, dtype=np.int64)
+        self.output_index = np.zeros(0, dtype=np.int64)
+        # Lex steps: (rows, steps[, arity]) padded with kind 0
+        self.step_kind = np.zeros((0, 0), dtype=np.int8)
+        self.step_target = np.zeros((0, 0), dtype=np.int64)
+        self.step_sources = np.zeros((0, 0, 0), dtype=np.int64)
+        self.step_weights = np.zeros((0, 0, 0), dtype=np.int64)
+        self.step_offset = np.zeros((0, 0), dtype=np.int64)
+        self.tables = np.zeros((0, 0), dtype=np.int8)
+        # Memory copies run after all steps, in order: (rows, copies), -1 = none
+        self.copy_target = np.zeros((0, 0), dtype=np.int64)
+        self.copy_source = np.zeros((0, 0), dtype=np.int64)
+        self._schedule: Optional[List] = None
+        self.add(neos)
+    
+    def __len__(self) -> int:
+        return len(self.neos)
+    
+    # ----- Packing -----
+    
+    @staticmethod
+    def _pack_row(lio: Lio) -> dict:
+        """Flatten one Lio's evaluation plan into per-row arrays."""
+        plan = lio._get_plan()
+        index = plan.index
+        kinds, targets, sources, offsets = [], [], [], []
+        table: List[int] = []
+        for handler, target, arg in plan.steps:
+            targets.append(target)
+            if handler is _eval_lex:
+                lex, source_indices = arg
+                kinds.append(_LEX)
+                sources.append(source_indices)
+                offsets.append(len(table))
+                table.extend((lex.bits >> i) & 1 for i in range(lex.size))
+            else:
+                kinds.append(_OUTPUT)
+                sources.append((arg,))
+                offsets.append(0)
+        return {
+            "values": [node.value for node in plan.nodes],
+            "input": index.get(lio.input_node_id, -1),
+            "output": index.get(lio.output_node_id, -1),
+            "kinds": kinds,
+            "targets": targets,
+            "sources": sources,
+            "offsets": offsets,
+            "table": table,
+            "copies": plan.memory_copies,
+        }
+    
+    def _ensure_shape(self, num_nodes: int, num_steps: int, arity: int, table_size: int, num_copies: int):
+        """Grow the padded arrays so a row with the given dimensions fits."""
+        def grow(array: np.ndarray, shape: Tuple[int, ...], fill: int) -> np.ndarray:
+            if all(have >= want for have, want in zip(array.shape[1:], shape)):
+                return array
+            new_shape = (array.shape[0],) + tuple(max(have, want) for have, want in zip(array.shape[1:], shape))
+            grown = np.full(new_shape, fill, dtype=array.dtype)
+            grown[tuple(slice(0, d) for d in array.shape)] = array
+            return grown
+        
+        self.values = grow(self.values, (num_nodes,), 0)
+        self.step_kind = grow(self.step_kind, (num_steps,), 0)
+        self.step_target = grow(self.step_target, (num_steps,), 0)
+        self.step_offset = grow(self.step_offset, (num_steps,), 0)
+        self.step_sources = grow(self.step_sources, (num_steps, arity), 0)
+        self.step_weights = grow(self.step_weights, (num_steps, arity), 0)
+        self.tables = grow(self.tables, (table_size,), 0)
+        self.copy_target = grow(self.copy_target, (num_copies,), -1)
+        self.copy_source = grow(self.copy_source, (num_copies,), -1)
+    
+    def _write_row(self, i: int, row: dict):
+        """Write a packed row into row i of the arrays (which must already fit it)."""
+        self.values[i] = 0
+        self.values[i, :len(row["values"])] = row["values"]
+        self.input_index[i] = row["input"]
+        self.output_index[i] = row["output"]
+        
+        self.step_kind[i] = 0
+        self.step_sources[i] = 0
+        self.step_weights[i] = 0
+        num_steps = len(row["kinds"])
+        self.step_kind[i, :num_steps] = row["kinds"]
+        self.step_target[i, :num_steps] = row["targets"]
+        self.step_offset[i, :num_steps] = row["offsets"]
+        for s, source_indices in enumerate(row["sources"]):
+            arity = len(source_indices)
+            self.step_sources[i, s, :arity] = source_indices
+            # Inputs are read most significant first
+            self.step_weights[i, s, :arity] = [1 << (arity - 1 - j) for j in range(arity)]
+        
+        self.tables[i] = 0
+        self.tables[i, :len(row["table"])] = row["table"]
+        
+        self.copy_target[i] = -1
+        self.copy_source[i] = -1
+        for m, (target, source) in enumerate(row["copies"]):
+            self.copy_target[i, m] = target
+            self.copy_source[i, m] = source
+    
+    @staticmethod
+    def _row_dims(row: dict) -> Tuple[int, int, int, int, int]:
+        return (
+            len(row["values"]),
+            len(row["kinds"]),
+            max((len(s) for s in row["sources"]), default=0),
+            len(row["table"]),
+            len(row["copies"]),
+        )
+    
+    def add(self, neos: Sequence[Neo]):
+        """Append Neos as new rows (after the existing ones)."""
+        if not neos:
+            return
+        rows = [self._pack_row(neo.lio) for neo in neos]
+        start = len(self.neos)
+        count = len(rows)
+        
+        def extend(array: np.ndarray, fill: int) -> np.ndarray:
+            extra = np.full((count,) + array.shape[1:], fill, dtype=array.dtype)
+            return np.concatenate([array, extra])
+        
+        self.neos.extend(neos)
+        self.energy = np.concatenate([self.energy, [neo.energy for neo in neos]]).astype(np.int64)
+        self.size = np.concatenate([self.size, [neo.lio.get_size() for neo in neos]]).astype(np.int64)
+        self.input_index = extend(self.input_index, -1)
+        self.output_index = extend(self.output_index, -1)
+        self.values = extend(self.values, 0)
+        self.step_kind = extend(self.step_kind, 0)
+        self.step_target = extend(self.step_target, 0)
+        self.step_offset = extend(self.step_offset, 0)
+        self.step_sources = extend(self.step_sources, 0)
+        self.step_weights = extend(self.step_weights, 0)
+        self.tables = extend(self.tables, 0)
+        self.copy_target = extend(self.copy_target, -1)
+        self.copy_source = extend(self.copy_source, -1)
+        
+        dims = [max(d) for d in zip(*(self._row_dims(row) for row in rows))]
+        self._ensure_shape(*dims)
+        for k, row in enumerate(rows):
+            self._write_row(start + k, row)
+        self._schedule = None
+    
+    def remove(self, mask: np.ndarray):
+        """Remove the rows where mask is True, keeping the order of the others."""
+        keep = ~np.asarray(mask, dtype=bool)
+        self.neos = [neo for neo, k in zip(self.neos, keep) if k]
+        for name in ("energy", "size", "values", "input_index", "output_index", "step_kind",
+                     "step_target", "step_offset", "step_sources", "step_weights", "tables",
+                     "copy_target", "copy_source"):
+            setattr(self, name, getattr(self, name)[keep])
+        self._schedule = None
+    
+    def load(self, i: int):
+        """Re-read row i from its Neo (after a mutation changed its structure or state)."""
+        neo = self.neos[i]
+        row = self._pack_row(neo.lio)
+        self._ensure_shape(*self._row_dims(row))
+        self._write_row(i, row)
+        self.energy[i] = neo.energy
+        self.size[i] = neo.lio.get_size()
+        self._schedule = None
+    
+    def sync(self, i: int):
+        """Write row i's node values and energy back to its Neo."""
+        neo = self.neos[i]
+        nodes = neo.lio._get_plan().nodes
+        row = self.values[i]
+        for j, node in enumerate(nodes):
+            node.value = int(row[j])
+        neo.lio.update_memory()
+        neo.energy = int(self.energy[i])
+    
+    def sync_all(self):
+        """Write every row back to its Neo."""
+        for i in range(len(self.neos)):
+            self.sync(i)
+    
+    # ----- Evaluation -----
+    
+    def _build_schedule(self) -> List:
+        """Group the active rows of every step position (recomputed after packing changes)."""
+        schedule = []
+        for s in range(self.step_kind.shape[1]):
+            kinds = self.step_kind[:, s]
+            lex_rows = np.nonzero(kinds == _LEX)[0]
+            out_rows = np.nonzero(kinds == _OUTPUT)[0]
+            schedule.append((
+                lex_rows,
+                self.step_target[lex_rows, s],
+                self.step_sources[lex_rows, s],
+                self.step_weights[lex_rows, s],
+                self.step_offset[lex_rows, s],
+                out_rows,
+                self.step_target[out_rows, s],
+                self.step_sources[out_rows, s, 0],
+            ))
+        copies = []
+        for m in range(self.copy_target.shape[1]):
+            rows = np.nonzero(self.copy_target[:, m] >= 0)[0]
+            copies.append((rows, self.copy_target[rows, m], self.copy_source[rows, m]))
+        return [schedule, copies]
+    
+    def compute(self, inputs: np.ndarray):
+        """Receive one input per row and perform one computation step for all rows."""
+        if self._schedule is None:
+            self._schedule = self._build_schedule()
+        schedule, copies = self._schedule
+        values = self.values
+        
+        has_input = np.nonzero(self.input_index >= 0)[0]
+        values[has_input, self.input_index[has_input]] = np.asarray(inputs)[has_input]
+        snapshot = values.copy()
+        
+        for lex_rows, lex_targets, sources, weights, offsets, out_rows, out_targets, out_sources in schedule:
+            if len(lex_rows):
+                gathered = snapshot[lex_rows[:, None], sources]
+                index = (gathered * weights).sum(axis=1)
+                values[lex_rows, lex_targets] = self.tables[lex_rows, offsets + index]
+            if len(out_rows):
+                values[out_rows, out_targets] = values[out_rows, out_sources]
+        
+        for rows, targets, sources in copies:
+            values[rows, targets] = values[rows, sources]
+    
+    def get_outputs(self) -> np.ndarray:
+        """Current output prediction of every row (0 for Lios without an output node)."""
+        has_output = self.output_index >= 0
+        outputs = np.zeros(len(self.neos), dtype=np.int8)
+        rows = np.nonzero(has_output)[0]
+        outputs[rows] = self.values[rows, self.output_index[rows]]
+        return outputs
+    
+    def required_cost(self) -> np.ndarray:
+        """Run cost every row must pay this tick."""
+        return self.run_cost * self.size
+    
+    def step(self, inputs: np.ndarray, next_inputs: np.ndarray, neoverse) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Advance every row by one tick: receive input, compute, pay run cost and collect reward.
+        
+        Rows must be able to afford their run cost (remove dead rows first).
+        
+        Args:
+            inputs: Input u_t for every row
+            next_inputs: Actual next input u_{t+1} for every row
+            neoverse: NeoVerse used to compute rewards
+        
+        Returns:
+            Tuple of (predictions, rewards) arrays
+        """
+        self.compute(inputs)
+        predictions = self.get_outputs()
+        self.energy -= self.required_cost()
+        rewards = neoverse.compute_rewards(predictions, np.asarray(next_inputs), num_nodes=self.size)
+        self.energy += rewards
+        return predictions, rewards
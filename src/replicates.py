@@ -0,0 +1,252 @@
+"""Adaptive replicate allocation: run seeds in batches until each sweep point's confidence intervals are tight."""
+
+from typing import Any, Dict, List, Optional, Sequence
+from statistics import NormalDist
+import math
+
+import numpy as np
+
+from .config import SimulationConfig
+from .parallel import iter_simulations
+from .sweep import Sweep, SUMMARY_COLUMNS, _axis_dtype, apply_point
+
+
+def default_tolerances(base: SimulationConfig) -> Dict[str, float]:
+    """
+    CI half-widths of the default metrics: final accuracy to 0.02, final energy
+    and survival (num_ticks_run, the ticks the root lineage lived) to 5% of the
+    base config's starting energy and num_ticks.
+    """
+    return {
+        "final_accuracy": 0.02,
+        "final_energy": max(1.0, 0.05 * base.neo.energy),
+        "num_ticks_run": max(1.0, 0.05 * base.num_ticks),
+    }
+
+
+def t_cdf(t: float, df: int) -> float:
+    """CDF of Student's t distribution with integer df (closed form, a finite series in cos(atan(t / sqrt(df))))."""
+    theta = math.atan(t / math.sqrt(df))
+    c2 = math.cos(theta) ** 2
+    if df % 2:
+        # P(|T| < t) = 2/pi (theta + sin cos (1 + 2/3 cos^2 + 2*4/(3*5) cos^4 + ...))
+        term, total = 1.0, 1.0 if df > 1 else 0.0
+        for k in range(3, df - 1, 2):
+            term *= (k - 1) / k * c2
+            total += term
+        inside = 2 / math.pi * (theta + math.sin(theta) * math.cos(theta) * total)
+    else:
+        # P(|T| < t) = sin (1 + 1/2 cos^2 + 1*3/(2*4) cos^4 + ...)
+        term = total = 1.0
+        for k in range(2, df, 2):
+            term *= (k - 1) / k * c2
+            total += term
+        inside = math.sin(theta) * total
+    return 0.5 + inside / 2
+
+
+def t_quantile(p: float, df: int) -> float:
+    """
+    Quantile of Student's t distribution with integer df.
+    
+    Closed form for df 1 and 2; otherwise Newton's method on t_cdf, started
+    from a Cornish-Fisher expansion around the normal quantile (already within
+    a few percent, so a handful of steps reach full precision).
+    """
+    if df <= 0:
+        return math.inf
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+    if p < 0.5:
+        return -t_quantile(1 - p, df)
+    z = NormalDist().inv_cdf(p)
+    t = (z + (z ** 3 + z) / (4 * df)
+         + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * df ** 2)
+         + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * df ** 3))
+    log_scale = math.lgamma((df + 1) / 2) - math.lgamma(df / 2) - 0.5 * math.log(df * math.pi)
+    for _ in range(50):
+        density = math.exp(log_scale - (df + 1) / 2 * math.log1p(t * t / df))
+        step = (t_cdf(t, df) - p) / density
+        t -= step
+        if abs(step) <= 1e-12 * max(1.0, abs(t)):
+            break
+    return t
+
+
+def half_width(values: Sequence[float], confidence: float = 0.95) -> float:
+    """Half-width of the t confidence interval of the mean (inf with fewer than 2 values)."""
+    n = len(values)
+    if n < 2:
+        return math.inf
+    std = float(np.std(values, ddof=1))
+    return t_quantile(0.5 + confidence / 2, n - 1) * std / math.sqrt(n)
+
+
+class ReplicateScheduler:
+    """
+    Allocates replicate seeds to the points of a sweep in batches.
+    
+    Every point starts with min_replicates seeds. After each round, a point is
+    done once the confidence interval of every metric's mean is within its
+    tolerance (or it has max_replicates); each remaining point gets another
+    batch. If the budget (total runs) can't cover every remaining point, the
+    noisiest points (largest interval relative to its tolerance) go first, so
+    compute is spent where the estimates are least certain.
+    
+    Replicate r of every point uses seed first_seed + r at seed_path, so points
+    are compared on the same seeds.
+    """
+    
+    def __init__(self, sweep: Sweep, tolerances: Dict[str, float], seed_path: str = "neoverse.seed",
+                 first_seed: int = 0, min_replicates: int = 4, batch: int = 4, max_replicates: int = 64,
+                 budget: Optional[int] = None, confidence: float = 0.95):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            sweep: Sweep whose points get replicates (it must not sweep seed_path itself)
+            tolerances: Largest acceptable CI half-width per metric (SUMMARY_COLUMNS name)
+            seed_path: Config path the replicate seed is set at
+            first_seed: Seed of the first replicate
+            min_replicates: Replicates every point gets before it can stop (at least 2)
+            batch: Replicates added to an unfinished point per round
+            max_replicates: Replicates after which a point stops regardless
+            budget: Total runs allowed (default: unlimited, i.e. max_replicates per point)
+            confidence: Confidence level of the intervals
+        
+        Raises:
+            ValueError: If a metric is unknown or the settings are inconsistent
+        """
+        unknown = set(tolerances) - set(SUMMARY_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown metrics: {sorted(unknown)}")
+        if seed_path in sweep.axes:
+            raise ValueError(f"The sweep already varies {seed_path!r}")
+        if not 2 <= min_replicates <= max_replicates or batch < 1:
+            raise ValueError("Need 2 <= min_replicates <= max_replicates and batch >= 1")
+        self.sweep = sweep
+        self.tolerances = dict(tolerances)
+        self.seed_path = seed_path
+        self.first_seed = first_seed
+        self.min_replicates = min_replicates
+        self.batch = batch
+        self.max_replicates = max_replicates
+        self.budget = budget
+        self.confidence = confidence
+        self.points: List[Dict[str, Any]] = list(sweep.points())
+        self.samples: List[Dict[str, List[float]]] = [{metric: [] for metric in tolerances} for _ in self.points]
+        self.runs: List[int] = [0] * len(self.points)  # Replicates run (including failed ones)
+        self.used = 0
+    
+    def half_widths(self, point: int) -> Dict[str, float]:
+        """Current CI half-width of each metric at a point."""
+        return {metric: half_width(values, self.confidence) for metric, values in self.samples[point].items()}
+    
+    def noise(self, point: int) -> float:
+        """Largest ratio of a metric's CI half-width to its tolerance (<= 1 once the point is precise enough)."""
+        ratios = [width / self.tolerances[metric] if self.tolerances[metric] > 0 else math.inf
+                  for metric, width in self.half_widths(point).items()]
+        return max(ratios, default=0.0)
+    
+    def done(self, point: int) -> bool:
+        """Whether a point needs no more replicates."""
+        if self.runs[point] >= self.max_replicates:
+            return True
+        return self.runs[point] >= self.min_replicates and self.noise(point) <= 1.0
+    
+    def next_round(self) -> List[tuple]:
+        """
+        (point, replicate) pairs to run next; empty when every point is done or the budget is spent.
+        """
+        remaining = math.inf if self.budget is None else self.budget - self.used
+        open_points = [point for point in range(len(self.points)) if not self.done(point)]
+        # Noisiest first (points still below min_replicates have infinite noise)
+        open_points.sort(key=lambda point: -self.noise(point) if self.runs[point] >= self.min_replicates else -math.inf)
+        pairs = []
+        for point in open_points:
+            wanted = self.min_replicates if self.runs[point] == 0 else self.batch
+            count = int(min(wanted, self.max_replicates - self.runs[point], remaining))
+            if count <= 0:
+                break
+            pairs.extend((point, self.runs[point] + r) for r in range(count))
+            remaining -= count
+        return pairs
+    
+    def config(self, point: int, replicate: int) -> SimulationConfig:
+        """The config of one replicate of a point."""
+        values = dict(self.points[point], **{self.seed_path: self.first_seed + replicate})
+        return apply_point(self.sweep.base, values, name=f"{self.sweep.point_name(point, self.points[point])}#{replicate}")
+    
+    def record(self, point: int, summary: Optional[Dict[str, Any]]):
+        """Add one finished replicate (summary None if it failed)."""
+        self.runs[point] += 1
+        self.used += 1
+        if summary is not None:
+            for metric, values in self.samples[point].items():
+                values.append(float(summary[metric]))
+    
+    def table(self) -> np.ndarray:
+        """
+        One row per point: index, axis values, replicates run, done flag and,
+        per metric, the mean and the CI half-width.
+        """
+        paths = list(self.points[0]) if self.points else []
+        dtype = np.dtype([("index", np.int64)]
+                         + [(path, _axis_dtype([point[path] for point in self.points])) for path in paths]
+                         + [("n", np.int64), ("done", np.bool_)]
+                         + [(f"{metric}_{stat}", np.float64) for metric in self.tolerances for stat in ("mean", "ci")])
+        table = np.zeros(len(self.points), dtype=dtype)
+        table["index"] = np.arange(len(self.points))
+        for path in paths:
+            values = [point[path] for point in self.points]
+            table[path] = [getattr(v, "value", v) for v in values] if table.dtype[path].kind == "U" else values
+        for point in range(len(self.points)):
+            table["n"][point] = self.runs[point]
+            table["done"][point] = self.done(point)
+            for metric, width in self.half_widths(point).items():
+                values = self.samples[point][metric]
+                table[f"{metric}_mean"][point] = np.mean(values) if values else np.nan
+                table[f"{metric}_ci"][point] = width
+        return table
+
+
+def run_adaptive(sweep: Sweep, tolerances: Optional[Dict[str, float]] = None, workers: Optional[int] = None,
+                 seed: int = 0, progress: bool = False, **settings) -> np.ndarray:
+    """
+    Run a sweep with adaptively allocated replicate seeds (see ReplicateScheduler).
+    
+    Each round's replicates run in worker processes into SummarySinks; rounds
+    continue until every point is done or the budget is spent.
+    
+    Args:
+        sweep: Sweep whose points get replicates
+        tolerances: CI half-width per metric (default: default_tolerances(sweep.base))
+        workers: Number of worker processes (default: os.cpu_count())
+        seed: Seed of the per-run random seeds (for Evos without a seed)
+        progress: Print a line per round
+        **settings: Further ReplicateScheduler arguments (batch, max_replicates, budget, ...)
+    
+    Returns:
+        ReplicateScheduler.table() after the last round
+    """
+    if tolerances is None:
+        tolerances = default_tolerances(sweep.base)
+    scheduler = ReplicateScheduler(sweep, tolerances, **settings)
+    round_number = 0
+    while True:
+        pairs = scheduler.next_round()
+        if not pairs:
+            break
+        round_number += 1
+        configs = (scheduler.config(point, replicate) for point, replicate in pairs)
+        for outcome in iter_simulations(configs, workers=workers, seed=seed, summarize=True):
+            if outcome.error is not None and progress:
+                print(f"Error running {outcome.name}:\n{outcome.error}")
+            scheduler.record(pairs[outcome.index][0], outcome.result if outcome.error is None else None)
+        if progress:
+            done = sum(scheduler.done(point) for point in range(len(scheduler.points)))
+            print(f"  round {round_number}: {len(pairs)} runs, {done}/{len(scheduler.points)} points done, "
+                  f"{scheduler.used} runs in total")
+    return scheduler.table()
@@ -0,0 +1,337 @@
+"""Binary columnar result logs: writer and lazy, memory-mapped reader."""
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+from collections import OrderedDict
+import json
+import os
+
+import numpy as np
+
+from .history import Column, LineageHistory, AccuracyHistory, MutationLog, MUTATION_DTYPE, NeoLineage, SimulationResult
+from .sinks import ChunkedDiskSink, LineageBirth, TICK_COLUMNS, MUTATIONS_FILE, chunk_path, build_result
+
+
+# File holding a log's metadata and the directory of each simulation
+LOG_INDEX = "log.json"
+
+# History fields a lineage can be loaded with
+FIELDS = ("energy_history", "accuracy_history", "predictions", "actuals", "rewards",
+          "size_history", "mutations_applied")
+
+# Fields that include the entries inherited from the parent lineage
+INHERITED_FIELDS = ("predictions", "actuals", "rewards")
+
+# Decompressed chunk columns kept in memory per reader
+MAX_CACHED_CHUNKS = 32
+
+
+def _lineage_birth(lineage: NeoLineage) -> LineageBirth:
+    """Recover a lineage's birth record (branch and inherited counts) from its histories."""
+    own = len(lineage.size_history) - 1
+    branch = len(lineage.predictions) - own
+    accuracy = lineage.accuracy_history
+    if isinstance(accuracy, AccuracyHistory):
+        correct, head = accuracy.correct, accuracy.head
+    else:
+        # Plain lists (e.g. a JSON log): count the inherited hits
+        predictions = np.asarray(lineage.predictions[:branch])
+        actuals = np.asarray(lineage.actuals[:branch])
+        correct = int(np.count_nonzero(predictions == actuals))
+        head = accuracy[0] if len(accuracy) > own else None
+    return LineageBirth(
+        lineage_id=lineage.lineage_id,
+        parent_id=lineage.parent_id,
+        birth_tick=lineage.birth_tick,
+        energy=int(lineage.energy_history[0]),
+        size=int(lineage.size_history[0]),
+        branch=branch,
+        correct=correct,
+        accuracy=head,
+    )
+
+
+def write_result(result: SimulationResult, directory: str, chunk_rows: int = 1 << 20,
+                 compress: bool = False):
+    """
+    Write a SimulationResult in ChunkedDiskSink's format.
+    
+    Each lineage's own entries become rows (its inherited prefix is stored once,
+    with the ancestor that recorded it), so the log can be read back lazily with
+    RunReader.
+    
+    Raises:
+        ValueError: If an offspring's inherited entries don't match its parent's
+    """
+    sink = ChunkedDiskSink(directory, chunk_rows=chunk_rows, compress=compress)
+    by_id = {lineage.lineage_id: lineage for lineage in result.lineages}
+    # Lineage IDs are assigned at birth, so this is birth order
+    for lineage in sorted(result.lineages, key=lambda l: l.lineage_id):
+        birth = _lineage_birth(lineage)
+        parent = by_id.get(lineage.parent_id)
+        if birth.branch and parent is not None and not isinstance(lineage.predictions, LineageHistory):
+            for name in INHERITED_FIELDS:
+                if getattr(lineage, name)[:birth.branch] != getattr(parent, name)[:birth.branch]:
+                    raise ValueError(f"Lineage {lineage.lineage_id}'s {name} don't start with its parent's")
+        sink.lineage_born(birth)
+        
+        own = len(lineage.size_history) - 1
+        sink.append_rows(lineage.birth_tick + np.arange(own), {
+            "lineage_id": np.full(own, lineage.lineage_id),
+            "predictions": np.asarray(lineage.predictions[birth.branch:], dtype=np.int8),
+            "actuals": np.asarray(lineage.actuals[birth.branch:], dtype=np.int8),
+            "rewards": np.asarray(lineage.rewards[birth.branch:], dtype=np.int32),
+            "energy_history": np.asarray(lineage.energy_history[1:own + 1], dtype=np.int32),
+            "size_history": np.asarray(lineage.size_history[1:], dtype=np.int32),
+        })
+        sink.append_mutations(lineage.lineage_id, lineage.mutations_applied)
+    
+    # Replay deaths in the result's order so the index lists lineages the same way
+    for lineage in result.lineages:
+        if lineage.death_tick is not None:
+            sink.lineage_died(lineage.lineage_id, lineage.death_tick, int(lineage.energy_history[-1]))
+    sink.close()
+
+
+class RunReader:
+    """
+    Lazy reader of one run written by ChunkedDiskSink or write_result.
+    
+    Only index.json is read up front. Loading a lineage reads just the chunks
+    holding its rows and just the requested fields; uncompressed chunks are
+    memory-mapped, compressed ones are decompressed on first use and cached.
+    Lineages inherit their first entries from their ancestors, so loading
+    predictions, actuals or rewards also reads the ancestors' rows.
+    """
+    
+    def __init__(self, directory: str):
+        """
+        Open a run directory.
+        
+        Args:
+            directory: Directory containing index.json and the chunk files
+        """
+        self.directory = directory
+        with open(os.path.join(directory, "index.json")) as f:
+            self.index = json.load(f)
+        self.compressed = self.index.get("compressed", False)
+        self.table: Dict[int, Dict[str, Any]] = {entry["lineage_id"]: entry for entry in self.index["lineages"]}
+        self._chunks: 'OrderedDict[tuple, np.ndarray]' = OrderedDict()
+        self._mutations: Optional[np.ndarray] = None  # Mutation records sorted by lineage
+    
+    @property
+    def lineage_ids(self) -> List[int]:
+        """Lineage IDs in result order (dead lineages by death, then live ones)."""
+        return [entry["lineage_id"] for entry in self.index["lineages"]]
+    
+    def _chunk(self, column: str, chunk: int) -> np.ndarray:
+        """One column of one chunk (memory-mapped, or decompressed and cached)."""
+        key = (column, chunk)
+        array = self._chunks.get(key)
+        if array is not None:
+            self._chunks.move_to_end(key)
+            return array
+        path = chunk_path(self.directory, column, chunk, self.compressed)
+        if self.compressed:
+            with np.load(path) as data:
+                array = data["values"]
+        else:
+            array = np.load(path, mmap_mode="r")
+        self._chunks[key] = array
+        if len(self._chunks) > MAX_CACHED_CHUNKS:
+            self._chunks.popitem(last=False)
+        return array
+    
+    def rows(self, lineage_id: int, column: str) -> np.ndarray:
+        """The lineage's own rows of a column (a memory-mapped view if they sit in one chunk)."""
+        entry = self.table[lineage_id]
+        if entry["chunks"] is None:
+            return np.zeros(0, dtype=TICK_COLUMNS[column])
+        first, last = entry["chunks"]
+        pieces = []
+        for chunk in range(first, last + 1):
+            ids = self._chunk("lineage_id", chunk)
+            start = np.searchsorted(ids, lineage_id, side="left")
+            stop = np.searchsorted(ids, lineage_id, side="right")
+            if stop > start:
+                pieces.append(self._chunk(column, chunk)[start:stop])
+        if len(pieces) == 1:
+            return pieces[0]
+        return np.concatenate(pieces) if pieces else np.zeros(0, dtype=TICK_COLUMNS[column])
+    
+    def mutations(self, lineage_id: int) -> MutationLog:
+        """The lineage's mutation events (mutations.bin is read on first use)."""
+        if self._mutations is None:
+            dtype = np.dtype([tuple(field) for field in self.index["mutation_columns"]])
+            records = np.fromfile(os.path.join(self.directory, MUTATIONS_FILE), dtype=dtype)
+            # Stable, so each lineage's events stay in tick order
+            self._mutations = records[np.argsort(records["lineage_id"], kind="stable")]
+        ids = self._mutations["lineage_id"]
+        owned = self._mutations[np.searchsorted(ids, lineage_id, side="left"):
+                                np.searchsorted(ids, lineage_id, side="right")]
+        events = np.empty(len(owned), dtype=MUTATION_DTYPE)
+        for name in MUTATION_DTYPE.names:
+            events[name] = owned[name]
+        return MutationLog.from_array(events)
+    
+    def _histories(self, lineage_id: int, column: str, cache: Dict) -> LineageHistory:
+        """A lineage's history of an inherited field, sharing prefixes through the parent chain."""
+        chain = []
+        current: Optional[int] = lineage_id
+        while current is not None and (current, column) not in cache:
+            chain.append(current)
+            entry = self.table[current]
+            current = entry["parent_id"] if entry["branch"] else None
+        for current in reversed(chain):
+            entry = self.table[current]
+            parent = cache.get((entry["parent_id"], column)) if entry["branch"] else None
+            cache[(current, column)] = LineageHistory(
+                own=Column.from_array(self.rows(current, column)),
+                parent=parent,
+                branch=entry["branch"],
+            )
+        return cache[(lineage_id, column)]
+    
+    def lineage(self, lineage_id: int, fields: Optional[Iterable[str]] = None,
+                cache: Optional[Dict] = None) -> NeoLineage:
+        """
+        Load one lineage.
+        
+        Args:
+            lineage_id: Lineage to load
+            fields: History fields to load (default: all of FIELDS); the others are empty lists
+            cache: Histories already loaded (shared between calls to share prefixes)
+        
+        Returns:
+            NeoLineage whose histories are read-only columns and views
+        """
+        fields = set(FIELDS if fields is None else fields)
+        unknown = fields - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown fields: {sorted(unknown)}")
+        cache = cache if cache is not None else {}
+        entry = self.table[lineage_id]
+        died = entry["death_tick"] is not None
+        values: Dict[str, Sequence] = {name: [] for name in FIELDS}
+        
+        for name in INHERITED_FIELDS:
+            if name in fields:
+                values[name] = self._histories(lineage_id, name, cache)
+        if "accuracy_history" in fields:
+            own_predictions = Column.from_array(self.rows(lineage_id, "predictions"))
+            own_actuals = Column.from_array(self.rows(lineage_id, "actuals"))
+            values["accuracy_history"] = AccuracyHistory(
+                own_predictions, own_actuals, correct=entry["correct"], total=entry["branch"],
+                head=entry["accuracy"] if entry["parent_id"] is not None else None
+            )
+        if "energy_history" in fields:
+            energy = [np.array([entry["energy"]]), self.rows(lineage_id, "energy_history")]
+            if died:
+                energy.append(np.array([entry["final_energy"]]))
+            values["energy_history"] = Column.from_array(np.concatenate(energy).astype(np.int32))
+        if "size_history" in fields:
+            size = np.concatenate([np.array([entry["size"]]), self.rows(lineage_id, "size_history")])
+            values["size_history"] = Column.from_array(size.astype(np.int32))
+        if "mutations_applied" in fields:
+            values["mutations_applied"] = self.mutations(lineage_id)
+        
+        return NeoLineage(
+            lineage_id=lineage_id,
+            parent_id=entry["parent_id"],
+            birth_tick=entry["birth_tick"],
+            death_tick=entry["death_tick"],
+            **values
+        )
+    
+    def result(self, lineage_ids: Optional[Iterable[int]] = None,
+               fields: Optional[Iterable[str]] = None) -> SimulationResult:
+        """
+        Load the run as a SimulationResult.
+        
+        Args:
+            lineage_ids: Lineages to load (default: all); the main histories come
+                         from the root lineage if it is among them
+            fields: History fields to load (default: all)
+        """
+        wanted = set(self.lineage_ids if lineage_ids is None else lineage_ids)
+        fields = list(FIELDS if fields is None else fields)
+        cache: Dict = {}
+        lineages = [self.lineage(lineage_id, fields, cache) for lineage_id in self.lineage_ids
+                    if lineage_id in wanted]
+        return build_result(lineages)
+
+
+def write_log(path: str, results: Dict[str, SimulationResult], metadata: Dict[str, Any],
+              summaries: Optional[Dict[str, Dict]] = None, chunk_rows: int = 1 << 20,
+              compress: bool = True):
+    """
+    Write several results as one log directory.
+    
+    The directory holds log.json (the metadata, and for each simulation its
+    summary and subdirectory) and one write_result directory per simulation.
+    
+    Args:
+        path: Log directory (created if needed)
+        results: Results by simulation name
+        metadata: JSON-serializable metadata (timestamp, configs, ...)
+        summaries: Optional JSON-serializable summary per simulation name
+        chunk_rows: Rows per chunk file
+        compress: Write compressed chunks
+    """
+    os.makedirs(path, exist_ok=True)
+    entries = {}
+    for i, (name, result) in enumerate(results.items()):
+        directory = f"{i:03d}"
+        write_result(result, os.path.join(path, directory), chunk_rows=chunk_rows, compress=compress)
+        entries[name] = {
+            "config_name": name,
+            "directory": directory,
+            "summary": (summaries or {}).get(name),
+        }
+    with open(os.path.join(path, LOG_INDEX), "w") as f:
+        json.dump(dict(metadata, results=entries), f, indent=2)
+
+
+class ResultLog:
+    """Lazy reader of a log written by write_log: one RunReader per simulation."""
+    
+    def __init__(self, path: str):
+        """
+        Open a log directory.
+        
+        Args:
+            path: Directory containing log.json
+        """
+        self.path = path
+        with open(os.path.join(path, LOG_INDEX)) as f:
+            self.data = json.load(f)
+        self._runs: Dict[str, RunReader] = {}
+    
+    @property
+    def names(self) -> List[str]:
+        """Simulation names in the order they were logged."""
+        return list(self.data["results"])
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Everything in log.json except the per-simulation entries."""
+        return {key: value for key, value in self.data.items() if key != "results"}
+    
+    def summary(self, name: str) -> Optional[Dict]:
+        """The summary logged for a simulation."""
+        return self.data["results"][name]["summary"]
+    
+    def run(self, name: str) -> RunReader:
+        """The reader of one simulation."""
+        if name not in self._runs:
+            directory = self.data["results"][name]["directory"]
+            self._runs[name] = RunReader(os.path.join(self.path, directory))
+        return self._runs[name]
+    
+    def load(self, name: str, lineage_ids: Optional[Iterable[int]] = None,
+             fields: Optional[Iterable[str]] = None) -> SimulationResult:
+        """Load one simulation (optionally only some lineages and fields)."""
+        return self.run(name).result(lineage_ids, fields)
+    
+    def load_all(self, fields: Optional[Iterable[str]] = None) -> Dict[str, SimulationResult]:
+        """Load every simulation."""
+        return {name: self.load(name, fields=fields) for name in self.names}
@@ -1,43 +1,27 @@
 """NeoCycle: The main simulation loop for Neosis."""
 
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from .neo import Neo
 from .lio import Lio
 from .evo import Evo
 from .neoverse import NeoVerse
+from .population import PopulationEngine
+from .history import NeoLineage, SimulationResult
+from .sinks import ResultSink, InMemorySink, LineageBirth, TickBatch, TickChunk
 from .types import Mutation, MutationType, Edge, Node, NodeType, Lex
 from .config import SimulationConfig
+from .factories import get_neo_factory
+from .parallel import run_simulations_parallel
+from .cache import ResultCache
 
 
-@dataclass
-class NeoLineage:
-    """Results for a single Neo lineage (parent and its descendants)."""
-    lineage_id: int
-    parent_id: Optional[int]  # None for root
-    energy_history: List[int]
-    accuracy_history: List[float]
-    predictions: List[int]
-    actuals: List[int]
-    rewards: List[int]
-    size_history: List[int]
-    mutations_applied: List[str]
-    birth_tick: int  # When this lineage was created
-    death_tick: Optional[int]  # When this lineage died (None if still alive)
-
-
-@dataclass
-class SimulationResult:
-    """Results from a simulation run."""
-    energy_history: List[int]
-    accuracy_history: List[float]
-    predictions: List[int]
-    actuals: List[int]
-    rewards: List[int]
-    size_history: List[int]
-    mutations_applied: List[str]
-    lineages: List[NeoLineage]  # All Neo lineages (offsprings)
+# Shortest stretch of event-free ticks the sequential loop runs with run_chunk
+# (shorter ones cost less tick by tick than the chunk's array setup)
+MIN_CHUNK_TICKS = 8
 
 
 class NeoCycle:
@@ -61,7 +45,8 @@ class NeoCycle:
         self.neoverse = neoverse
         self.run_cost = run_cost
     
-    def run(self, num_ticks: int, enable_offspring: bool = True) -> SimulationResult:
+    def run(self, num_ticks: int, enable_offspring: bool = True, vectorized: bool = False,
+            sink: Optional[ResultSink] = None) -> Optional[SimulationResult]:
         """
         Run the simulation for a specified number of ticks.
         
@@ -70,56 +55,135 @@ class NeoCycle:
             enable_offspring: If True, when a mutation happens, the parent stops mutating 
                             and creates an offspring. If False, mutations apply directly 
                             to the Neo (original behavior).
-            
+            vectorized: If True, advance all active Neos together with a PopulationEngine
+                        (see _run_vectorized)
+            sink: ResultSink receiving the ticks and lineage events as they happen
+                  (default: an InMemorySink)
+        
         Returns:
-            SimulationResult with history of the simulation and all lineages
+            What sink.close() returns: with the default sink, a SimulationResult with
+            history of the simulation and all lineages
+        """
+        sink = sink if sink is not None else InMemorySink()
+        self._sink = sink
+        self._next_lineage_id = 1
+        sink.lineage_born(LineageBirth(lineage_id=0, parent_id=None, birth_tick=0,
+                                       energy=self.neo.energy, size=self.neo.get_size()))
+        
+        if vectorized:
+            self._run_vectorized(num_ticks, enable_offspring)
+        else:
+            self._run_sequential(num_ticks, enable_offspring)
+        return sink.close()
+    
+    def run_chunk(self, neo: Neo, t0: int, k: int) -> TickChunk:
         """
-        # Track active Neos: (neo, lineage_id, parent_id, birth_tick, history)
-        active_neos: List[Tuple[Neo, int, Optional[int], int, Dict]] = [
-            (self.neo, 0, None, 0, {
-                'energy_history': [self.neo.energy],
-                'accuracy_history': [],
-                'predictions': [],
-                'actuals': [],
-                'rewards': [],
-                'size_history': [self.neo.get_size()],
-                'mutations_applied': []
-            })
-        ]
+        Run up to k consecutive ticks of a Neo whose structure doesn't change in between.
         
-        next_lineage_id = 1
-        all_lineages: List[NeoLineage] = []
+        Follows the per-tick order (death check, receive u_t, compute, pay the run
+        cost, reward against u_{t+1}, update memory) but reads the input tape
+        slice once, evaluates the Lio with Lio.compute_sequence and scores the
+        rewards and energy as arrays. The caller must make sure no mutation
+        attempt falls in the ticks.
         
-        for t in range(num_ticks):
+        Rewards are never negative, so a Neo with energy E and run cost c survives
+        at least E // c ticks; the ticks are evaluated in batches of that length,
+        which stops exactly at the death tick without evaluating past it.
+        
+        Args:
+            neo: Neo to run (its Lio, memory and energy are updated)
+            t0: First tick
+            k: Number of ticks
+        
+        Returns:
+            TickChunk of the ticks run (lineage_id 0; set it before recording). It is
+            shorter than k if the Neo died: at tick t0 + len(chunk), with neo.energy left.
+        """
+        size = neo.lio.get_size()
+        cost = self.run_cost * size
+        tape = self.neoverse.get_inputs(t0, t0 + k + 1)
+        predictions, rewards, energy = [], [], []
+        done = 0
+        while done < k and neo.energy >= cost:
+            count = min(k - done, neo.energy // cost) if cost > 0 else k - done
+            outputs = neo.lio.compute_sequence(tape[done:done + count])
+            batch_rewards = self.neoverse.compute_rewards(outputs, tape[done + 1:done + count + 1], num_nodes=size)
+            batch_energy = neo.energy + np.cumsum(batch_rewards - cost, dtype=np.int64)
+            neo.energy = int(batch_energy[-1])
+            predictions.append(outputs)
+            rewards.append(batch_rewards)
+            energy.append(batch_energy)
+            done += count
+        
+        def joined(parts: List[np.ndarray], dtype) -> np.ndarray:
+            return np.concatenate(parts) if parts else np.zeros(0, dtype=dtype)
+        
+        return TickChunk(
+            lineage_id=0,
+            start=t0,
+            predictions=joined(predictions, np.int8),
+            actuals=tape[1:done + 1],
+            rewards=joined(rewards, np.int64),
+            energy=joined(energy, np.int64),
+            size=size,
+        )
+    
+    def _run_sequential(self, num_ticks: int, enable_offspring: bool):
+        """
+        Run the simulation one Neo at a time.
+        
+        While a single Neo is alive, the ticks up to its Evo's next mutation attempt
+        (Evo.ticks_to_attempt) can't change its structure, so they run as one
+        run_chunk and are recorded with the sink's record_chunk; the per-tick loop
+        handles the ticks with a mutation attempt and those with several Neos alive.
+        """
+        sink = self._sink
+        # Track active Neos: (neo, lineage_id, tally)
+        active_neos: List[Tuple[Neo, int, Dict]] = [(self.neo, 0, self._new_tally())]
+        
+        t = 0
+        while t < num_ticks:
+            if len(active_neos) == 1:
+                neo, lineage_id, tally = active_neos[0]
+                k = num_ticks - t if neo.evo is None else min(num_ticks - t, neo.evo.ticks_to_attempt)
+                if k >= MIN_CHUNK_TICKS:
+                    chunk = self.run_chunk(neo, t, k)
+                    chunk.lineage_id = lineage_id
+                    self._record_chunk(tally, chunk)
+                    sink.record_chunk(chunk)
+                    if neo.evo:
+                        neo.evo.skip(len(chunk))
+                    t += len(chunk)
+                    if len(chunk) < k:
+                        # Neo dies - record final state
+                        neo.lio.sync_nodes()
+                        sink.lineage_died(lineage_id, t, neo.energy)
+                        active_neos = []
+                        break
+                    continue
+            
             new_offsprings = []
+            births = []
             dead_lineages = []
+            batch = TickBatch(t, [], [], [], [], [], [])
+            
+            # The input tape is read once per tick and shared by all Neos
+            u_t = self.neoverse.get_input(t)
+            u_t_plus_1 = self.neoverse.get_input(t + 1)
             
             # Process each active Neo
-            for neo, lineage_id, parent_id, birth_tick, history in active_neos:
+            for neo, lineage_id, tally in active_neos:
                 # Check if Neo has enough energy
                 required_cost = self.run_cost * neo.lio.get_size()
                 
                 if neo.energy < required_cost:
                     # Neo dies - record final state
-                    history['energy_history'].append(neo.energy)
-                    all_lineages.append(NeoLineage(
-                        lineage_id=lineage_id,
-                        parent_id=parent_id,
-                        energy_history=history['energy_history'],
-                        accuracy_history=history['accuracy_history'],
-                        predictions=history['predictions'],
-                        actuals=history['actuals'],
-                        rewards=history['rewards'],
-                        size_history=history['size_history'],
-                        mutations_applied=history['mutations_applied'],
-                        birth_tick=birth_tick,
-                        death_tick=t
-                    ))
+                    neo.lio.sync_nodes()
+                    sink.lineage_died(lineage_id, t, neo.energy)
                     dead_lineages.append((neo, lineage_id))
                     continue
                 
                 # Step 1: Receive input
-                u_t = self.neoverse.get_input(t)
                 neo.lio.receive_input(u_t)
                 
                 # Step 2: Compute
@@ -127,135 +191,216 @@ class NeoCycle:
                 
                 # Step 3: Get prediction
                 y_t = neo.lio.get_output()
-                history['predictions'].append(y_t)
                 
                 # Step 4: Pay run cost
                 neo.pay_energy(required_cost)
                 
-                # Step 5: Get next input and compute reward
-                u_t_plus_1 = self.neoverse.get_input(t + 1)
-                history['actuals'].append(u_t_plus_1)
+                # Step 5: Compute reward against the next input
                 reward = self.neoverse.compute_reward(y_t, u_t_plus_1, num_nodes=neo.lio.get_size())
-                history['rewards'].append(reward)
                 
                 # Step 6: Receive reward
                 neo.receive_reward(reward)
-                history['energy_history'].append(neo.energy)
                 
-                # Step 7: Update accuracy (per-lineage)
-                correct_in_lineage = sum(1 for i, p in enumerate(history['predictions']) 
-                                        if i < len(history['actuals']) and p == history['actuals'][i])
-                total_in_lineage = len(history['predictions'])
-                accuracy = correct_in_lineage / total_in_lineage if total_in_lineage > 0 else 0.0
-                history['accuracy_history'].append(accuracy)
+                # Step 7: Record the tick and update accuracy (per-lineage)
+                self._record_tick(tally, y_t == u_t_plus_1)
+                batch.lineage_ids.append(lineage_id)
+                batch.predictions.append(y_t)
+                batch.actuals.append(u_t_plus_1)
+                batch.rewards.append(reward)
+                batch.energy.append(neo.energy)
                 
-                # Step 8: Check for mutations (only if Evo exists and hasn't been disabled)
-                if neo.evo:
-                    next_tick_run_cost = self.run_cost * neo.lio.get_size()
-                    safety_buffer = max(1, next_tick_run_cost // 2)
-                    reserved_energy = next_tick_run_cost + safety_buffer
-                    available_for_mutations = max(0, neo.energy - reserved_energy)
-                    
-                    if available_for_mutations > 0:
-                        applied_mutations = neo.evo.apply_mutations(neo.lio, available_for_mutations)
-                        
-                        if applied_mutations:
-                            # Record mutations and pay costs
-                            for mutation in applied_mutations:
-                                cost = neo.lio.get_mutation_cost(mutation.mutation_type)
-                                neo.pay_energy(cost)
-                                history['mutations_applied'].append(f"t={t}: {mutation.mutation_type.value}")
-                            
-                            if enable_offspring:
-                                # Create offspring with mutated state
-                                offspring = neo.create_offspring()
-                                
-                                # Inherit parent's history up to current tick (t)
-                                # At the time of offspring creation (after step 7), the parent has:
-                                # - Made t+1 predictions (indices 0 to t, including the one just made at tick t)
-                                # - Received t+1 actuals (indices 0 to t, including the one just received at tick t)
-                                # - Has t+1 accuracy values (indices 0 to t)
-                                # We want to inherit exactly t predictions and t actuals (up to but not including tick t)
-                                # This matches what the parent had at the END of tick t-1, which is what we want
-                                parent_predictions = list(history['predictions'][:t])  # First t predictions (indices 0 to t-1)
-                                parent_actuals = list(history['actuals'][:t])  # First t actuals (indices 0 to t-1)
-                                
-                                # Use parent's accuracy at tick t (the last accuracy, which is the current tick's accuracy)
-                                # This is the accuracy the parent had at the end of tick t, which is what we want to inherit
-                                parent_accuracy = history['accuracy_history'][-1] if history['accuracy_history'] else 0.0
-                                
-                                new_offsprings.append((offspring, next_lineage_id, lineage_id, t + 1, {
-                                    'energy_history': [offspring.energy],
-                                    'accuracy_history': [parent_accuracy],  # Start with parent's accuracy at tick t-1
-                                    'predictions': parent_predictions,  # Inherit parent's prediction history up to tick t-1
-                                    'actuals': parent_actuals,  # Inherit parent's actual history up to tick t-1
-                                    'rewards': list(history['rewards'][:t]),  # Inherit parent's reward history up to tick t-1
-                                    'size_history': [offspring.get_size()],
-                                    'mutations_applied': []
-                                }))
-                                next_lineage_id += 1
-                                
-                                # Disable mutations on parent (remove Evo)
-                                neo.evo = None
-                            # If enable_offspring=False, mutations apply directly and Neo continues mutating
+                # Step 8: Mutate when the Evo's next attempt is due (only if Evo exists and hasn't been disabled)
+                if neo.evo and neo.evo.attempt_due():
+                    offspring = self._mutate(neo, lineage_id, tally, t, enable_offspring)
+                    if offspring is not None:
+                        new_offsprings.append(offspring[0])
+                        births.append(offspring[1])
                 
                 # Step 9: Update memory
                 neo.lio.update_memory()
-                history['size_history'].append(neo.get_size())
+                batch.size.append(neo.get_size())
+            
+            if len(batch):
+                sink.record_ticks(batch)
             
             # Remove dead lineages
-            active_neos = [(n, lid, pid, bt, h) for n, lid, pid, bt, h in active_neos 
+            active_neos = [(n, lid, tally) for n, lid, tally in active_neos
                           if (n, lid) not in dead_lineages]
             
-            # Add new offsprings
+            # Add new offsprings (after the tick's batch, so they branch off the recorded histories)
             active_neos.extend(new_offsprings)
+            for birth in births:
+                sink.lineage_born(birth)
             
             # If no active Neos, simulation ends
             if not active_neos:
                 break
+            t += 1
+        
+        # Lineages still active are finished by the sink
+        for neo, lineage_id, tally in active_neos:
+            neo.lio.sync_nodes()
+    
+    def _run_vectorized(self, num_ticks: int, enable_offspring: bool):
+        """
+        Run the simulation advancing all active Neos together with a PopulationEngine.
         
-        # Record remaining active lineages
-        for neo, lineage_id, parent_id, birth_tick, history in active_neos:
-            all_lineages.append(NeoLineage(
-                lineage_id=lineage_id,
-                parent_id=parent_id,
-                energy_history=history['energy_history'],
-                accuracy_history=history['accuracy_history'],
-                predictions=history['predictions'],
-                actuals=history['actuals'],
-                rewards=history['rewards'],
-                size_history=history['size_history'],
-                mutations_applied=history['mutations_applied'],
-                birth_tick=birth_tick,
-                death_tick=None  # Still alive
-            ))
+        Compute, run cost and reward are evaluated for the whole population with a
+        few array operations per tick; only Neos whose Evo attempts mutations on the
+        tick drop back to Python for the mutation step, in the same order as run(),
+        so the results match run() exactly.
+        """
+        sink = self._sink
+        active_neos: List[Tuple[Neo, int, Dict]] = [(self.neo, 0, self._new_tally())]
+        engine = PopulationEngine([self.neo], run_cost=self.run_cost)
         
-        # For backward compatibility, use the root lineage (lineage_id=0) for main results
-        root_lineage = next((l for l in all_lineages if l.lineage_id == 0), None)
-        if root_lineage:
-            return SimulationResult(
-                energy_history=root_lineage.energy_history,
-                accuracy_history=root_lineage.accuracy_history,
-                predictions=root_lineage.predictions,
-                actuals=root_lineage.actuals,
-                rewards=root_lineage.rewards,
-                size_history=root_lineage.size_history,
-                mutations_applied=root_lineage.mutations_applied,
-                lineages=all_lineages
-            )
-        else:
-            # Fallback if no root lineage
-            return SimulationResult(
-                energy_history=[],
-                accuracy_history=[],
-                predictions=[],
-                actuals=[],
-                rewards=[],
-                size_history=[],
-                mutations_applied=[],
-                lineages=all_lineages
-            )
+        for t in range(num_ticks):
+            # Neos that can't pay this tick's run cost die
+            dead = engine.energy < engine.required_cost()
+            if dead.any():
+                for i in np.nonzero(dead)[0]:
+                    engine.sync(i)
+                    neo, lineage_id, tally = active_neos[i]
+                    neo.lio.sync_nodes()
+                    sink.lineage_died(lineage_id, t, neo.energy)
+                active_neos = [entry for entry, d in zip(active_neos, dead) if not d]
+                engine.remove(dead)
+                if not active_neos:
+                    break
+            
+            # Steps 1-6: receive input, compute, pay run cost and receive reward
+            inputs = np.full(len(active_neos), self.neoverse.get_input(t), dtype=np.int8)
+            next_inputs = np.full(len(active_neos), self.neoverse.get_input(t + 1), dtype=np.int8)
+            predictions, rewards = engine.step(inputs, next_inputs, self.neoverse)
+            energy = engine.energy.copy()
+            
+            # Step 7: Record the tick and update accuracy (per-lineage)
+            new_offsprings = []
+            births = []
+            hits = predictions == next_inputs
+            for i, (neo, lineage_id, tally) in enumerate(active_neos):
+                self._record_tick(tally, bool(hits[i]))
+                
+                # Step 8: Mutate on the Python side, only on ticks the Evo's attempt is due
+                if neo.evo and neo.evo.attempt_due():
+                    engine.sync(i)
+                    offspring = self._mutate(neo, lineage_id, tally, t, enable_offspring)
+                    if offspring is not None:
+                        new_offsprings.append(offspring[0])
+                        births.append(offspring[1])
+                    engine.load(i)
+            
+            # Step 9: Memory is updated when rows are synced back to their Neos
+            sink.record_ticks(TickBatch(t, [entry[1] for entry in active_neos], predictions,
+                                        next_inputs, rewards, energy, engine.size.copy()))
+            
+            active_neos.extend(new_offsprings)
+            engine.add([entry[0] for entry in new_offsprings])
+            for birth in births:
+                sink.lineage_born(birth)
+        
+        engine.sync_all()
+        for neo, lineage_id, tally in active_neos:
+            neo.lio.sync_nodes()
+    
+    @staticmethod
+    def _new_tally() -> Dict:
+        """Create the running accuracy counts of a new lineage."""
+        return {
+            'correct': 0,  # Correct predictions in the lineage's history
+            'total': 0,  # Predictions in the lineage's history
+            'last': False  # Whether the last recorded prediction was correct
+        }
+    
+    @staticmethod
+    def _record_chunk(tally: Dict, chunk: TickChunk):
+        """Count a chunk's predictions in the lineage's running accuracy."""
+        if len(chunk):
+            hits = chunk.predictions == chunk.actuals
+            tally['correct'] += int(hits.sum())
+            tally['total'] += len(chunk)
+            tally['last'] = bool(hits[-1])
     
+    @staticmethod
+    def _record_tick(tally: Dict, correct: bool):
+        """Count one tick's prediction in the lineage's running accuracy."""
+        if correct:
+            tally['correct'] += 1
+        tally['total'] += 1
+        tally['last'] = correct
+    
+    def _mutate(self, neo: Neo, lineage_id: int, tally: Dict, t: int,
+                enable_offspring: bool) -> Optional[Tuple[Tuple[Neo, int, Dict], LineageBirth]]:
+        """
+        Let the Neo's Evo apply mutations and, in offspring mode, spawn the offspring.
+        
+        Called on the ticks the Evo's mutation attempt is due (Evo.attempt_due).
+        
+        Returns:
+            The offspring's active-Neo entry and birth record, or None if no offspring was created
+        """
+        next_tick_run_cost = self.run_cost * neo.lio.get_size()
+        safety_buffer = max(1, next_tick_run_cost // 2)
+        reserved_energy = next_tick_run_cost + safety_buffer
+        available_for_mutations = max(0, neo.energy - reserved_energy)
+        
+        if available_for_mutations <= 0:
+            return None
+        
+        applied_mutations = neo.evo.attempt_mutations(neo.lio, available_for_mutations)
+        if not applied_mutations:
+            return None
+        
+        # Record mutations and pay costs
+        for mutation in applied_mutations:
+            cost = neo.lio.get_mutation_cost(mutation.mutation_type)
+            neo.pay_energy(cost)
+        self._sink.record_mutations(lineage_id, t, applied_mutations)
+        
+        # If enable_offspring=False, mutations apply directly and Neo continues mutating
+        if not enable_offspring:
+            return None
+        
+        # Create offspring with mutated state
+        offspring = neo.create_offspring()
+        
+        # Inherit parent's history up to current tick (t)
+        # At the time of offspring creation (after step 7), the parent has:
+        # - Made t+1 predictions (indices 0 to t, including the one just made at tick t)
+        # - Received t+1 actuals (indices 0 to t, including the one just received at tick t)
+        # - Has t+1 accuracy values (indices 0 to t)
+        # We want to inherit exactly t predictions and t actuals (up to but not including tick t)
+        # This matches what the parent had at the END of tick t-1, which is what we want
+        branch = min(t, tally['total'])
+        
+        # The offspring's running count covers only the inherited entries: subtract
+        # the parent's entries past index t (at most the one just recorded)
+        inherited_correct = tally['correct'] - (tally['last'] if tally['total'] > branch else 0)
+        
+        # Use parent's accuracy at tick t (the last accuracy, which is the current tick's accuracy)
+        # This is the accuracy the parent had at the end of tick t, which is what we want to inherit
+        parent_accuracy = tally['correct'] / tally['total'] if tally['total'] > 0 else 0.0
+        
+        entry = (offspring, self._next_lineage_id, {
+            'correct': inherited_correct,
+            'total': branch,
+            'last': False
+        })
+        birth = LineageBirth(
+            lineage_id=self._next_lineage_id,
+            parent_id=lineage_id,
+            birth_tick=t + 1,
+            energy=offspring.energy,
+            size=offspring.get_size(),
+            branch=branch,
+            correct=inherited_correct,
+            accuracy=parent_accuracy  # The offspring's accuracy history starts with it
+        )
+        self._next_lineage_id += 1
+        
+        # Disable mutations on parent (remove Evo)
+        neo.evo = None
+        return entry, birth
 
 
 # Configuration-based simulation runner functions
@@ -267,7 +412,7 @@ def create_neo_from_config(config: SimulationConfig, lio_factory=None) -> Neo:
     Args:
         config: Simulation configuration
         lio_factory: Optional function to customize Lio after creation
-                    (e.g., for custom node structures)
+                    (e.g., for custom node structures), or its registered name
     """
     # Create Lio with computational structure
     costs = None
@@ -282,7 +427,8 @@ def create_neo_from_config(config: SimulationConfig, lio_factory=None) -> Neo:
     
     lio = Lio(
         n=config.neo.n,
-        memory=config.neo.memory,
+        # Copy, since the Lio's memory changes as bits are added and removed
+        memory=list(config.neo.memory) if config.neo.memory is not None else None,
         nodes=config.neo.nodes,
         edges=config.neo.edges,
         input_node_id=config.neo.input_node_id,
@@ -291,6 +437,8 @@ def create_neo_from_config(config: SimulationConfig, lio_factory=None) -> Neo:
     )
     
     # Apply custom factory if provided
+    if isinstance(lio_factory, str):
+        lio_factory = get_neo_factory(lio_factory)
     if lio_factory is not None:
         lio = lio_factory(lio)
     
@@ -304,10 +452,16 @@ def create_neo_from_config(config: SimulationConfig, lio_factory=None) -> Neo:
             MutationType.EDGE_REMOVE: config.lio.edge_remove_cost if config.lio else 1,
             MutationType.LEX_FLIP: config.lio.lex_flip_cost if config.lio else 1,
         }
+        # Without its own seed, the Evo's generator is seeded from a child of the
+        # NeoVerse's seed (the tape uses the seed's root sequence itself)
+        seed = config.evo.seed
+        if seed is None and config.neoverse.seed is not None:
+            seed = np.random.SeedSequence(config.neoverse.seed, spawn_key=(0,))
         evo = Evo(
             mutation_probability=config.evo.mutation_probability,
             max_mutations_per_event=config.evo.max_mutations_per_event,
-            costs=evo_costs
+            costs=evo_costs,
+            seed=seed
         )
     
     # Create Neo as container
@@ -322,16 +476,18 @@ def create_neo_from_config(config: SimulationConfig, lio_factory=None) -> Neo:
 
 
 
-def run_simulation(config: SimulationConfig, enable_offspring: Optional[bool] = None) -> SimulationResult:
+def run_simulation(config: SimulationConfig, enable_offspring: Optional[bool] = None,
+                   sink: Optional[ResultSink] = None) -> Optional[SimulationResult]:
     """
     Run a simulation from a configuration object.
     
     Args:
         config: Simulation configuration (includes neo_factory if needed)
         enable_offspring: Override config.enable_offspring if provided (None = use config value)
+        sink: ResultSink to stream the run to (None = keep it in memory)
         
     Returns:
-        SimulationResult
+        SimulationResult (or what sink.close() returns for a custom sink)
     """
     # Create Neo (use factory from config if provided)
     neo = create_neo_from_config(config, lio_factory=config.neo_factory)
@@ -349,20 +505,46 @@ def run_simulation(config: SimulationConfig, enable_offspring: Optional[bool] =
         run_cost=config.run_cost
     )
     
-    result = cycle.run(config.num_ticks, enable_offspring=use_offspring)
+    result = cycle.run(config.num_ticks, enable_offspring=use_offspring, sink=sink)
     return result
 
 
-def run_simulations_from_configs(configs: List[SimulationConfig]) -> Dict[str, SimulationResult]:
+def run_simulations_from_configs(configs: List[SimulationConfig], workers: Optional[int] = None,
+                                 cache: Optional[ResultCache] = None) -> Dict[str, SimulationResult]:
     """
     Run multiple simulations from configuration objects.
     
     Args:
         configs: List of SimulationConfig objects (each can have its own neo_factory)
+        workers: If given, run the configs in this many worker processes with
+                 per-config random seeds (see parallel.iter_simulations), so
+                 results don't depend on the worker count; None runs them here
+                 one after another
+        cache: If given, load the results of cached configs from it (lazily)
+               and store the results of the others
         
     Returns:
         Dictionary mapping simulation name to SimulationResult
     """
+    if cache is not None:
+        cached = {}
+        missing = []
+        for config in configs:
+            result = cache.load(config)
+            if result is not None:
+                cached[config.name] = result
+            else:
+                missing.append(config)
+        fresh = run_simulations_from_configs(missing, workers=workers)
+        for config in missing:
+            if config.name in fresh:
+                cache.store(config, fresh[config.name])
+        return {config.name: cached.get(config.name, fresh.get(config.name)) for config in configs
+                if config.name in cached or config.name in fresh}
+    
+    if workers is not None:
+        return run_simulations_parallel(configs, workers=workers)
+    
     results = {}
     for config in configs:
         try:
@@ -374,4 +556,3 @@ def run_simulations_from_configs(configs: List[SimulationConfig]) -> Dict[str, S
             traceback.print_exc()
             # Continue with other simulations
     return results
-
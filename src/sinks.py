@@ -0,0 +1,533 @@
+"""Result sinks: receive a NeoCycle run's ticks and lineage events as they happen."""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict
+import json
+import os
+
+import numpy as np
+
+from .types import Mutation
+from .history import (Column, LineageHistory, AccuracyHistory, MutationEvent, MutationLog, MUTATION_DTYPE,
+                      NeoLineage, SimulationResult)
+
+
+@dataclass
+class LineageBirth:
+    """A new lineage: the root at the start of a run, or an offspring after a mutation."""
+    lineage_id: int
+    parent_id: Optional[int]  # None for root
+    birth_tick: int
+    energy: int  # Energy at birth
+    size: int  # Number of nodes at birth
+    branch: int = 0  # Entries of the parent's histories the lineage inherits
+    correct: int = 0  # Correct predictions among the inherited entries
+    accuracy: Optional[float] = None  # Parent's accuracy at the branch tick (None for root)
+
+
+@dataclass
+class TickBatch:
+    """
+    One tick of every Neo that ran it, as parallel columns (lists or NumPy arrays).
+    
+    Entry i belongs to lineage lineage_ids[i]. Energy is recorded after the
+    reward (before mutation costs), size after the mutation step, as in the
+    lineage histories.
+    """
+    tick: int
+    lineage_ids: Sequence[int]
+    predictions: Sequence[int]
+    actuals: Sequence[int]
+    rewards: Sequence[int]
+    energy: Sequence[int]
+    size: Sequence[int]
+    
+    def __len__(self) -> int:
+        return len(self.lineage_ids)
+
+
+@dataclass
+class TickChunk:
+    """
+    Consecutive ticks of one lineage while it was the only Neo alive, as columns.
+    
+    Entry i is tick start + i. The structure doesn't change during a chunk, so
+    the size is one value for every tick.
+    """
+    lineage_id: int
+    start: int
+    predictions: np.ndarray
+    actuals: np.ndarray
+    rewards: np.ndarray
+    energy: np.ndarray
+    size: int
+    
+    def __len__(self) -> int:
+        return len(self.predictions)
+    
+    def batches(self) -> Iterator[TickBatch]:
+        """The chunk as one single-entry TickBatch per tick."""
+        for i in range(len(self)):
+            yield TickBatch(self.start + i, [self.lineage_id], self.predictions[i:i + 1], self.actuals[i:i + 1],
+                            self.rewards[i:i + 1], self.energy[i:i + 1], [self.size])
+
+
+class ResultSink(ABC):
+    """
+    Receives a run's results from NeoCycle as they are produced.
+    
+    NeoCycle calls lineage_born for the root before the first tick and for each
+    offspring after the batch of the tick it was created in, record_ticks once
+    per tick (or record_chunk for a stretch of ticks run by a single Neo),
+    record_mutations whenever an Evo applies mutations, lineage_died
+    when a Neo can't pay its run cost, and close at the end of the run. Lineages
+    that are still alive at close have no death tick.
+    """
+    
+    @abstractmethod
+    def lineage_born(self, birth: LineageBirth):
+        """Start recording a lineage."""
+        pass
+    
+    @abstractmethod
+    def record_ticks(self, batch: TickBatch):
+        """Record one tick of every Neo that ran it."""
+        pass
+    
+    def record_chunk(self, chunk: TickChunk):
+        """Record consecutive ticks of the only Neo alive (by default as one record_ticks per tick)."""
+        for batch in chunk.batches():
+            self.record_ticks(batch)
+    
+    def record_mutations(self, lineage_id: int, tick: int, mutations: List[Mutation]):
+        """Record the mutations a lineage's Evo applied at a tick."""
+        pass
+    
+    @abstractmethod
+    def lineage_died(self, lineage_id: int, tick: int, energy: int):
+        """Record that a lineage died at a tick with the given energy."""
+        pass
+    
+    def close(self) -> Optional[SimulationResult]:
+        """Finish the run; returns a SimulationResult if the sink builds one."""
+        return None
+
+
+class NullSink(ResultSink):
+    """Discards everything (for runs where only the Neos' final state matters)."""
+    
+    def lineage_born(self, birth: LineageBirth):
+        pass
+    
+    def record_ticks(self, batch: TickBatch):
+        pass
+    
+    def record_chunk(self, chunk: TickChunk):
+        pass
+    
+    def lineage_died(self, lineage_id: int, tick: int, energy: int):
+        pass
+
+
+class InMemorySink(ResultSink):
+    """
+    Keeps every lineage's full history in memory and builds a SimulationResult.
+    
+    This is NeoCycle's default sink. Histories are columnar and offspring share
+    their inherited prefix with the parent (see history.py).
+    """
+    
+    def __init__(self):
+        self.lineages: List[NeoLineage] = []  # Finished lineages, in order of death
+        self._histories: Dict[int, Dict] = {}
+        self._alive: Dict[int, None] = {}  # Lineage IDs still alive, in birth order
+    
+    def lineage_born(self, birth: LineageBirth):
+        if birth.parent_id is None:
+            predictions = LineageHistory(dtype=np.int8)
+            actuals = LineageHistory(dtype=np.int8)
+            rewards = LineageHistory(dtype=np.int32)
+            accuracy = AccuracyHistory(predictions.own, actuals.own)
+        else:
+            # Inherit the parent's histories up to the branch without copying them
+            parent = self._histories[birth.parent_id]
+            predictions = parent['predictions'].fork(birth.branch)
+            actuals = parent['actuals'].fork(birth.branch)
+            rewards = parent['rewards'].fork(birth.branch)
+            accuracy = AccuracyHistory(predictions.own, actuals.own, correct=birth.correct,
+                                       total=predictions.branch, head=birth.accuracy)
+        self._histories[birth.lineage_id] = {
+            'birth': birth,
+            'energy_history': Column(np.int32, [birth.energy]),
+            'accuracy_history': accuracy,
+            'predictions': predictions,
+            'actuals': actuals,
+            'rewards': rewards,
+            'size_history': Column(np.int32, [birth.size]),
+            'mutations_applied': MutationLog(),
+        }
+        self._alive[birth.lineage_id] = None
+    
+    def record_ticks(self, batch: TickBatch):
+        histories = self._histories
+        for lineage_id, prediction, actual, reward, energy, size in zip(
+                batch.lineage_ids, batch.predictions, batch.actuals, batch.rewards, batch.energy, batch.size):
+            history = histories[lineage_id]
+            history['predictions'].append(prediction)
+            history['actuals'].append(actual)
+            history['rewards'].append(reward)
+            history['energy_history'].append(energy)
+            history['size_history'].append(size)
+    
+    def record_chunk(self, chunk: TickChunk):
+        history = self._histories[chunk.lineage_id]
+        history['predictions'].extend(chunk.predictions)
+        history['actuals'].extend(chunk.actuals)
+        history['rewards'].extend(chunk.rewards)
+        history['energy_history'].extend(chunk.energy)
+        history['size_history'].extend(np.full(len(chunk), chunk.size))
+    
+    def record_mutations(self, lineage_id: int, tick: int, mutations: List[Mutation]):
+        self._histories[lineage_id]['mutations_applied'].extend(MutationEvent.from_mutation(tick, m) for m in mutations)
+    
+    def lineage_died(self, lineage_id: int, tick: int, energy: int):
+        self._histories[lineage_id]['energy_history'].append(energy)
+        self._finish(lineage_id, tick)
+    
+    def _finish(self, lineage_id: int, death_tick: Optional[int]):
+        history = self._histories.pop(lineage_id)
+        birth = history['birth']
+        del self._alive[lineage_id]
+        self.lineages.append(NeoLineage(
+            lineage_id=lineage_id,
+            parent_id=birth.parent_id,
+            energy_history=history['energy_history'],
+            accuracy_history=history['accuracy_history'],
+            predictions=history['predictions'],
+            actuals=history['actuals'],
+            rewards=history['rewards'],
+            size_history=history['size_history'],
+            mutations_applied=history['mutations_applied'],
+            birth_tick=birth.birth_tick,
+            death_tick=death_tick
+        ))
+    
+    def close(self) -> SimulationResult:
+        """Finish the lineages still alive and build the result."""
+        for lineage_id in list(self._alive):
+            self._finish(lineage_id, None)
+        return build_result(self.lineages)
+
+
+def build_result(lineages: List[NeoLineage]) -> SimulationResult:
+    """Build the SimulationResult, using the root lineage for the main histories."""
+    # For backward compatibility, use the root lineage (lineage_id=0) for main results
+    root_lineage = next((l for l in lineages if l.lineage_id == 0), None)
+    if root_lineage:
+        return SimulationResult(
+            energy_history=root_lineage.energy_history,
+            accuracy_history=root_lineage.accuracy_history,
+            predictions=root_lineage.predictions,
+            actuals=root_lineage.actuals,
+            rewards=root_lineage.rewards,
+            size_history=root_lineage.size_history,
+            mutations_applied=root_lineage.mutations_applied,
+            lineages=lineages
+        )
+    else:
+        # Fallback if no root lineage
+        return SimulationResult(
+            energy_history=[],
+            accuracy_history=[],
+            predictions=[],
+            actuals=[],
+            rewards=[],
+            size_history=[],
+            mutations_applied=[],
+            lineages=lineages
+        )
+
+
+@dataclass
+class LineageSummary:
+    """Running summary statistics of one lineage."""
+    lineage_id: int
+    parent_id: Optional[int]
+    birth_tick: int
+    death_tick: Optional[int] = None
+    ticks: int = 0  # Ticks the lineage ran itself
+    correct: int = 0  # Correct predictions, including inherited ones
+    total: int = 0  # Predictions, including inherited ones
+    final_energy: int = 0
+    min_energy: int = 0
+    max_energy: int = 0
+    final_accuracy: float = 0.0
+    max_accuracy: float = 0.0
+    final_size: int = 0
+    mutations: int = 0
+
+
+class SummarySink(ResultSink):
+    """
+    Keeps only running summary statistics: O(1) memory per lineage, none per tick.
+    
+    summary() reports the root lineage in the format of log_results' summary;
+    lineages holds a LineageSummary per lineage.
+    """
+    
+    def __init__(self):
+        self.lineages: Dict[int, LineageSummary] = {}
+        self.neo_ticks = 0  # Ticks run by all Neos together
+        self.max_population = 0  # Most Neos alive at the same tick
+    
+    def lineage_born(self, birth: LineageBirth):
+        accuracy = birth.accuracy if birth.accuracy is not None else 0.0
+        self.lineages[birth.lineage_id] = LineageSummary(
+            lineage_id=birth.lineage_id,
+            parent_id=birth.parent_id,
+            birth_tick=birth.birth_tick,
+            correct=birth.correct,
+            total=birth.branch,
+            final_energy=birth.energy,
+            min_energy=birth.energy,
+            max_energy=birth.energy,
+            final_accuracy=accuracy,
+            max_accuracy=accuracy,
+            final_size=birth.size,
+        )
+    
+    def record_ticks(self, batch: TickBatch):
+        self.neo_ticks += len(batch)
+        self.max_population = max(self.max_population, len(batch))
+        for i, lineage_id in enumerate(batch.lineage_ids):
+            summary = self.lineages[lineage_id]
+            energy = int(batch.energy[i])
+            summary.ticks += 1
+            summary.total += 1
+            if batch.predictions[i] == batch.actuals[i]:
+                summary.correct += 1
+            summary.final_accuracy = summary.correct / summary.total
+            summary.max_accuracy = max(summary.max_accuracy, summary.final_accuracy)
+            summary.final_energy = energy
+            summary.min_energy = min(summary.min_energy, energy)
+            summary.max_energy = max(summary.max_energy, energy)
+            summary.final_size = int(batch.size[i])
+    
+    def record_chunk(self, chunk: TickChunk):
+        if not len(chunk):
+            return
+        self.neo_ticks += len(chunk)
+        self.max_population = max(self.max_population, 1)
+        summary = self.lineages[chunk.lineage_id]
+        hits = np.cumsum(chunk.predictions == chunk.actuals) + summary.correct
+        accuracy = hits / np.arange(summary.total + 1, summary.total + len(chunk) + 1)
+        summary.ticks += len(chunk)
+        summary.total += len(chunk)
+        summary.correct = int(hits[-1])
+        summary.final_accuracy = float(accuracy[-1])
+        summary.max_accuracy = max(summary.max_accuracy, float(accuracy.max()))
+        summary.final_energy = int(chunk.energy[-1])
+        summary.min_energy = min(summary.min_energy, int(chunk.energy.min()))
+        summary.max_energy = max(summary.max_energy, int(chunk.energy.max()))
+        summary.final_size = int(chunk.size)
+    
+    def record_mutations(self, lineage_id: int, tick: int, mutations: List[Mutation]):
+        self.lineages[lineage_id].mutations += len(mutations)
+    
+    def lineage_died(self, lineage_id: int, tick: int, energy: int):
+        summary = self.lineages[lineage_id]
+        summary.death_tick = tick
+        summary.final_energy = energy
+        summary.min_energy = min(summary.min_energy, energy)
+        summary.max_energy = max(summary.max_energy, energy)
+    
+    def summary(self) -> Dict[str, Any]:
+        """Summary of the root lineage (as in log_results) plus population totals."""
+        root = self.lineages.get(0)
+        return {
+            "final_energy": root.final_energy if root else 0,
+            "final_accuracy": root.final_accuracy if root else 0.0,
+            "num_ticks_run": root.ticks if root else 0,
+            "total_mutations": root.mutations if root else 0,
+            "max_energy": root.max_energy if root else 0,
+            "min_energy": root.min_energy if root else 0,
+            "max_accuracy": root.max_accuracy if root else 0.0,
+            "final_size": root.final_size if root else 0,
+            "num_lineages": len(self.lineages),
+            "neo_ticks": self.neo_ticks,
+            "max_population": self.max_population,
+        }
+
+
+# Columns written by ChunkedDiskSink, one file per column and chunk
+TICK_COLUMNS = {
+    "tick": np.int32,
+    "lineage_id": np.int32,
+    "predictions": np.int8,
+    "actuals": np.int8,
+    "rewards": np.int32,
+    "energy_history": np.int32,
+    "size_history": np.int32,
+}
+
+# Records of mutations.bin: the lineage followed by its MutationLog record
+MUTATION_RECORD_DTYPE = np.dtype([("lineage_id", np.int32)] + [
+    (name, MUTATION_DTYPE.fields[name][0]) for name in MUTATION_DTYPE.names
+])
+
+# File ChunkedDiskSink appends mutation records to
+MUTATIONS_FILE = "mutations.bin"
+
+
+def chunk_path(directory: str, column: str, chunk: int, compressed: bool) -> str:
+    """Path of one column of one chunk."""
+    return os.path.join(directory, f"{column}-{chunk:05d}.{'npz' if compressed else 'npy'}")
+
+
+class ChunkedDiskSink(ResultSink):
+    """
+    Streams a run to a directory with bounded memory.
+    
+    Tick rows are buffered into fixed-size column arrays and written out every
+    chunk_rows rows as one file per column (<column>-<chunk>.npy, or a compressed
+    .npz), with the rows of a chunk sorted by lineage (stable, so each lineage's
+    rows stay in tick order). Mutations are appended to mutations.bin as raw
+    MUTATION_RECORD_DTYPE records as they happen. close() writes index.json:
+    the chunk layout and a table of lineages (birth, branch, inherited counts,
+    death tick, final energy and the chunks holding the lineage's rows), in
+    the order InMemorySink lists them.
+    
+    Memory use is one chunk of rows plus one table entry per lineage. Read the
+    directory back with resultlog.RunReader.
+    """
+    
+    def __init__(self, directory: str, chunk_rows: int = 1 << 20, compress: bool = False):
+        """
+        Initialize the sink.
+        
+        Args:
+            directory: Output directory (created if needed)
+            chunk_rows: Rows (Neo-ticks) per chunk file
+            compress: Write compressed .npz chunks (smaller, but read by
+                      decompressing instead of memory-mapping)
+        """
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be positive")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.chunk_rows = chunk_rows
+        self.compress = compress
+        self.num_chunks = 0
+        self.num_rows = 0
+        self.num_mutations = 0
+        self._buffer = {name: np.empty(chunk_rows, dtype=dtype) for name, dtype in TICK_COLUMNS.items()}
+        self._filled = 0
+        self._lineages: Dict[int, Dict[str, Any]] = {}
+        self._finished: List[int] = []  # Lineage IDs in order of death
+        self._mutations = open(os.path.join(directory, MUTATIONS_FILE), "wb")
+    
+    def lineage_born(self, birth: LineageBirth):
+        self._lineages[birth.lineage_id] = dict(asdict(birth), death_tick=None, final_energy=None, chunks=None)
+    
+    def record_ticks(self, batch: TickBatch):
+        self.append_rows(batch.tick, {
+            "lineage_id": batch.lineage_ids,
+            "predictions": batch.predictions,
+            "actuals": batch.actuals,
+            "rewards": batch.rewards,
+            "energy_history": batch.energy,
+            "size_history": batch.size,
+        })
+    
+    def record_chunk(self, chunk: TickChunk):
+        self.append_rows(np.arange(chunk.start, chunk.start + len(chunk)), {
+            "lineage_id": np.full(len(chunk), chunk.lineage_id),
+            "predictions": chunk.predictions,
+            "actuals": chunk.actuals,
+            "rewards": chunk.rewards,
+            "energy_history": chunk.energy,
+            "size_history": np.full(len(chunk), chunk.size),
+        })
+    
+    def append_rows(self, tick: Any, columns: Dict[str, Sequence]):
+        """
+        Append rows given as columns (every TICK_COLUMNS entry except tick).
+        
+        Args:
+            tick: Tick of every row (a scalar, or one tick per row)
+            columns: Column values by name, all of the same length
+        """
+        count = len(columns["lineage_id"])
+        ticks = np.broadcast_to(np.asarray(tick), (count,))
+        start = 0
+        while start < count:
+            stop = min(count, start + self.chunk_rows - self._filled)
+            rows = slice(self._filled, self._filled + stop - start)
+            self._buffer["tick"][rows] = ticks[start:stop]
+            for name, values in columns.items():
+                self._buffer[name][rows] = values[start:stop]
+            self._filled += stop - start
+            start = stop
+            if self._filled == self.chunk_rows:
+                self._flush()
+    
+    def record_mutations(self, lineage_id: int, tick: int, mutations: List[Mutation]):
+        self.append_mutations(lineage_id, [MutationEvent.from_mutation(tick, mutation) for mutation in mutations])
+    
+    def append_mutations(self, lineage_id: int, events: Iterable[Union[MutationEvent, str]]):
+        """Append a lineage's mutation events (a MutationLog, MutationEvents or rendered strings)."""
+        events = events.array if isinstance(events, MutationLog) else MutationLog(events).array
+        records = np.empty(len(events), dtype=MUTATION_RECORD_DTYPE)
+        records["lineage_id"] = lineage_id
+        for name in MUTATION_DTYPE.names:
+            records[name] = events[name]
+        records.tofile(self._mutations)
+        self.num_mutations += len(records)
+    
+    def lineage_died(self, lineage_id: int, tick: int, energy: int):
+        self._lineages[lineage_id].update(death_tick=tick, final_energy=energy)
+        self._finished.append(lineage_id)
+    
+    def _flush(self):
+        """Write the buffered rows as the next chunk."""
+        if not self._filled:
+            return
+        order = np.argsort(self._buffer["lineage_id"][:self._filled], kind="stable")
+        for name, values in self._buffer.items():
+            path = chunk_path(self.directory, name, self.num_chunks, self.compress)
+            if self.compress:
+                np.savez_compressed(path, values=values[:self._filled][order])
+            else:
+                np.save(path, values[:self._filled][order])
+        # Record which chunks hold each lineage's rows
+        for lineage_id in np.unique(self._buffer["lineage_id"][:self._filled]).tolist():
+            entry = self._lineages[lineage_id]
+            if entry["chunks"] is None:
+                entry["chunks"] = [self.num_chunks, self.num_chunks]
+            entry["chunks"][1] = self.num_chunks
+        self.num_chunks += 1
+        self.num_rows += self._filled
+        self._filled = 0
+    
+    def close(self) -> None:
+        """Write the last chunk and the index."""
+        self._flush()
+        self._mutations.close()
+        # Dead lineages in order of death, then the live ones in birth order
+        finished = set(self._finished)
+        order = self._finished + [lineage_id for lineage_id in self._lineages if lineage_id not in finished]
+        index = {
+            "chunk_rows": self.chunk_rows,
+            "num_chunks": self.num_chunks,
+            "num_rows": self.num_rows,
+            "compressed": self.compress,
+            "columns": {name: np.dtype(dtype).str for name, dtype in TICK_COLUMNS.items()},
+            "num_mutations": self.num_mutations,
+            "mutation_columns": [[name, MUTATION_RECORD_DTYPE.fields[name][0].str]
+                                 for name in MUTATION_RECORD_DTYPE.names],
+            "lineages": [self._lineages[lineage_id] for lineage_id in order],
+        }
+        with open(os.path.join(self.directory, "index.json"), "w") as f:
+            json.dump(index, f)
+        return None
@@ -0,0 +1,315 @@
+"""Parameter sweeps: expand a base config along axes (grid, random or Latin hypercube) and tabulate summaries."""
+
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+from dataclasses import dataclass
+import itertools
+import math
+
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
+
+from .config import SimulationConfig
+from .parallel import iter_simulations
+
+
+# Sweep designs
+DESIGNS = ("grid", "random", "lhs")
+
+# Summary statistics tabulated per point (SummarySink.summary keys) and their dtypes
+SUMMARY_COLUMNS = {
+    "final_energy": np.int64,
+    "final_accuracy": np.float64,
+    "num_ticks_run": np.int64,
+    "total_mutations": np.int64,
+    "max_energy": np.int64,
+    "min_energy": np.int64,
+    "max_accuracy": np.float64,
+    "final_size": np.int64,
+    "num_lineages": np.int64,
+    "neo_ticks": np.int64,
+    "max_population": np.int64,
+}
+
+
+@dataclass(frozen=True)
+class Range:
+    """A continuous (or integer, if both bounds are ints) axis for random and Latin hypercube designs."""
+    low: float
+    high: float
+    log: bool = False  # Sample uniformly in log space (bounds must be positive)
+    
+    @property
+    def integer(self) -> bool:
+        return isinstance(self.low, int) and isinstance(self.high, int)
+    
+    def at(self, u: float) -> Union[int, float]:
+        """The value at quantile u in [0, 1)."""
+        if self.integer and not self.log:
+            # Integer ranges include both bounds
+            return min(self.high, self.low + int(u * (self.high - self.low + 1)))
+        if self.log:
+            value = math.exp(math.log(self.low) + u * (math.log(self.high) - math.log(self.low)))
+        else:
+            value = self.low + u * (self.high - self.low)
+        return min(self.high, int(value)) if self.integer else value
+
+
+Axis = Union[Sequence[Any], Range]
+
+
+def _field_type(base: SimulationConfig, path: str) -> Any:
+    """Annotation of the config field a dotted path (e.g. "lio.bit_add_cost") names."""
+    *parents, leaf = path.split(".")
+    model: Any = base
+    for name in parents:
+        model = getattr(model, name, None)
+        if not isinstance(model, BaseModel):
+            raise ValueError(f"Sweep axis {path!r}: the base config has no {name!r} section")
+    if leaf not in type(model).model_fields:
+        raise ValueError(f"Sweep axis {path!r}: unknown field {leaf!r}")
+    return type(model).model_fields[leaf].annotation
+
+
+def apply_point(base: SimulationConfig, point: Dict[str, Any], name: Optional[str] = None) -> SimulationConfig:
+    """
+    A copy of base with the point's values set (by dotted path).
+    
+    Uses model_copy, which doesn't validate: the values must already have the
+    fields' types (Sweep validates each axis value once up front).
+    """
+    nested: Dict[str, Any] = {}
+    for path, value in point.items():
+        head, _, rest = path.partition(".")
+        if rest:
+            nested.setdefault(head, {})[rest] = value
+        else:
+            nested[head] = value
+    update = {}
+    for head, value in nested.items():
+        if isinstance(value, dict):
+            update[head] = apply_point(getattr(base, head), value)
+        else:
+            update[head] = value
+    if name is not None:
+        update["name"] = name
+    return base.model_copy(update=update)
+
+
+class Sweep:
+    """
+    A base config expanded along axes into configs, lazily.
+    
+    Axes map a dotted config path (e.g. "lio.bit_add_cost",
+    "evo.mutation_probability", "neo.energy", "run_cost",
+    "neoverse.neoverse_type", "neoverse.seed") to a list of values or a Range:
+    
+    - grid: every combination of the axes' values (Ranges aren't allowed)
+    - random: num_points points, each axis drawn independently (uniform over a
+      list's values or a Range)
+    - lhs: num_points points of a Latin hypercube: each axis is split into
+      num_points equal strata, each sampled once, in a random pairing across axes
+    
+    Axis values are validated once against the fields' types; the configs
+    themselves are built with model_copy as they are iterated, so no per-point
+    validation is paid and a sweep of any size costs nothing until it runs.
+    Points are reproducible from the seed.
+    """
+    
+    def __init__(self, base: SimulationConfig, axes: Dict[str, Axis], design: str = "grid",
+                 num_points: Optional[int] = None, seed: int = 0):
+        """
+        Initialize a sweep.
+        
+        Args:
+            base: Config the points are applied to
+            axes: Values (or Range) of each swept field, by dotted path
+            design: "grid", "random" or "lhs"
+            num_points: Number of points (random and lhs designs)
+            seed: Seed of the random and lhs designs
+        
+        Raises:
+            ValueError: If an axis or the design is invalid
+        """
+        if design not in DESIGNS:
+            raise ValueError(f"Unknown design {design!r} (expected one of {DESIGNS})")
+        if design != "grid" and (num_points is None or num_points <= 0):
+            raise ValueError(f"The {design} design needs a positive num_points")
+        self.base = base
+        self.design = design
+        self.num_points = num_points
+        self.seed = seed
+        self.axes: Dict[str, Axis] = {}
+        for path, axis in axes.items():
+            adapter = TypeAdapter(_field_type(base, path))
+            if isinstance(axis, Range):
+                if design == "grid":
+                    raise ValueError(f"Sweep axis {path!r}: a grid needs a list of values, not a Range")
+                adapter.validate_python(axis.low)
+                adapter.validate_python(axis.high)
+                self.axes[path] = axis
+            else:
+                values = [adapter.validate_python(value) for value in axis]
+                if not values:
+                    raise ValueError(f"Sweep axis {path!r} has no values")
+                self.axes[path] = values
+    
+    def __len__(self) -> int:
+        if self.design == "grid":
+            return math.prod(len(values) for values in self.axes.values())
+        return self.num_points
+    
+    def _value(self, axis: Axis, u: float) -> Any:
+        """The axis value at quantile u in [0, 1)."""
+        if isinstance(axis, Range):
+            return axis.at(u)
+        return axis[min(len(axis) - 1, int(u * len(axis)))]
+    
+    def points(self) -> Iterator[Dict[str, Any]]:
+        """The points (axis values by path), in order."""
+        paths = list(self.axes)
+        if self.design == "grid":
+            for values in itertools.product(*self.axes.values()):
+                yield dict(zip(paths, values))
+            return
+        rng = np.random.default_rng(self.seed)
+        if self.design == "random":
+            for _ in range(self.num_points):
+                yield {path: self._value(self.axes[path], rng.random()) for path in paths}
+            return
+        # Latin hypercube: stratum i of each axis is used once, strata paired across axes at random
+        n = self.num_points
+        quantiles = np.column_stack([(rng.permutation(n) + rng.random(n)) / n for _ in paths]) if paths else None
+        for i in range(n):
+            yield {path: self._value(self.axes[path], quantiles[i, j]) for j, path in enumerate(paths)}
+    
+    def point_name(self, index: int, point: Dict[str, Any]) -> str:
+        """Name of a point's config: the base name and the point's values."""
+        values = ",".join(f"{path.rsplit('.', 1)[-1]}={getattr(value, 'value', value)}"
+                          for path, value in point.items())
+        return f"{self.base.name}[{index}:{values}]"
+    
+    def config(self, index: int, point: Dict[str, Any]) -> SimulationConfig:
+        """The config of a point."""
+        return apply_point(self.base, point, name=self.point_name(index, point))
+    
+    def configs(self) -> Iterator[SimulationConfig]:
+        """The points' configs, built as they are iterated."""
+        for index, point in enumerate(self.points()):
+            yield self.config(index, point)
+
+
+def _axis_dtype(values: List[Any]) -> np.dtype:
+    """Table dtype of an axis column."""
+    if all(isinstance(value, (bool, np.bool_)) for value in values):
+        return np.dtype(np.bool_)
+    if all(isinstance(value, (int, np.integer)) and not isinstance(value, bool) for value in values):
+        return np.dtype(np.int64)
+    if all(isinstance(value, (int, float, np.number)) for value in values):
+        return np.dtype(np.float64)
+    return np.dtype(f"U{max(1, max(len(str(getattr(v, 'value', v))) for v in values))}")
+
+
+def summary_table(points: List[Dict[str, Any]], summaries: List[Optional[Dict[str, Any]]]) -> np.ndarray:
+    """
+    One structured-array row per point: its index, axis values, ok flag and SUMMARY_COLUMNS.
+    
+    Failed points (summary None) have ok False and zero statistics.
+    """
+    paths = list(points[0]) if points else []
+    axis_dtypes = [(path, _axis_dtype([point[path] for point in points])) for path in paths]
+    dtype = np.dtype([("index", np.int64)] + axis_dtypes + [("ok", np.bool_)]
+                     + [(name, column) for name, column in SUMMARY_COLUMNS.items()])
+    table = np.zeros(len(points), dtype=dtype)
+    table["index"] = np.arange(len(points))
+    for path, column in axis_dtypes:
+        values = [point[path] for point in points]
+        table[path] = [getattr(v, "value", v) for v in values] if column.kind == "U" else values
+    for row, summary in enumerate(summaries):
+        if summary is None:
+            continue
+        table["ok"][row] = True
+        for name in SUMMARY_COLUMNS:
+            table[name][row] = summary[name]
+    return table
+
+
+def run_sweep(sweep: Sweep, workers: Optional[int] = None, seed: int = 0,
+              progress: bool = False) -> np.ndarray:
+    """
+    Run a sweep's points in worker processes and tabulate their summaries.
+    
+    Each point runs into a SummarySink, so workers send back a few numbers per
+    point instead of its histories. Points run with per-point random seeds (see
+    parallel.iter_simulations), so the table doesn't depend on the worker count.
+    
+    Args:
+        sweep: Sweep to run
+        workers: Number of worker processes (default: os.cpu_count())
+        seed: Seed of the per-point random seeds (for Evos without a seed)
+        progress: Print a line per failed point and a count every 10% of the points
+    
+    Returns:
+        summary_table of the points, in point order
+    """
+    points = list(sweep.points())
+    summaries: List[Optional[Dict[str, Any]]] = [None] * len(points)
+    configs = (sweep.config(index, point) for index, point in enumerate(points))
+    step = max(1, len(points) // 10)
+    for done, outcome in enumerate(iter_simulations(configs, workers=workers, seed=seed, summarize=True), 1):
+        if outcome.error is not None:
+            if progress:
+                print(f"Error running sweep point {outcome.name}:\n{outcome.error}")
+        else:
+            summaries[outcome.index] = outcome.result
+        if progress and (done % step == 0 or done == len(points)):
+            print(f"  {done}/{len(points)} points done")
+    return summary_table(points, summaries)
+
+
+def aggregate(table: np.ndarray, over: Sequence[str] = ("neoverse.seed",)) -> np.ndarray:
+    """
+    Collapse a summary table over some axes (e.g. replicate seeds).
+    
+    Rows with the same values of the remaining axes form a group. The result
+    has one row per group (in order of first appearance): the group's axis
+    values, n (successful points) and the mean and standard deviation of every
+    SUMMARY_COLUMNS statistic over the group's successful points.
+    """
+    names = table.dtype.names
+    start, stop = names.index("index") + 1, names.index("ok")
+    keys = [name for name in names[start:stop] if name not in over]
+    groups: Dict[Tuple, List[int]] = {}
+    for row, record in enumerate(table[keys].tolist() if keys else [()] * len(table)):
+        groups.setdefault(tuple(record), []).append(row)
+    dtype = np.dtype([(name, table.dtype[name]) for name in keys] + [("n", np.int64)]
+                     + [(f"{name}_{stat}", np.float64) for name in SUMMARY_COLUMNS for stat in ("mean", "std")])
+    result = np.zeros(len(groups), dtype=dtype)
+    for i, (key, rows) in enumerate(groups.items()):
+        for name, value in zip(keys, key):
+            result[name][i] = value
+        rows = np.asarray(rows)
+        rows = rows[table["ok"][rows]]
+        result["n"][i] = len(rows)
+        if len(rows):
+            for name in SUMMARY_COLUMNS:
+                values = table[name][rows].astype(np.float64)
+                result[f"{name}_mean"][i] = values.mean()
+                result[f"{name}_std"][i] = values.std(ddof=1) if len(rows) > 1 else 0.0
+    return result
+
+
+def format_table(table: np.ndarray, columns: Optional[Sequence[str]] = None, max_rows: int = 50) -> str:
+    """Render a (summary or aggregated) table as fixed-width text."""
+    columns = list(columns or table.dtype.names)
+    cells = [[str(name) for name in columns]]
+    for record in table[:max_rows]:
+        row = []
+        for name in columns:
+            value = record[name]
+            row.append(f"{value:.4g}" if isinstance(value, np.floating) else str(value))
+        cells.append(row)
+    widths = [max(len(row[i]) for row in cells) for i in range(len(columns))]
+    lines = ["  ".join(cell.rjust(width) for cell, width in zip(row, widths)) for row in cells]
+    if len(table) > max_rows:
+        lines.append(f"... ({len(table) - max_rows} more rows)")
+    return "\n".join(lines)
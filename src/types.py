@@ -1,6 +1,7 @@
 """Core types and Pydantic models for Neosis."""
 
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
+from collections.abc import Mapping
 from enum import Enum
 from pydantic import BaseModel, Field
 
@@ -22,43 +23,173 @@ class NodeType(str, Enum):
     OUTPUT = "output"
 
 
+class LexTable(Mapping):
+    """
+    Read-only dict-style view of a Lex's bit-packed truth table, keyed by input tuples.
+    
+    Entries can't be assigned: a Lio caches plans built from its Lexes and copies
+    of a Lio share them, so edit a Lex in a Lio through Lio.set_lex or flip_lex.
+    """
+    
+    def __init__(self, lex: 'Lex'):
+        self._lex = lex
+    
+    def __getitem__(self, inputs: Tuple[int, ...]) -> int:
+        return self._lex.compute_index(self._lex.index_of(inputs))
+    
+    def __setitem__(self, inputs: Tuple[int, ...], output: int):
+        raise TypeError("Lex tables are read-only; build a new Lex and use Lio.set_lex (or Lio.flip_lex)")
+    
+    def __delitem__(self, inputs: Tuple[int, ...]):
+        raise TypeError("Lex table entries cannot be removed")
+    
+    def __iter__(self) -> Iterator[Tuple[int, ...]]:
+        for index in range(self._lex.size):
+            yield self._lex.inputs_of(index)
+    
+    def __len__(self) -> int:
+        return self._lex.size
+    
+    def __contains__(self, inputs) -> bool:
+        try:
+            self._lex.index_of(inputs)
+        except KeyError:
+            return False
+        return True
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
 class Lex(BaseModel):
-    """Lex (truth table) for a node with k inputs."""
+    """
+    Lex (truth table) for a node with k inputs.
+    
+    The table is bit-packed into a single integer: bit i holds the output for the
+    input combination whose binary value is i, reading the inputs most significant
+    first (so inputs (1, 0) are index 2). The dict form is available through
+    `table` and accepted by the constructor for import/export.
+    """
     
     arity: int = Field(ge=0, description="Number of inputs (k)")
-    table: Dict[Tuple[int, ...], int] = Field(
-        default_factory=dict,
-        description="Mapping from input tuples to output bits"
-    )
-    
-    def __init__(self, arity: int = 0, table: Optional[Dict[Tuple[int, ...], int]] = None, **kwargs):
-        super().__init__(arity=arity, table=table or {}, **kwargs)
-        # Initialize all possible input combinations if table is empty
-        if not self.table and arity > 0:
-            self._initialize_table()
-    
-    def _initialize_table(self):
-        """Initialize lex with all possible input combinations."""
-        for i in range(2 ** self.arity):
-            inputs = tuple((i >> j) & 1 for j in range(self.arity - 1, -1, -1))
-            self.table[inputs] = 0
+    bits: int = Field(default=0, ge=0, description="Bit-packed truth table (bit i = output for input index i)")
+    
+    def __init__(self, arity: int = 0, table: Optional[Dict[Tuple[int, ...], int]] = None, bits: int = 0, **kwargs):
+        if table:
+            for inputs, output in table.items():
+                index = self.index_of_arity(inputs, arity)
+                bits = bits | (1 << index) if output else bits & ~(1 << index)
+        super().__init__(arity=arity, bits=bits & ((1 << (1 << arity)) - 1), **kwargs)
+    
+    @property
+    def size(self) -> int:
+        """Number of input combinations (2^arity)."""
+        return 1 << self.arity
+    
+    @property
+    def table(self) -> LexTable:
+        """Read-only mapping from input tuples to output bits (a live view of `bits`)."""
+        return LexTable(self)
+    
+    def index_of(self, inputs: Tuple[int, ...]) -> int:
+        """Convert an input tuple to its table index."""
+        return self.index_of_arity(inputs, self.arity)
+    
+    @staticmethod
+    def index_of_arity(inputs: Tuple[int, ...], arity: int) -> int:
+        """Convert an input tuple to its index in a table of the given arity."""
+        if len(inputs) != arity:
+            raise KeyError(inputs)
+        index = 0
+        for bit in inputs:
+            if bit != 0 and bit != 1:
+                raise KeyError(inputs)
+            index = (index << 1) | bit
+        return index
+    
+    def inputs_of(self, index: int) -> Tuple[int, ...]:
+        """Convert a table index to its input tuple."""
+        return tuple((index >> j) & 1 for j in range(self.arity - 1, -1, -1))
     
     def compute(self, inputs: Tuple[int, ...]) -> int:
         """Compute output for given inputs."""
         if len(inputs) != self.arity:
             raise ValueError(f"Expected {self.arity} inputs, got {len(inputs)}")
-        return self.table.get(inputs, 0)
+        index = 0
+        for bit in inputs:
+            index = (index << 1) | bit
+        return (self.bits >> index) & 1
+    
+    def compute_index(self, index: int) -> int:
+        """Compute output for the input combination with the given index."""
+        return (self.bits >> index) & 1
     
     def flip(self, inputs: Tuple[int, ...]) -> bool:
         """Flip the output for a given input combination. Returns True if successful."""
-        if inputs not in self.table:
+        try:
+            index = self.index_of(inputs)
+        except KeyError:
+            return False
+        return self.flip_index(index)
+    
+    def flip_index(self, index: int) -> bool:
+        """Flip the output for the input combination with the given index. Returns True if successful."""
+        if not 0 <= index < self.size:
             return False
-        self.table[inputs] = 1 - self.table[inputs]
+        self.bits ^= 1 << index
         return True
     
     def get_all_inputs(self) -> List[Tuple[int, ...]]:
         """Get all possible input combinations."""
         return list(self.table.keys())
+    
+    def extend_and(self, new_arity: int) -> 'Lex':
+        """
+        Widen the lex to new_arity inputs, ANDing the old output with every new input.
+        
+        The old function reads the first (most significant) inputs, so with d new
+        inputs old entry i moves to index (i << d) | (2^d - 1) and every other entry
+        is 0. Narrowing or widening from arity 0 yields an all-zero table.
+        """
+        if self.arity == 0 or new_arity < self.arity:
+            return Lex(arity=new_arity)
+        shift = new_arity - self.arity
+        ones = (1 << shift) - 1
+        old_bits = self.bits
+        new_bits = 0
+        while old_bits:
+            low = old_bits & -old_bits
+            new_bits |= 1 << (((low.bit_length() - 1) << shift) | ones)
+            old_bits ^= low
+        return Lex(arity=new_arity, bits=new_bits)
+    
+    def project(self, new_arity: int) -> 'Lex':
+        """
+        Project the lex onto new_arity inputs, keeping the first (most significant) inputs.
+        
+        When narrowing, the dropped inputs read as 0, so new entry i is old entry
+        i << d. When widening, the extra inputs are ignored, so new entry i is old
+        entry i >> d.
+        """
+        old_bits = self.bits
+        new_bits = 0
+        if new_arity <= self.arity:
+            shift = self.arity - new_arity
+            mask = (1 << shift) - 1
+            while old_bits:
+                low = old_bits & -old_bits
+                index = low.bit_length() - 1
+                if not index & mask:
+                    new_bits |= 1 << (index >> shift)
+                old_bits ^= low
+        else:
+            shift = new_arity - self.arity
+            block = (1 << (1 << shift)) - 1
+            while old_bits:
+                low = old_bits & -old_bits
+                new_bits |= block << ((low.bit_length() - 1) << shift)
+                old_bits ^= low
+        return Lex(arity=new_arity, bits=new_bits)
 
 
 class Node(BaseModel):
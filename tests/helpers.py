@@ -0,0 +1,58 @@
+"""Builders shared by the tests."""
+
+import random
+
+from src.lio import Lio
+from src.types import Node, NodeType, Lex
+
+
+# Largest Lex arity random_lio assigns (larger in-degrees leave the node without a Lex)
+MAX_ARITY = 4
+
+
+def assign_lexes(lio: Lio, rng: random.Random, skip_probability: float = 0.2):
+    """Give memory and computational nodes a random Lex matching their in-degree (through set_lex)."""
+    for node_id in list(lio.node_ids):
+        node = lio.nodes[node_id]
+        if node.node_type not in (NodeType.MEMORY, NodeType.COMPUTATIONAL):
+            continue
+        arity = len(lio.incoming_edges.get(node_id, []))
+        if node.node_type == NodeType.MEMORY and arity == 0:
+            arity = 1  # A memory node without inputs feeds back its own value
+        if arity > MAX_ARITY or rng.random() < skip_probability:
+            lio.set_lex(node_id, None)
+        else:
+            lio.set_lex(node_id, Lex(arity=arity, bits=rng.getrandbits(1 << arity)))
+
+
+def random_lio(seed: int, num_nodes: int, num_edges: int, self_loops: bool = True) -> Lio:
+    """
+    A Lio shaped like an evolved one, built only through the edit methods.
+    
+    Extra memory and computational nodes, random edges (cycles and, optionally,
+    self-loops included; none into the input node) and random Lexes. The same
+    seed always builds the same Lio.
+    """
+    rng = random.Random(seed)
+    lio = Lio(n=1)
+    while lio.get_size() < num_nodes:
+        node_type = rng.choice([NodeType.MEMORY, NodeType.COMPUTATIONAL])
+        lio.add_node(Node(node_id=lio.get_next_node_id(), node_type=node_type, value=rng.randint(0, 1)))
+    node_ids = list(lio.node_ids)
+    targets = [node_id for node_id in node_ids if node_id != lio.input_node_id]
+    attempts = 0
+    while len(lio.edges) < num_edges and attempts < 100 * num_edges:
+        attempts += 1
+        source_id, target_id = rng.choice(node_ids), rng.choice(targets)
+        if (source_id != target_id or self_loops) and not lio.has_edge(source_id, target_id):
+            lio.add_edge(source_id, target_id)
+    assign_lexes(lio, rng)
+    return lio
+
+
+def lineage_key(result):
+    """Everything a SimulationResult records per lineage, for comparing runs."""
+    return [(l.lineage_id, l.parent_id, l.birth_tick, l.death_tick, list(l.energy_history), list(l.accuracy_history),
+             list(l.predictions), list(l.actuals), list(l.rewards), list(l.size_history),
+             [str(m) for m in l.mutations_applied])
+            for l in sorted(result.lineages, key=lambda l: l.lineage_id)]
@@ -0,0 +1,133 @@
+"""ResultCache keys must cover everything a result depends on, and only deterministic configs are cached."""
+
+import pytest
+from pydantic import BaseModel
+
+from src.cache import ResultCache, config_hash
+from src.config import SimulationConfig, NeoConfig, NeoVerseConfig, NeoVerseType, LioConfig, EvoConfig
+from src.neoverse import RandomNeoVerse, write_tape
+from src.simulation import NeoCycle, create_neo_from_config
+from tests.helpers import lineage_key
+import simulations.configs  # noqa: F401 (registers the "minimal_lio" factory)
+
+
+def make_config(**update) -> SimulationConfig:
+    config = SimulationConfig(
+        name="cached",
+        neo=NeoConfig(n=1, memory=[0], energy=40),
+        neoverse=NeoVerseConfig(neoverse_type=NeoVerseType.RANDOM, seed=7),
+        lio=LioConfig(),
+        evo=EvoConfig(mutation_probability=0.2),
+        num_ticks=60,
+        enable_offspring=True,
+        neo_factory="minimal_lio",
+    )
+    return config.model_copy(update=update)
+
+
+def changed(config: SimulationConfig, path: str, value) -> SimulationConfig:
+    """A copy of config with the field at a dotted path set."""
+    head, _, rest = path.partition(".")
+    if rest:
+        value = getattr(config, head).model_copy(update={rest: value})
+    return config.model_copy(update={head: value})
+
+
+def run(config: SimulationConfig):
+    neo = create_neo_from_config(config, lio_factory=config.neo_factory)
+    return NeoCycle(neo, config.create_neoverse(), config.run_cost).run(config.num_ticks, config.enable_offspring)
+
+
+# A different value for every field a result depends on (every config field but the name)
+CHANGES = {
+    "neo.n": 2,
+    "neo.memory": [1],
+    "neo.energy": 41,
+    "neo.input_node_id": 5,
+    "neo.output_node_id": 6,
+    "neo.nodes": {},
+    "neo.edges": [],
+    "neoverse.neoverse_type": NeoVerseType.BLOCK,
+    "neoverse.seed": 8,
+    "neoverse.path": "tape.bin",
+    "lio.bit_add_cost": 3,
+    "lio.bit_remove_cost": 3,
+    "lio.edge_add_cost": 3,
+    "lio.edge_remove_cost": 3,
+    "lio.lex_flip_cost": 3,
+    "evo.mutation_probability": 0.3,
+    "evo.max_mutations_per_event": 3,
+    "evo.seed": 1,
+    "run_cost": 2,
+    "num_ticks": 61,
+    "enable_offspring": False,
+    "neo_factory": None,
+    "lio": None,
+    "evo": None,
+}
+
+
+def test_changes_cover_every_config_field():
+    paths = set()
+    for name, field in SimulationConfig.model_fields.items():
+        value = getattr(make_config(), name)
+        if isinstance(value, BaseModel):
+            paths.update(f"{name}.{sub}" for sub in type(value).model_fields)
+        if name != "name":
+            paths.add(name)
+    assert paths - {"neo", "neoverse"} == set(CHANGES)
+
+
+@pytest.mark.parametrize("path", sorted(CHANGES))
+def test_key_changes_with_every_field(path):
+    cache = ResultCache(salt="test")
+    config = make_config()
+    assert cache.key(changed(config, path, CHANGES[path])) != cache.key(config)
+
+
+def test_key_ignores_name_and_depends_on_salt():
+    config = make_config()
+    assert ResultCache(salt="a").key(config) == ResultCache(salt="a").key(config.model_copy(update={"name": "other"}))
+    assert ResultCache(salt="a").key(config) != ResultCache(salt="b").key(config)
+
+
+def test_key_depends_on_tape_contents(tmp_path):
+    path = str(tmp_path / "tape.bin")
+    config = make_config(neoverse=NeoVerseConfig(neoverse_type=NeoVerseType.FILE, path=path))
+    write_tape(RandomNeoVerse(seed=1), path, 100)
+    key = config_hash(config, "test")
+    write_tape(RandomNeoVerse(seed=2), path, 100)
+    assert config_hash(config, "test") != key
+
+
+@pytest.mark.parametrize("enable_offspring", [False, True])
+def test_store_load_round_trip(tmp_path, enable_offspring):
+    cache = ResultCache(str(tmp_path), salt="test")
+    config = make_config(enable_offspring=enable_offspring)
+    assert config not in cache and cache.load(config) is None
+    result = run(config)
+    assert cache.store(config, result)
+    assert config in cache
+    assert lineage_key(cache.load(config)) == lineage_key(result)
+    # Storing again keeps the entry; a renamed config hits it
+    assert cache.store(config, result)
+    assert lineage_key(cache.load(config.model_copy(update={"name": "renamed"}))) == lineage_key(result)
+    cache.clear()
+    assert config not in cache
+
+
+@pytest.mark.parametrize("update", [
+    # Unseeded random inputs
+    {"neoverse": NeoVerseConfig(neoverse_type=NeoVerseType.RANDOM)},
+    # Seedless Evo (neither its own seed nor the NeoVerse's)
+    {"neoverse": NeoVerseConfig(neoverse_type=NeoVerseType.ALTERNATING)},
+    # A factory that can't be named
+    {"neo_factory": lambda lio: lio},
+])
+def test_unseeded_configs_are_never_cached(tmp_path, update):
+    cache = ResultCache(str(tmp_path), salt="test")
+    config = make_config(**update)
+    assert cache.key(config) is None
+    assert not cache.store(config, run(config))
+    assert config not in cache and cache.load(config) is None
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,189 @@
+"""Chunked (run_chunk, record_chunk) and vectorized runs must give exactly the per-tick loop's results."""
+
+import itertools
+import random
+
+import pytest
+
+import src.simulation as simulation
+from src.compact import CompactLio
+from src.evo import Evo
+from src.neo import Neo
+from src.neoverse import RandomNeoVerse
+from src.resultlog import RunReader
+from src.simulation import NeoCycle, create_neo_from_config
+from src.sinks import ResultSink, InMemorySink, SummarySink, ChunkedDiskSink, NullSink
+from simulations.configs import get_example_simulation_configs
+from tests.helpers import random_lio, lineage_key
+
+
+@pytest.fixture
+def per_tick(monkeypatch):
+    """Call to disable the chunk path (every tick then takes the per-tick loop)."""
+    return lambda: monkeypatch.setattr(simulation, "MIN_CHUNK_TICKS", float("inf"))
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("energy", [40, 400, 100000])
+def test_compact_lio_without_evo(seed, energy, per_tick):
+    lio = random_lio(seed, num_nodes=12, num_edges=18)
+    chunked = NeoCycle(Neo(lio=CompactLio.from_lio(lio), energy=energy), RandomNeoVerse(seed=seed)).run(
+        500, enable_offspring=False)
+    per_tick()
+    reference = NeoCycle(Neo(lio=random_lio(seed, num_nodes=12, num_edges=18), energy=energy),
+                         RandomNeoVerse(seed=seed)).run(500, enable_offspring=False)
+    assert lineage_key(chunked) == lineage_key(reference)
+
+
+# Example configs x offspring mode x starting energy (early death, mid-run death, survival)
+# x mutation probability (short and long event-free stretches) x NeoVerse seed
+CASES = list(itertools.product(range(len(get_example_simulation_configs())), [False, True],
+                               [15, 60, 500], [None, 0.02], range(4)))
+
+
+def case_config(index, enable_offspring, energy, mutation_probability, seed):
+    config = get_example_simulation_configs()[index]
+    update = {
+        "enable_offspring": enable_offspring,
+        "num_ticks": 400,
+        "neo": config.neo.model_copy(update={"energy": energy}),
+        "neoverse": config.neoverse.model_copy(update={"seed": seed}),
+    }
+    if config.evo is not None and mutation_probability is not None:
+        update["evo"] = config.evo.model_copy(update={"mutation_probability": mutation_probability})
+    return config.model_copy(update=update)
+
+
+def run_config(config, sink, vectorized=False):
+    neo = create_neo_from_config(config, lio_factory=config.neo_factory)
+    result = NeoCycle(neo, config.create_neoverse(), config.run_cost).run(
+        config.num_ticks, config.enable_offspring, vectorized=vectorized, sink=sink)
+    return neo, result
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_chunked_loop_matches_per_tick_loop(case, per_tick):
+    config = case_config(*case)
+    outputs = []
+    for chunked in (True, False):
+        if not chunked:
+            per_tick()
+        neo, result = run_config(config, InMemorySink())
+        summary = SummarySink()
+        run_config(config, summary)
+        evo_state = (neo.evo.ticks_to_attempt, neo.evo.rng.getstate()) if neo.evo else None
+        outputs.append((lineage_key(result), summary.summary(), neo.energy, evo_state))
+    assert outputs[0] == outputs[1]
+
+
+def test_chunked_disk_sink_matches_per_tick(tmp_path, per_tick):
+    config = case_config(4, True, 60, 0.02, 1)
+    run_config(config, ChunkedDiskSink(str(tmp_path / "chunked"), chunk_rows=64))
+    per_tick()
+    run_config(config, ChunkedDiskSink(str(tmp_path / "per_tick"), chunk_rows=64))
+    assert (lineage_key(RunReader(str(tmp_path / "chunked")).result())
+            == lineage_key(RunReader(str(tmp_path / "per_tick")).result()))
+
+
+class BatchSink(ResultSink):
+    """Keeps every TickBatch (uses ResultSink's default record_chunk)."""
+    
+    def __init__(self):
+        self.rows = []
+    
+    def lineage_born(self, birth):
+        pass
+    
+    def record_ticks(self, batch):
+        self.rows.append((batch.tick, list(batch.lineage_ids), [int(v) for v in batch.predictions],
+                          [int(v) for v in batch.actuals], [int(v) for v in batch.rewards],
+                          [int(v) for v in batch.energy], [int(v) for v in batch.size]))
+    
+    def lineage_died(self, lineage_id, tick, energy):
+        self.rows.append(("died", lineage_id, tick, energy))
+
+
+@pytest.mark.parametrize("enable_offspring", [False, True])
+def test_default_record_chunk_replays_tick_batches(enable_offspring, per_tick):
+    config = case_config(3, enable_offspring, 60, 0.02, 2)
+    chunked = BatchSink()
+    run_config(config, chunked)
+    null_neo, _ = run_config(config, NullSink())
+    per_tick()
+    reference = BatchSink()
+    neo, _ = run_config(config, reference)
+    assert chunked.rows == reference.rows
+    assert null_neo.energy == neo.energy
+
+
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("energy", [0, 5, 37, 200])
+@pytest.mark.parametrize("run_cost", [1, 3])
+def test_run_chunk_stops_at_death_tick_in_energy_batches(seed, energy, run_cost, per_tick):
+    lio = random_lio(seed, num_nodes=6, num_edges=8)
+    neo = Neo(lio=lio, energy=energy)
+    cycle = NeoCycle(neo, RandomNeoVerse(seed=seed), run_cost=run_cost)
+    cost = run_cost * lio.get_size()
+    calls = []
+    compute_sequence = lio.compute_sequence
+    
+    def recording(inputs):
+        calls.append((len(inputs), neo.energy))
+        return compute_sequence(inputs)
+    
+    lio.compute_sequence = recording
+    k = 300
+    chunk = cycle.run_chunk(neo, 0, k)
+    
+    # Every batch is as long as the energy guarantees survival for (or the rest of the chunk)
+    done = 0
+    for length, energy_before in calls:
+        assert energy_before >= cost
+        assert length == min(k - done, energy_before // cost)
+        done += length
+    assert done == len(chunk)
+    
+    per_tick()
+    reference_neo = Neo(lio=random_lio(seed, num_nodes=6, num_edges=8), energy=energy)
+    result = NeoCycle(reference_neo, RandomNeoVerse(seed=seed), run_cost=run_cost).run(k, enable_offspring=False)
+    assert (len(chunk) if len(chunk) < k else None) == result.lineages[0].death_tick
+    assert chunk.predictions.tolist() == list(result.predictions)
+    assert chunk.actuals.tolist() == list(result.actuals)
+    assert chunk.rewards.tolist() == list(result.rewards)
+    assert chunk.energy.tolist() == list(result.energy_history)[1:len(chunk) + 1]
+    assert neo.energy == reference_neo.energy
+    # Nothing is evaluated past the death tick
+    neo.lio.sync_nodes()
+    reference_neo.lio.sync_nodes()
+    assert ([node.value for node in neo.lio.nodes.values()]
+            == [node.value for node in reference_neo.lio.nodes.values()])
+    assert neo.lio.memory == reference_neo.lio.memory
+
+
+def test_evo_skip_accounting():
+    evo = Evo(mutation_probability=0.05, seed=3)
+    reference = Evo(mutation_probability=0.05, seed=3)
+    for _ in range(50):
+        gap = evo.ticks_to_attempt
+        if gap:
+            evo.skip(gap)
+        assert evo.attempt_due()
+        for _ in range(gap):
+            assert not reference.attempt_due()
+        assert reference.attempt_due()
+        assert evo.ticks_to_attempt == reference.ticks_to_attempt
+    with pytest.raises(ValueError):
+        evo.skip(evo.ticks_to_attempt + 1)
+
+
+@pytest.mark.parametrize("case", list(itertools.product(range(len(get_example_simulation_configs())), [False, True],
+                                                        [15, 60, 500], [None, 0.02, 0.3], range(3))))
+def test_vectorized_run_matches_sequential_run(case):
+    config = case_config(*case)
+    outputs = []
+    for vectorized in (False, True):
+        neo, result = run_config(config, InMemorySink(), vectorized)
+        summary = SummarySink()
+        run_config(config, summary, vectorized)
+        outputs.append((lineage_key(result), summary.summary(), neo.energy))
+    assert outputs[0] == outputs[1]
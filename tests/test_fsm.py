@@ -0,0 +1,102 @@
+"""FSM, compiled and interpreted evaluation of a Lio must agree with plain interpretation."""
+
+import random
+
+import pytest
+
+from src.compiler import COMPILE_AFTER_TICKS
+from src.fsm import MAX_STATE_BITS, state_positions
+from src.lio import Lio
+from src.types import Lex
+from tests.helpers import random_lio
+
+
+def interpret_tick(lio: Lio, u_t: int) -> int:
+    """One tick through the plan interpreter only (never compiled, never in FSM mode)."""
+    lio.receive_input(u_t)
+    lio._interpret(lio._get_plan().nodes)
+    output = lio.get_output()
+    lio.update_memory()
+    return output
+
+
+def compute_tick(lio: Lio, u_t: int) -> int:
+    """One tick as NeoCycle runs it."""
+    lio.receive_input(u_t)
+    lio.compute()
+    output = lio.get_output()
+    lio.update_memory()
+    return output
+
+
+def edit(lio: Lio, rng: random.Random):
+    """Flip a Lex entry and add an edge (the same edit for the same rng state)."""
+    lex_nodes = lio.lex_node_ids
+    if lex_nodes:
+        node_id = rng.choice(lex_nodes)
+        lio.flip_lex(node_id, rng.randrange(lio.nodes[node_id].lex.size))
+    node_ids = lio.node_ids
+    source_id, target_id = rng.choice(node_ids), rng.choice(node_ids[1:])
+    if not lio.has_edge(source_id, target_id):
+        lio.add_edge(source_id, target_id)
+
+
+def node_state(lio: Lio):
+    lio.sync_nodes()
+    return {node_id: node.value for node_id, node in lio.nodes.items()}, list(lio.memory)
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("num_nodes, num_edges, fsm", [(5, 6, True), (7, 9, True), (24, 40, False)])
+def test_compute_matches_interpreter(seed, num_nodes, num_edges, fsm):
+    lio = random_lio(seed, num_nodes, num_edges)
+    reference = random_lio(seed, num_nodes, num_edges)
+    small = len(state_positions(lio._get_plan())) <= MAX_STATE_BITS
+    if small != fsm:
+        pytest.skip("random structure doesn't have the state size this case is about")
+    rng = random.Random(seed)
+    inputs = [rng.randint(0, 1) for _ in range(4 * COMPILE_AFTER_TICKS)]
+    
+    for run in range(2):
+        for t, u_t in enumerate(inputs):
+            assert compute_tick(lio, u_t) == interpret_tick(reference, u_t), (run, t)
+            if t == COMPILE_AFTER_TICKS + 2:
+                # Past the interpreted ticks: FSM mode for small Lios, a compiled step otherwise
+                assert (lio._fsm_state is not None) == fsm
+                assert lio._step != lio._interpret_then_compile
+            if t == len(inputs) // 2:
+                # Sync mid-run, as the mutation step does, and compare node values
+                assert node_state(lio) == node_state(reference)
+        assert node_state(lio) == node_state(reference)
+        # An edit mid-run drops the FSM/compiled step; the next run goes through all modes again
+        edit(lio, random.Random(seed + run))
+        edit(reference, random.Random(seed + run))
+        assert lio._fsm_state is None and lio._step is None
+
+
+def test_lex_table_is_read_only_and_set_lex_drops_fsm_mode():
+    lio = random_lio(1, 8, 12)
+    reference = random_lio(1, 8, 12)
+    rng = random.Random(1)
+    for _ in range(300):
+        u_t = rng.randint(0, 1)
+        compute_tick(lio, u_t)
+        interpret_tick(reference, u_t)
+    assert lio._fsm_state is not None
+    
+    node_id = lio.lex_node_ids[0]
+    lex = lio.nodes[node_id].lex
+    bits = lex.bits
+    with pytest.raises(TypeError):
+        lex.table[lex.inputs_of(0)] = 1 - lex.table[lex.inputs_of(0)]
+    assert lex.bits == bits
+    
+    # Editing through set_lex rebuilds the plan, so the FSM sees the new table
+    flipped = Lex(arity=lex.arity, table={inputs: 1 - output for inputs, output in lex.table.items()})
+    lio.set_lex(node_id, flipped)
+    reference.set_lex(node_id, flipped.model_copy())
+    for t in range(300):
+        u_t = rng.randint(0, 1)
+        assert compute_tick(lio, u_t) == interpret_tick(reference, u_t), t
+    assert lio._fsm_state is not None
+    assert node_state(lio) == node_state(reference)
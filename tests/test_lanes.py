@@ -0,0 +1,43 @@
+"""Bit-parallel lanes (run_lanes, Lio.compute_lanes) must match running each stream through NeoCycle."""
+
+import numpy as np
+import pytest
+
+from src.lanes import pack_lanes, unpack_lanes, sample_inputs, run_lanes
+from src.neo import Neo
+from src.neoverse import RandomNeoVerse
+from src.simulation import NeoCycle
+from tests.helpers import random_lio
+
+
+@pytest.mark.parametrize("num_lanes", [1, 5, 64, 65, 70, 130])
+def test_pack_unpack_round_trip(num_lanes):
+    bits = np.random.default_rng(num_lanes).integers(0, 2, size=(num_lanes, 9), dtype=np.int8)
+    words = pack_lanes(bits)
+    # Python ints up to 64 lanes, uint64 arrays above
+    assert all(isinstance(word, int) for word in words) == (num_lanes <= 64)
+    assert np.array_equal(unpack_lanes(words, num_lanes), bits)
+
+
+@pytest.mark.parametrize("num_lanes", [5, 70])
+@pytest.mark.parametrize("seed, energy", [(0, 40), (1, 150), (2, 100000), (3, 15), (4, 1000)])
+def test_lanes_match_neocycle(num_lanes, seed, energy):
+    num_ticks, run_cost = 300, 1
+    lio = random_lio(seed, num_nodes=7, num_edges=10)
+    seeds = list(range(100 * seed, 100 * seed + num_lanes))
+    inputs, actuals = sample_inputs(lambda s: RandomNeoVerse(seed=s), seeds, num_ticks)
+    lanes = run_lanes(lio, inputs, actuals, energy, run_cost)
+    
+    for lane, lane_seed in enumerate(seeds):
+        neo = Neo(lio=random_lio(seed, num_nodes=7, num_edges=10), energy=energy)
+        result = NeoCycle(neo, RandomNeoVerse(seed=lane_seed), run_cost).run(num_ticks, enable_offspring=False)
+        lineage = result.lineages[0]
+        death_tick = lineage.death_tick if lineage.death_tick is not None else -1
+        lived = len(lineage.predictions)
+        assert lanes.death_tick[lane] == death_tick
+        assert lanes.predictions[lane, :lived].tolist() == list(lineage.predictions)
+        assert lanes.actuals[lane, :lived].tolist() == list(lineage.actuals)
+        assert lanes.rewards[lane, :lived].tolist() == list(lineage.rewards)
+        assert not lanes.rewards[lane, lived:].any()
+        assert lanes.energy_history[lane, :lived + 1].tolist() == list(lineage.energy_history)[:lived + 1]
+        assert lanes.energy_history[lane, -1] == neo.energy
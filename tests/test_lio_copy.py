@@ -0,0 +1,106 @@
+"""Lio.copy shares structure copy-on-write: edits to either Lio must never show through the other."""
+
+from typing import Any, Callable, Dict
+
+import pytest
+
+from src.lio import Lio
+from src.types import Node, NodeType, Lex
+from tests.helpers import random_lio
+
+
+def structure(lio: Lio) -> Dict[str, Any]:
+    """Everything the edit methods may change, as plain values."""
+    lio.sync_nodes()
+    return {
+        "edges": [(edge.source_id, edge.target_id) for edge in lio.edges],
+        "incoming": {node_id: list(sources) for node_id, sources in lio.incoming_edges.items() if sources},
+        "outgoing": {node_id: list(targets) for node_id, targets in lio.outgoing_edges.items() if targets},
+        "edge_set": set(lio._edge_set),
+        "rank": dict(lio._rank),
+        "rank_valid": lio._rank_valid,
+        "node_ids": list(lio.node_ids),
+        "memory_node_ids": list(lio.memory_node_ids),
+        "lex_node_ids": list(lio.lex_node_ids),
+        "next_node_id": lio.get_next_node_id(),
+        "lexes": {node_id: (node.lex.arity, node.lex.bits) if node.lex is not None else None
+                  for node_id, node in lio.nodes.items()},
+        "values": {node_id: node.value for node_id, node in lio.nodes.items()},
+        "memory": list(lio.memory),
+    }
+
+
+def computational(lio: Lio) -> int:
+    return next(node_id for node_id in lio.node_ids if lio.nodes[node_id].node_type == NodeType.COMPUTATIONAL)
+
+
+def lex_node(lio: Lio) -> int:
+    return lio.lex_node_ids[0]
+
+
+def new_edge(lio: Lio):
+    return next((s, t) for s in lio.node_ids for t in lio.node_ids if not lio.has_edge(s, t))
+
+
+EDITS: Dict[str, Callable[[Lio], None]] = {
+    "add_node": lambda lio: lio.add_node(Node(node_id=lio.get_next_node_id(), node_type=NodeType.MEMORY, value=1)),
+    "remove_node": lambda lio: lio.remove_node(computational(lio)),
+    "add_edge": lambda lio: lio.add_edge(*new_edge(lio)),
+    "add_self_loop": lambda lio: lio.add_edge(*next((n, n) for n in lio.node_ids if not lio.has_edge(n, n))),
+    "remove_edge": lambda lio: lio.remove_edge(lio.edges[0].source_id, lio.edges[0].target_id),
+    "set_lex": lambda lio: lio.set_lex(lex_node(lio), Lex(arity=2, bits=0b0110)),
+    "clear_lex": lambda lio: lio.set_lex(lex_node(lio), None),
+    "add_lex": lambda lio: lio.set_lex(next(n for n in lio.node_ids if lio.nodes[n].lex is None
+                                            and lio.nodes[n].node_type == NodeType.COMPUTATIONAL), Lex(arity=1, bits=1)),
+    "flip_lex": lambda lio: lio.flip_lex(lex_node(lio), 0),
+}
+
+
+def build(seed: int, run_ticks: int) -> Lio:
+    lio = random_lio(seed, num_nodes=10, num_edges=14)
+    lio.add_node(Node(node_id=lio.get_next_node_id(), node_type=NodeType.COMPUTATIONAL))  # Without a Lex
+    for t in range(run_ticks):
+        # A built plan (and FSM state) is re-bound by copy() rather than rebuilt
+        lio.receive_input(t % 2)
+        lio.compute()
+        lio.update_memory()
+    return lio
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("run_ticks", [0, 40])
+@pytest.mark.parametrize("edit", list(EDITS))
+@pytest.mark.parametrize("edited", ["copy", "original"])
+def test_edits_do_not_leak_between_copies(seed, run_ticks, edit, edited):
+    original = build(seed, run_ticks)
+    copied = original.copy()
+    assert structure(copied) == structure(original)
+    
+    target, other = (copied, original) if edited == "copy" else (original, copied)
+    before = structure(other)
+    EDITS[edit](target)
+    assert structure(target) != before, "the edit should change the edited Lio"
+    assert structure(other) == before
+    
+    # Running both afterwards must not disturb the unedited one either
+    for t in range(5):
+        for lio in (target, other):
+            lio.receive_input(t % 2)
+            lio.compute()
+            lio.update_memory()
+    expected = build(seed, run_ticks)
+    for t in range(5):
+        expected.receive_input(t % 2)
+        expected.compute()
+        expected.update_memory()
+    assert structure(other) == structure(expected)
+
+
+def test_chained_copies_stay_independent():
+    lio = build(0, 0)
+    first = lio.copy()
+    second = first.copy()
+    first.add_edge(*new_edge(first))
+    second.remove_node(computational(second))
+    assert structure(lio) == structure(build(0, 0))
+    assert structure(first) != structure(second)
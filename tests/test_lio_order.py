@@ -0,0 +1,130 @@
+"""The incrementally maintained adjacency and topological ranks of a Lio must match a rebuild from scratch."""
+
+import random
+from typing import Dict, List
+
+import pytest
+
+from src.lio import Lio
+from src.types import Node, NodeType
+from tests.helpers import assign_lexes, random_lio
+
+
+def is_acyclic(lio: Lio) -> bool:
+    """Kahn's algorithm over the edges, ignoring self-loops."""
+    indegree = {node_id: 0 for node_id in lio.nodes}
+    outgoing: Dict[int, List[int]] = {node_id: [] for node_id in lio.nodes}
+    for source_id, target_id in {(e.source_id, e.target_id) for e in lio.edges}:
+        if source_id != target_id:
+            indegree[target_id] += 1
+            outgoing[source_id].append(target_id)
+    ready = [node_id for node_id, degree in indegree.items() if degree == 0]
+    seen = 0
+    while ready:
+        node_id = ready.pop()
+        seen += 1
+        for target_id in outgoing[node_id]:
+            indegree[target_id] -= 1
+            if indegree[target_id] == 0:
+                ready.append(target_id)
+    return seen == len(lio.nodes)
+
+
+def check_ranks(lio: Lio):
+    """While the ranks are marked valid they must order every non-self-loop edge."""
+    if not lio._rank_valid:
+        return
+    rank = lio._rank
+    assert set(rank) == set(lio.nodes)
+    assert len(set(rank.values())) == len(rank)
+    for edge in lio.edges:
+        if edge.source_id != edge.target_id:
+            assert rank[edge.source_id] < rank[edge.target_id], edge
+
+
+def rebuilt(lio: Lio) -> Lio:
+    """A fresh Lio with the same nodes and edges (adjacency and order built by _build_adjacency)."""
+    lio.sync_nodes()
+    return Lio(
+        n=lio.n,
+        memory=list(lio.memory),
+        nodes={node_id: node.model_copy(deep=True) for node_id, node in lio.nodes.items()},
+        edges=list(lio.edges),
+        input_node_id=lio.input_node_id,
+        output_node_id=lio.output_node_id,
+    )
+
+
+def random_edit(lio: Lio, rng: random.Random):
+    """Apply one random edit: add/remove a node, add an edge (self-loops and cycles included) or remove one."""
+    node_ids = list(lio.node_ids)
+    removable = [node_id for node_id in node_ids if node_id not in (lio.input_node_id, lio.output_node_id)]
+    choice = rng.random()
+    if choice < 0.15:
+        node_type = rng.choice([NodeType.MEMORY, NodeType.COMPUTATIONAL])
+        lio.add_node(Node(node_id=lio.get_next_node_id(), node_type=node_type, value=rng.randint(0, 1)))
+    elif choice < 0.25 and removable:
+        lio.remove_node(rng.choice(removable))
+    elif choice < 0.7:
+        source_id = rng.choice(node_ids)
+        target_id = source_id if rng.random() < 0.1 else rng.choice(node_ids)
+        if not lio.has_edge(source_id, target_id):
+            lio.add_edge(source_id, target_id)
+    elif lio.edges:
+        edge = rng.choice(lio.edges)
+        lio.remove_edge(edge.source_id, edge.target_id)
+    if rng.random() < 0.2:
+        assign_lexes(lio, rng)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_random_edits_keep_order_and_indexes(seed):
+    rng = random.Random(seed)
+    lio = random_lio(seed, num_nodes=rng.randint(4, 12), num_edges=rng.randint(3, 16), self_loops=False)
+    for step in range(60):
+        random_edit(lio, rng)
+        check_ranks(lio)
+        acyclic = is_acyclic(lio)
+        # Building the plan re-ranks from scratch when the ranks were invalidated by a cycle
+        lio._get_plan()
+        assert lio._rank_valid == acyclic
+        check_ranks(lio)
+        
+        fresh = rebuilt(lio)
+        assert {k: v for k, v in lio.incoming_edges.items() if v} == {k: v for k, v in fresh.incoming_edges.items() if v}
+        assert {k: v for k, v in lio.outgoing_edges.items() if v} == {k: v for k, v in fresh.outgoing_edges.items() if v}
+        assert lio._edge_set == fresh._edge_set
+        assert lio.node_ids == fresh.node_ids
+        assert lio.memory_node_ids == fresh.memory_node_ids
+        assert lio.lex_node_ids == fresh.lex_node_ids
+        assert lio.get_next_node_id() == fresh.get_next_node_id()
+        
+        if step % 5 == 0:
+            for _ in range(3):
+                u_t = rng.randint(0, 1)
+                for l in (lio, fresh):
+                    l.receive_input(u_t)
+                    l.compute()
+                assert lio.get_output() == fresh.get_output()
+                lio.sync_nodes()
+                assert [node.value for node in lio.nodes.values()] == [node.value for node in fresh.nodes.values()]
+
+
+def test_self_loop_keeps_ranks_valid():
+    lio = Lio(n=1)
+    assert lio._rank_valid
+    lio.add_edge(3, 3)
+    assert lio._rank_valid
+    check_ranks(lio)
+
+
+def test_cycle_invalidates_and_removal_restores_ranks():
+    lio = Lio(n=1)
+    lio.add_edge(1, 3)  # output -> computational closes 3 -> 1 -> 3
+    assert not lio._rank_valid
+    lio._get_plan()
+    assert not lio._rank_valid
+    lio.remove_edge(1, 3)
+    lio._get_plan()
+    assert lio._rank_valid
+    check_ranks(lio)
@@ -0,0 +1,123 @@
+"""t quantiles against table values, and ReplicateScheduler's stopping and budget rules."""
+
+import math
+
+import numpy as np
+import pytest
+
+from src.config import SimulationConfig, NeoConfig, NeoVerseConfig, NeoVerseType
+from src.replicates import ReplicateScheduler, t_cdf, t_quantile, half_width
+from src.sweep import Sweep
+
+
+# Two-sided t-table critical values: (p, df) -> t
+T_TABLE = {
+    (0.975, 1): 12.706, (0.975, 2): 4.303, (0.975, 3): 3.182, (0.975, 4): 2.776, (0.975, 5): 2.571,
+    (0.975, 10): 2.228, (0.975, 20): 2.086, (0.975, 30): 2.042, (0.975, 120): 1.980,
+    (0.95, 3): 2.353, (0.95, 10): 1.812, (0.9, 3): 1.638, (0.9, 10): 1.372,
+    (0.995, 3): 5.841, (0.995, 5): 4.032, (0.995, 10): 3.169, (0.9995, 3): 12.924,
+}
+
+
+@pytest.mark.parametrize("p, df", sorted(T_TABLE))
+def test_t_quantile_matches_table(p, df):
+    assert t_quantile(p, df) == pytest.approx(T_TABLE[p, df], abs=5e-4)
+    assert t_quantile(1 - p, df) == pytest.approx(-T_TABLE[p, df], abs=5e-4)
+
+
+@pytest.mark.parametrize("df", [1, 2, 3, 4, 7, 8, 63])
+def test_t_cdf_inverts_t_quantile(df):
+    assert t_cdf(0.0, df) == 0.5
+    for p in (0.6, 0.9, 0.975, 0.99999):
+        assert t_cdf(t_quantile(p, df), df) == pytest.approx(p, abs=1e-12)
+
+
+def test_half_width():
+    assert half_width([]) == half_width([1.0]) == math.inf
+    assert half_width([2.0, 2.0, 2.0]) == 0.0
+    values = [1.0, 2.0, 4.0, 7.0]
+    assert half_width(values) == pytest.approx(3.182446 * np.std(values, ddof=1) / 2, rel=1e-6)
+
+
+def make_sweep() -> Sweep:
+    base = SimulationConfig(name="base", neo=NeoConfig(n=1, memory=[0], energy=30),
+                            neoverse=NeoVerseConfig(neoverse_type=NeoVerseType.RANDOM, seed=0), num_ticks=20)
+    return Sweep(base, {"neo.energy": [10, 20, 30]})
+
+
+def record_round(scheduler, pairs, spread):
+    """Record a synthetic final_accuracy per pair: point p's replicates alternate around 0.5 by spread[p]."""
+    for point, replicate in pairs:
+        sign = 1 if replicate % 2 else -1
+        scheduler.record(point, {"final_accuracy": 0.5 + sign * spread[point]})
+
+
+def test_points_stop_when_precise_enough():
+    scheduler = ReplicateScheduler(make_sweep(), {"final_accuracy": 0.1}, min_replicates=4, batch=2, max_replicates=8)
+    pairs = scheduler.next_round()
+    assert pairs == [(point, r) for point in range(3) for r in range(4)]
+    # Point 0 is exact, point 1 is within tolerance at 6 replicates, point 2 never is
+    record_round(scheduler, pairs, [0.0, 0.06, 0.4])
+    assert scheduler.done(0) and not scheduler.done(1) and not scheduler.done(2)
+    assert scheduler.noise(0) == 0.0
+    # Noisiest first, batch replicates each
+    pairs = scheduler.next_round()
+    assert pairs == [(2, 4), (2, 5), (1, 4), (1, 5)]
+    record_round(scheduler, pairs, [0.0, 0.06, 0.4])
+    assert scheduler.done(1) and not scheduler.done(2)
+    pairs = scheduler.next_round()
+    assert pairs == [(2, 6), (2, 7)]
+    record_round(scheduler, pairs, [0.0, 0.06, 0.4])
+    # max_replicates ends point 2
+    assert scheduler.done(2) and scheduler.noise(2) > 1
+    assert scheduler.next_round() == []
+    assert scheduler.runs == [4, 6, 8] and scheduler.used == 18
+    
+    table = scheduler.table()
+    assert table["neo.energy"].tolist() == [10, 20, 30]
+    assert table["n"].tolist() == [4, 6, 8]
+    assert table["done"].all()
+    assert table["final_accuracy_mean"].tolist() == pytest.approx([0.5, 0.5, 0.5])
+    assert table["final_accuracy_ci"][0] == 0.0
+
+
+def test_budget_goes_to_the_noisiest_points():
+    scheduler = ReplicateScheduler(make_sweep(), {"final_accuracy": 0.01}, min_replicates=2, batch=3, budget=10)
+    pairs = scheduler.next_round()
+    assert len(pairs) == 6
+    record_round(scheduler, pairs, [0.1, 0.3, 0.2])
+    # 4 runs left: the noisiest point gets a full batch, the next one the rest
+    assert scheduler.next_round() == [(1, 2), (1, 3), (1, 4), (2, 2)]
+    record_round(scheduler, [(1, 2), (1, 3), (1, 4), (2, 2)], [0.1, 0.3, 0.2])
+    assert scheduler.used == 10
+    assert scheduler.next_round() == []
+    assert not any(scheduler.done(point) for point in range(3))
+
+
+def test_failed_replicates_count_as_runs():
+    scheduler = ReplicateScheduler(make_sweep(), {"final_accuracy": 0.1}, min_replicates=2, max_replicates=3)
+    for point in range(3):
+        scheduler.record(point, None)
+        scheduler.record(point, None)
+    assert scheduler.runs == [2, 2, 2]
+    assert scheduler.half_widths(0) == {"final_accuracy": math.inf}
+    assert scheduler.next_round() == [(point, 2) for point in range(3)]
+
+
+def test_replicate_configs_use_consecutive_seeds():
+    scheduler = ReplicateScheduler(make_sweep(), {"final_accuracy": 0.1}, first_seed=100)
+    config = scheduler.config(2, 5)
+    assert (config.neo.energy, config.neoverse.seed) == (30, 105)
+    assert config.name.endswith("#5")
+
+
+@pytest.mark.parametrize("tolerances, settings", [
+    ({"bogus": 1.0}, {}),
+    ({"final_accuracy": 0.1}, {"min_replicates": 1}),
+    ({"final_accuracy": 0.1}, {"min_replicates": 8, "max_replicates": 4}),
+    ({"final_accuracy": 0.1}, {"batch": 0}),
+    ({"final_accuracy": 0.1}, {"seed_path": "neo.energy"}),
+])
+def test_invalid_settings_are_rejected(tolerances, settings):
+    with pytest.raises(ValueError):
+        ReplicateScheduler(make_sweep(), tolerances, **settings)
@@ -0,0 +1,93 @@
+"""Sweep designs expand a base config as documented, and aggregate collapses summary tables over replicates."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from src.config import SimulationConfig, NeoConfig, NeoVerseConfig, NeoVerseType, EvoConfig
+from src.sweep import Sweep, Range, SUMMARY_COLUMNS, summary_table, run_sweep, aggregate
+
+
+def make_base() -> SimulationConfig:
+    return SimulationConfig(
+        name="base",
+        neo=NeoConfig(n=1, memory=[0], energy=30),
+        neoverse=NeoVerseConfig(neoverse_type=NeoVerseType.RANDOM, seed=0),
+        evo=EvoConfig(mutation_probability=0.2),
+        num_ticks=40,
+    )
+
+
+def test_grid_order_and_length():
+    axes = {"neo.energy": [10, 20, 30], "evo.mutation_probability": [0.1, 0.5], "run_cost": [1, 2]}
+    sweep = Sweep(make_base(), axes)
+    points = list(sweep.points())
+    assert len(sweep) == len(points) == 12
+    # itertools.product order: the last axis varies fastest
+    assert [tuple(point.values()) for point in points] == list(itertools.product(*axes.values()))
+    configs = list(sweep.configs())
+    values = [(c.neo.energy, c.evo.mutation_probability, c.run_cost) for c in configs]
+    assert values == list(itertools.product(*axes.values()))
+    assert len({c.name for c in configs}) == 12
+    # Untouched fields come from the base
+    assert all(c.num_ticks == 40 and c.neo.n == 1 for c in configs)
+
+
+def test_grid_rejects_range():
+    with pytest.raises(ValueError):
+        Sweep(make_base(), {"neo.energy": Range(10, 100)})
+
+
+@pytest.mark.parametrize("axes", [{"neo.bogus": [1]}, {"neo.energy": []}, {"neo.energy": ["many"]}])
+def test_invalid_axes_are_rejected(axes):
+    with pytest.raises(ValueError):
+        Sweep(make_base(), axes)
+
+
+@pytest.mark.parametrize("num_points", [1, 7, 50])
+def test_lhs_uses_each_stratum_once_per_axis(num_points):
+    sweep = Sweep(make_base(), {"evo.mutation_probability": Range(0.0, 1.0), "run_cost": Range(0, num_points - 1),
+                                "neo.energy": Range(0, 10 * num_points)},
+                  design="lhs", num_points=num_points, seed=3)
+    points = list(sweep.points())
+    assert len(points) == num_points
+    assert sorted(int(p["evo.mutation_probability"] * num_points) for p in points) == list(range(num_points))
+    # An integer range with one value per stratum hits every value
+    assert sorted(p["run_cost"] for p in points) == list(range(num_points))
+    assert sorted(p["neo.energy"] // 10 for p in points) == list(range(num_points))
+
+
+@pytest.mark.parametrize("design", ["random", "lhs"])
+def test_points_are_reproducible_from_the_seed(design):
+    axes = {"evo.mutation_probability": Range(0.01, 1.0, log=True), "neo.energy": [10, 20, 30]}
+    points = [list(Sweep(make_base(), axes, design=design, num_points=20, seed=seed).points()) for seed in (1, 1, 2)]
+    assert points[0] == points[1]
+    assert points[0] != points[2]
+    for point in points[0]:
+        assert 0.01 <= point["evo.mutation_probability"] <= 1.0
+        assert point["neo.energy"] in (10, 20, 30)
+
+
+def test_run_sweep_is_reproducible():
+    sweep = Sweep(make_base(), {"neo.energy": [20, 60], "neoverse.seed": [0, 1]})
+    tables = [run_sweep(sweep, workers=workers, seed=5) for workers in (1, 1, 2)]
+    assert tables[0].tobytes() == tables[1].tobytes() == tables[2].tobytes()
+    assert tables[0]["ok"].all()
+    assert tables[0]["neo.energy"].tolist() == [20, 20, 60, 60]
+
+
+def test_aggregate_columns():
+    points = [{"neo.energy": energy, "neoverse.seed": seed} for energy in (10, 20) for seed in range(3)]
+    summaries = [{name: 10 * i + j for j, name in enumerate(SUMMARY_COLUMNS)} for i in range(len(points))]
+    summaries[5] = None  # A failed point is left out of its group
+    table = aggregate(summary_table(points, summaries))
+    assert table.dtype.names == (("neo.energy", "n")
+                                 + tuple(f"{name}_{stat}" for name in SUMMARY_COLUMNS for stat in ("mean", "std")))
+    assert table["neo.energy"].tolist() == [10, 20]
+    assert table["n"].tolist() == [3, 2]
+    for j, name in enumerate(SUMMARY_COLUMNS):
+        assert table[f"{name}_mean"].tolist() == pytest.approx([10 + j, 35 + j])
+        assert table[f"{name}_std"].tolist() == pytest.approx([np.std([0, 10, 20], ddof=1), np.std([30, 40], ddof=1)])
+    # Aggregating over every axis leaves one group
+    assert aggregate(summary_table(points, summaries), over=("neo.energy", "neoverse.seed"))["n"].tolist() == [5]
@@ -0,0 +1,28 @@
+"""A recorded tape must serve a run of the length it was recorded for, and a short one must fail up front."""
+
+import pytest
+
+from src.config import SimulationConfig, NeoConfig, NeoVerseConfig, NeoVerseType
+from src.neoverse import RandomNeoVerse, FileNeoVerse, write_tape
+from src.simulation import run_simulation
+
+
+def file_config(path, num_ticks: int) -> SimulationConfig:
+    return SimulationConfig(name="tape", neo=NeoConfig(n=1, memory=[0], energy=10 * num_ticks),
+                            neoverse=NeoVerseConfig(neoverse_type=NeoVerseType.FILE, path=str(path)),
+                            num_ticks=num_ticks)
+
+
+def test_run_reads_one_input_past_the_last_tick(tmp_path):
+    path = tmp_path / "random.tape"
+    write_tape(RandomNeoVerse(seed=1), str(path), 101)
+    result = run_simulation(file_config(path, 100))
+    assert len(result.predictions) == 100
+    assert list(result.actuals) == FileNeoVerse(str(path)).get_inputs(1, 101).tolist()
+
+
+def test_short_tape_fails_before_the_run(tmp_path):
+    path = tmp_path / "short.tape"
+    write_tape(RandomNeoVerse(seed=1), str(path), 100)
+    with pytest.raises(ValueError, match="needs 101"):
+        run_simulation(file_config(path, 100))
@@ -1,15 +1,13 @@
 #!/usr/bin/env python3
 """Quick script to view lineage information from simulation results."""
 
-import json
 import glob
 import os
-from src.simulation import SimulationResult, NeoLineage
-from simulations.run import print_lineage_tree, print_lineage_summary
+from simulations.run import print_lineage_tree, print_lineage_summary, load_results_from_log
 
 def load_latest_results():
-    """Load the most recent simulation results."""
-    log_files = glob.glob("logs/*_results.json")
+    """Load the most recent simulation results (binary logs, or JSON logs from older versions)."""
+    log_files = glob.glob("logs/*_results.neolog") + glob.glob("logs/*_results.json")
     if not log_files:
         print("No log files found in logs/ directory")
         print("Run 'python -m simulations.run' first to generate results")
@@ -18,42 +16,10 @@ def load_latest_results():
     latest = max(log_files, key=os.path.getmtime)
     print(f"Loading results from: {latest}\n")
     
-    with open(latest, 'r') as f:
-        log_data = json.load(f)
-    
-    # Reconstruct results with lineages
-    results = {}
-    for name, data in log_data["results"].items():
-        result_data = data["result"]
-        lineages = []
-        if "lineages" in result_data:
-            for lin_data in result_data["lineages"]:
-                lineages.append(NeoLineage(
-                    lineage_id=lin_data["lineage_id"],
-                    parent_id=lin_data["parent_id"],
-                    birth_tick=lin_data["birth_tick"],
-                    death_tick=lin_data["death_tick"],
-                    energy_history=lin_data["energy_history"],
-                    accuracy_history=lin_data["accuracy_history"],
-                    predictions=lin_data["predictions"],
-                    actuals=lin_data["actuals"],
-                    rewards=lin_data["rewards"],
-                    size_history=lin_data["size_history"],
-                    mutations_applied=lin_data["mutations_applied"]
-                ))
-        
-        results[name] = SimulationResult(
-            energy_history=result_data["energy_history"],
-            accuracy_history=result_data["accuracy_history"],
-            predictions=result_data["predictions"],
-            actuals=result_data["actuals"],
-            rewards=result_data["rewards"],
-            size_history=result_data["size_history"],
-            mutations_applied=result_data["mutations_applied"],
-            lineages=lineages
-        )
-    
-    return results, log_data
+    # Lineage trees and stats only need lineage lengths and mutations
+    if os.path.isdir(latest):
+        return load_results_from_log(latest, fields=["accuracy_history", "predictions", "mutations_applied"])
+    return load_results_from_log(latest)
 
 
 def main():